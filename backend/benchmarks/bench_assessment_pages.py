@@ -0,0 +1,129 @@
+"""
+Per-page latency of /admin/assessments: keyset cursor vs SKIP/LIMIT
+
+Seeds a disposable Neo4j database with synthetic submissions (marked
+`bench: true`), applies the schema migrations, then walks every page with
+the cursor API and times sampled pages against the equivalent SKIP query.
+Keyset pages should stay flat; SKIP pages grow with depth.
+
+Usage:
+    python benchmarks/bench_assessment_pages.py --submissions 1000000 --page-size 100 --yes
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.assessment_service import assessment_service
+from services.neo4j_service import neo4j_service
+from services.schema_service import schema_service
+
+BATCH_SIZE = 10000
+
+SEED_QUERY = """
+UNWIND $rows AS row
+CREATE (:AssessmentSubmission {
+    submission_id: row.submission_id,
+    timestamp: datetime(row.timestamp),
+    overall_score: row.overall_score,
+    stress_level: row.stress_level,
+    recommendation: '',
+    bench: true
+})
+"""
+
+SKIP_QUERY = """
+MATCH (a:AssessmentSubmission)
+RETURN a.submission_id as submission_id,
+       toString(a.timestamp) as timestamp,
+       a.overall_score as overall_score,
+       a.stress_level as stress_level,
+       a.recommendation as recommendation
+ORDER BY a.timestamp DESC
+SKIP $skip
+LIMIT $limit
+"""
+
+async def seed(submissions: int):
+    now = datetime.utcnow()
+    levels = ["Low", "Moderate", "High"]
+    for offset in range(0, submissions, BATCH_SIZE):
+        rows = [
+            {
+                "submission_id": str(uuid.uuid4()),
+                "timestamp": (now - timedelta(seconds=random.randint(0, 3 * 365 * 24 * 3600))).isoformat(),
+                "overall_score": round(random.uniform(1, 5), 2),
+                "stress_level": random.choice(levels)
+            }
+            for _ in range(min(BATCH_SIZE, submissions - offset))
+        ]
+        await neo4j_service.execute_write(SEED_QUERY, {"rows": rows})
+
+async def cleanup():
+    while True:
+        result = await neo4j_service.execute_write("""
+        MATCH (a:AssessmentSubmission {bench: true})
+        WITH a LIMIT 10000
+        DETACH DELETE a
+        RETURN count(*) as deleted
+        """)
+        if not result or result["deleted"] == 0:
+            break
+
+async def run(submissions: int, page_size: int, samples: int):
+    try:
+        await schema_service.apply_migrations()
+        print(f"Seeding {submissions} submissions...")
+        await seed(submissions)
+        await neo4j_service.execute_query("CALL db.awaitIndexes(300)")
+
+        pages = -(-submissions // page_size)
+        sampled = sorted(set([0, 1, pages - 1] + random.sample(range(pages), min(samples, pages))))
+        keyset_ms = {}
+
+        cursor = None
+        for page_no in range(pages):
+            started = time.perf_counter()
+            page = await assessment_service.list_submissions(page_size, cursor=cursor)
+            if page_no in sampled:
+                keyset_ms[page_no] = (time.perf_counter() - started) * 1000
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        print(f"\n{'page':>8} {'keyset (ms)':>12} {'skip (ms)':>12}")
+        for page_no in sampled:
+            if page_no not in keyset_ms:
+                continue
+            started = time.perf_counter()
+            await neo4j_service.execute_query(SKIP_QUERY, {"skip": page_no * page_size, "limit": page_size})
+            skip_ms = (time.perf_counter() - started) * 1000
+            print(f"{page_no:>8} {keyset_ms[page_no]:>12.2f} {skip_ms:>12.2f}")
+    finally:
+        print("\nRemoving seeded submissions...")
+        await cleanup()
+        await neo4j_service.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--submissions", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--samples", type=int, default=20, help="pages to compare against SKIP")
+    parser.add_argument("--yes", action="store_true", help="confirm the target database is disposable")
+    args = parser.parse_args()
+
+    if not args.yes:
+        parser.error("this benchmark writes data; pass --yes for a disposable database")
+
+    asyncio.run(run(args.submissions, args.page_size, args.samples))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Concurrency benchmark for the async Neo4j data layer
+
+Replaces the driver behind neo4j_service with a local stand-in that answers
+every query after a fixed latency, then fires concurrent requests at the
+FastAPI app in-process. The stand-in runs in two modes:
+
+- blocking: the latency is spent in time.sleep (what the old synchronous
+  driver did inside async handlers)
+- async:    the latency is spent in asyncio.sleep (AsyncGraphDatabase)
+
+Usage:
+    python benchmarks/bench_async_neo4j.py --requests 500 --concurrency 200 --latency-ms 50
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# The stand-in never connects, but Settings still needs values
+os.environ.setdefault("NEO4J_URI", "bolt://localhost:7687")
+os.environ.setdefault("NEO4J_USERNAME", "neo4j")
+os.environ.setdefault("NEO4J_PASSWORD", "benchmark")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+import httpx
+from main import app
+from services.neo4j_service import neo4j_service
+
+STATUS_ROW = {
+    "appointment_id": "00000000-0000-0000-0000-000000000001",
+    "status": "Pending",
+    "scheduled_date": "2025-01-06",
+    "scheduled_time": "09:00:00",
+    "created_at": "2025-01-01T08:00:00+00:00",
+    "counselor_notes": "",
+    "rejection_reason": "",
+    "counselor_name": "Dr. Maria Santos",
+    "counselor_email": "counselor@msu.edu.ph",
+}
+
+class StandInRecord:
+    def __init__(self, row):
+        self._row = row
+
+    def data(self):
+        return dict(self._row)
+
+class StandInResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for row in self._rows:
+            yield StandInRecord(row)
+
+    async def single(self):
+        return StandInRecord(self._rows[0]) if self._rows else None
+
+    async def consume(self):
+        return None
+
+class StandInSession:
+    def __init__(self, latency: float, blocking: bool):
+        self.latency = latency
+        self.blocking = blocking
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def _wait(self):
+        if self.blocking:
+            time.sleep(self.latency)
+        else:
+            await asyncio.sleep(self.latency)
+
+    async def run(self, query, parameters=None):
+        await self._wait()
+        return StandInResult([STATUS_ROW])
+
+    async def execute_read(self, work):
+        return await work(self)
+
+    async def execute_write(self, work):
+        return await work(self)
+
+class StandInDriver:
+    """Answers every query with one canned row after a fixed latency"""
+    def __init__(self, latency: float, blocking: bool):
+        self.latency = latency
+        self.blocking = blocking
+
+    def session(self, **kwargs):
+        return StandInSession(self.latency, self.blocking)
+
+    async def close(self):
+        pass
+
+async def run_load(total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one(i: int):
+            async with semaphore:
+                response = await client.get(f"/appointment/status/student{i}@msu.edu.ph")
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000.0
+    print(f"{args.requests} requests, concurrency {args.concurrency}, stand-in latency {args.latency_ms:.0f} ms")
+    print(f"{'mode':<10} {'elapsed (s)':>12} {'req/s':>10}")
+
+    for mode, blocking in (("blocking", True), ("async", False)):
+        neo4j_service.driver = StandInDriver(latency, blocking)
+        elapsed = asyncio.run(run_load(args.requests, args.concurrency))
+        print(f"{mode:<10} {elapsed:>12.2f} {args.requests / elapsed:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Latency of unrelated requests during a login burst
+
+Uses the same in-process stand-in driver as bench_async_neo4j.py (no
+database), with one counselor whose password hash is real bcrypt. While a
+burst of concurrent logins runs, a probe calls /appointment/status/{email}
+at a fixed interval and records its latency. Two modes:
+
+- inline:   bcrypt runs on the event loop (the previous behaviour)
+- executor: bcrypt runs on the bounded password hashing pool
+
+Usage:
+    python benchmarks/bench_login_burst.py --logins 32 --probe-interval-ms 10
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from collections import Counter
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bench_async_neo4j import StandInDriver, StandInSession, StandInResult, STATUS_ROW
+
+import httpx
+from main import app
+from services.neo4j_service import neo4j_service
+from services.auth_service import account_failures, ip_attempts
+from utils.security import hash_password, password_hasher
+
+PASSWORD = "benchmark-password"
+COUNSELOR_ROW = {
+    "counselor_id": "00000000-0000-0000-0000-0000000000c1",
+    "full_name": "Dr. Maria Santos",
+    "email": "counselor@msu.edu.ph",
+    "password_hash": hash_password(PASSWORD),
+}
+
+class LoginStandInSession(StandInSession):
+    async def run(self, query, parameters=None):
+        await self._wait()
+        if "password_hash" in query:
+            return StandInResult([COUNSELOR_ROW])
+        return StandInResult([STATUS_ROW])
+
+class LoginStandInDriver(StandInDriver):
+    def session(self, **kwargs):
+        return LoginStandInSession(self.latency, self.blocking)
+
+async def run_inline(fn, *args):
+    """The old path: bcrypt called directly from the handler"""
+    return fn(*args)
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+async def burst(logins: int, probe_interval: float):
+    transport = httpx.ASGITransport(app=app)
+    probe_ms = []
+    outcomes = Counter()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def login():
+            response = await client.post("/admin/login", json={
+                "email": COUNSELOR_ROW["email"],
+                "password": PASSWORD
+            })
+            outcomes[response.status_code] += 1
+
+        async def probe(stop: asyncio.Event):
+            while not stop.is_set():
+                started = time.perf_counter()
+                response = await client.get("/appointment/status/student@msu.edu.ph")
+                response.raise_for_status()
+                probe_ms.append((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(probe_interval)
+
+        stop = asyncio.Event()
+        prober = asyncio.create_task(probe(stop))
+        await asyncio.sleep(probe_interval * 5)
+        await asyncio.gather(*(login() for _ in range(logins)))
+        stop.set()
+        await prober
+
+    return probe_ms, outcomes
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--probe-interval-ms", type=float, default=10.0)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="stand-in query latency")
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    neo4j_service.driver = LoginStandInDriver(args.latency_ms / 1000.0, blocking=False)
+    # Measure the CPU effect of the burst, not the brute-force throttle
+    ip_attempts.limit = account_failures.limit = 10 ** 9
+
+    print(f"{args.logins} concurrent logins, probe every {args.probe_interval_ms:.0f} ms, "
+          f"pool {password_hasher.executor._max_workers} workers / {password_hasher.max_pending} pending")
+    print(f"{'mode':<10} {'probes':>7} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9}  logins by status")
+
+    original_run = password_hasher._run
+    for mode in ("inline", "executor"):
+        password_hasher._run = run_inline if mode == "inline" else original_run
+        probe_ms, outcomes = asyncio.run(burst(args.logins, args.probe_interval_ms / 1000.0))
+        print(f"{mode:<10} {len(probe_ms):>7} {statistics.median(probe_ms):>9.1f} "
+              f"{percentile(probe_ms, 0.99):>9.1f} {max(probe_ms):>9.1f}  {dict(sorted(outcomes.items()))}")
+
+if __name__ == "__main__":
+    main()
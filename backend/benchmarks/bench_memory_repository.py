@@ -0,0 +1,181 @@
+"""
+In-memory repository backend at realistic data sizes
+
+Seeds the memory backend with counselors, a semester of hourly slots each
+and a large submission history, then times the operations the API issues
+most: deep assessment pages, counselor slot/appointment pages, the public
+availability list and bookings (including a burst of concurrent bookers
+per slot, which must produce exactly one winner each). No database.
+
+seed() is reused by the load generator to populate the memory backend.
+
+Usage:
+    python benchmarks/bench_memory_repository.py --submissions 1000000 --counselors 50
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+os.environ.setdefault("NEO4J_URI", "bolt://benchmark.invalid:7687")
+os.environ.setdefault("NEO4J_USERNAME", "neo4j")
+os.environ.setdefault("NEO4J_PASSWORD", "benchmark")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+from repositories import create_repositories
+
+STRESS_LEVELS = ["Low", "Moderate", "High"]
+ANSWERS = json.dumps([3] * 10)
+
+def submission(timestamp: datetime) -> dict:
+    score = round(random.uniform(1.0, 5.0), 2)
+    return {
+        "submission_id": str(uuid.uuid4()),
+        "client_submission_id": None,
+        "timestamp": timestamp.isoformat(),
+        "section1_raw_answers": ANSWERS,
+        "section2_raw_answers": ANSWERS,
+        "section3_raw_answers": ANSWERS,
+        "section1_score": score,
+        "section2_score": score,
+        "section3_score": score,
+        "overall_score": score,
+        "stress_level": random.choice(STRESS_LEVELS),
+        "recommendation": "Benchmark",
+        "scoring_version": 1,
+        "questionnaire_version": 1
+    }
+
+async def seed(repositories: tuple, submissions: int, counselors: int, days: int,
+               hours: tuple = (8, 17), password_hash: str = "not-a-hash") -> dict:
+    """
+    Counselors with one slot per hour in `hours` on every weekday of the next
+    `days` days, and `submissions` spread over the past year. Returns the
+    counselor ids, slot ids and submission ids created.
+    """
+    assessments, counselor_repository, slot_repository, _ = repositories
+    start = datetime.utcnow() - timedelta(days=365)
+    step = timedelta(days=365) / max(submissions, 1)
+    submission_ids = []
+    for i in range(submissions):
+        row = submission(start + step * i)
+        await assessments.add(row)
+        submission_ids.append(row["submission_id"])
+
+    counselor_ids, slot_ids = [], []
+    today = date.today()
+    for i in range(counselors):
+        counselor_id = str(uuid.uuid4())
+        await counselor_repository.create({
+            "counselor_id": counselor_id,
+            "full_name": f"Counselor {i:03d}",
+            "email": f"counselor{i:03d}@benchmark.edu",
+            "employee_id": f"EMP-{i:03d}",
+            "specialization": ["Academic", "Career", "Personal"][i % 3],
+            "password_hash": password_hash
+        })
+        counselor_ids.append(counselor_id)
+        rows = [
+            {
+                "slot_id": str(uuid.uuid4()),
+                "date": day.isoformat(),
+                "start_time": f"{hour:02d}:00:00",
+                "end_time": f"{hour + 1:02d}:00:00"
+            }
+            for day in (today + timedelta(days=d) for d in range(1, days + 1)) if day.weekday() < 5
+            for hour in range(*hours)
+        ]
+        await slot_repository.create_bulk(counselor_id, rows)
+        slot_ids += [row["slot_id"] for row in rows]
+
+    return {"counselor_ids": counselor_ids, "slot_ids": slot_ids, "submission_ids": submission_ids}
+
+async def timed(samples: int, operation) -> dict:
+    durations = []
+    for i in range(samples):
+        started = time.perf_counter()
+        await operation(i)
+        durations.append((time.perf_counter() - started) * 1e6)
+    durations.sort()
+    return {
+        "p50_us": round(statistics.median(durations), 1),
+        "p99_us": round(durations[min(len(durations) - 1, int(len(durations) * 0.99))], 1)
+    }
+
+async def main(args):
+    repositories = create_repositories("memory")
+    assessments, _, slots, appointments = repositories
+
+    started = time.perf_counter()
+    seeded = await seed(repositories, args.submissions, args.counselors, args.days)
+    print(f"Seeded {args.submissions} submissions, {args.counselors} counselors, "
+          f"{len(seeded['slot_ids'])} slots in {time.perf_counter() - started:.1f}s")
+
+    counselor_ids = seeded["counselor_ids"]
+    submission_ids = seeded["submission_ids"]
+    results = {}
+
+    # Walk 50 pages deep, then time the next pages
+    after = None
+    for _ in range(50):
+        rows = await assessments.page(101, after=after)
+        after = [rows[99]["timestamp"], rows[99]["submission_id"]]
+    results["assessment_page_deep"] = await timed(args.samples, lambda i: assessments.page(101, after=after))
+    results["assessment_page_stress"] = await timed(args.samples, lambda i: assessments.page(101, stress_level="High"))
+    results["slot_page"] = await timed(args.samples, lambda i: slots.page(random.choice(counselor_ids), 101))
+    results["availability_day"] = await timed(
+        args.samples, lambda i: slots.available(date.today() + timedelta(days=1 + i % args.days))
+    )
+    results["availability_all"] = await timed(max(args.samples // 10, 1), lambda i: slots.available())
+
+    # Every slot gets `bookers` concurrent attempts
+    open_slots = random.sample(seeded["slot_ids"], min(args.samples, len(seeded["slot_ids"])))
+    graph = slots.graph
+    winners = []
+
+    async def book(i):
+        slot_id = open_slots[i]
+        counselor_id = graph.slots[slot_id]["counselor_id"]
+        outcomes = await asyncio.gather(*(
+            appointments.book({
+                "appointment_id": str(uuid.uuid4()),
+                "submission_id": random.choice(submission_ids),
+                "counselor_id": counselor_id,
+                "slot_id": slot_id,
+                "client_full_name": "Bench Client",
+                "client_email": f"client{i}@benchmark.edu",
+                "client_student_id": None,
+                "client_course": "BSCS",
+                "client_year_level": "1",
+                "client_gender": "Other",
+                "client_age": 20,
+                "client_contact_number": None
+            })
+            for _ in range(args.bookers)
+        ))
+        winners.append(sum(1 for o in outcomes if o["outcome"] == "booked"))
+
+    results[f"book_slot_x{args.bookers}"] = await timed(len(open_slots), book)
+    results["exactly_one_winner_per_slot"] = all(w == 1 for w in winners)
+    results["appointment_page"] = await timed(args.samples, lambda i: appointments.page(random.choice(counselor_ids), 51))
+
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--submissions", type=int, default=200_000)
+    parser.add_argument("--counselors", type=int, default=50)
+    parser.add_argument("--days", type=int, default=120, help="days of hourly weekday slots per counselor")
+    parser.add_argument("--samples", type=int, default=500)
+    parser.add_argument("--bookers", type=int, default=20, help="concurrent attempts per slot")
+    asyncio.run(main(parser.parse_args()))
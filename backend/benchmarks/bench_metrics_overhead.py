@@ -0,0 +1,92 @@
+"""
+Cost of the /metrics instrumentation
+
+No database or server. Measures:
+  observe:    one Histogram.observe call (what every request and every
+              Neo4j query pays)
+  middleware: per-request time of a trivial route called through the ASGI
+              interface directly, with and without MetricsMiddleware; the
+              difference is the per-request overhead
+  render:     one /metrics scrape with --series label combinations
+
+Usage:
+    python benchmarks/bench_metrics_overhead.py --requests 20000
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi import FastAPI
+from utils.metrics import Histogram, MetricsMiddleware, MetricsRegistry
+
+def build_app(instrumented: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/appointment/status/{email}")
+    async def status(email: str):
+        return {"email": email}
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+async def per_request_us(app: FastAPI, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    def scope(i: int) -> dict:
+        return {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": "GET", "scheme": "http", "path": f"/appointment/status/s{i}@msu.edu.ph",
+            "raw_path": b"", "root_path": "", "query_string": b"", "headers": [],
+            "client": ("127.0.0.1", 1), "server": ("bench", 80), "state": {},
+        }
+
+    for i in range(200):  # warm up (builds the middleware stack)
+        await app(scope(i), receive, send)
+    started = time.perf_counter()
+    for i in range(requests):
+        await app(scope(i), receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--series", type=int, default=200, help="label combinations rendered per scrape")
+    args = parser.parse_args()
+
+    histogram = Histogram("bench_seconds", "bench", ("route", "method", "status"))
+    labels = ("/appointment/status/{email}", "GET", "200")
+    iterations = 1_000_000
+    started = time.perf_counter()
+    for i in range(iterations):
+        histogram.observe(labels, 0.004)
+    observe_ns = (time.perf_counter() - started) / iterations * 1e9
+
+    plain = asyncio.run(per_request_us(build_app(False), args.requests))
+    instrumented = asyncio.run(per_request_us(build_app(True), args.requests))
+
+    registry = MetricsRegistry()
+    scraped = registry.histogram("bench_seconds", "bench", ("route", "method", "status"))
+    for i in range(args.series):
+        scraped.observe((f"/route/{i}", "GET", "200"), 0.01)
+    started = time.perf_counter()
+    body = registry.render()
+    render_ms = (time.perf_counter() - started) * 1000
+
+    print(f"observe:    {observe_ns:.0f} ns per call")
+    print(f"middleware: {plain:.1f} µs -> {instrumented:.1f} µs per request "
+          f"(+{instrumented - plain:.1f} µs)")
+    print(f"render:     {render_ms:.2f} ms for {args.series} series ({len(body) // 1024} KiB)")
+
+if __name__ == "__main__":
+    main()
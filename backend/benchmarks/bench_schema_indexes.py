@@ -0,0 +1,225 @@
+"""
+Before/after benchmark for the schema migrations
+
+Seeds a disposable Neo4j database with synthetic submissions, counselors,
+slots and appointments, times the hot lookups without any schema, applies
+the migrations and times them again. Seeded nodes carry `bench: true` and
+are removed at the end.
+
+Only point this at a throwaway database: it drops the constraints and
+indexes created by the migrations before the "before" run.
+
+Usage:
+    python benchmarks/bench_schema_indexes.py --submissions 100000 --yes
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.neo4j_service import neo4j_service
+from services.schema_service import schema_service, MIGRATIONS
+
+BATCH_SIZE = 5000
+SAMPLES = 200
+
+SEED_SUBMISSIONS = """
+UNWIND $rows AS row
+CREATE (:AssessmentSubmission {
+    submission_id: row.submission_id,
+    timestamp: datetime(row.timestamp),
+    overall_score: row.overall_score,
+    stress_level: row.stress_level,
+    bench: true
+})
+"""
+
+SEED_SLOTS = """
+UNWIND $rows AS row
+CREATE (c:Counselor {counselor_id: row.counselor_id, email: row.email, full_name: row.counselor_id, bench: true})
+WITH c, row
+UNWIND row.slots AS s
+CREATE (c)-[:HAS_SLOT]->(ts:TimeSlot {
+    slot_id: s.slot_id,
+    date: date(s.date),
+    start_time: time('09:00'),
+    end_time: time('10:00'),
+    is_available: s.is_available,
+    bench: true
+})
+FOREACH (_ IN CASE WHEN s.is_available THEN [] ELSE [1] END |
+    MERGE (cl:Client {email: s.client_email})
+    ON CREATE SET cl.bench = true
+    CREATE (cl)-[:HAS_APPOINTMENT]->(:Appointment {
+        appointment_id: s.appointment_id,
+        status: 'Pending',
+        bench: true
+    })-[:OCCUPIES_SLOT]->(ts)
+)
+"""
+
+LOOKUPS = {
+    "submission by id": (
+        "MATCH (a:AssessmentSubmission {submission_id: $submission_id}) RETURN a.submission_id",
+        "submission_id"
+    ),
+    "counselor by email": (
+        "MATCH (c:Counselor {email: $email}) RETURN c.counselor_id",
+        "email"
+    ),
+    "slot by id": (
+        "MATCH (ts:TimeSlot {slot_id: $slot_id}) RETURN ts.slot_id",
+        "slot_id"
+    ),
+    "appointments by client email": (
+        "MATCH (:Client {email: $client_email})-[:HAS_APPOINTMENT]->(apt:Appointment) RETURN apt.appointment_id",
+        "client_email"
+    ),
+    "submissions last 7 days": (
+        "MATCH (a:AssessmentSubmission) WHERE a.timestamp >= datetime() - duration('P7D') "
+        "RETURN count(a) as total",
+        None
+    ),
+    "open slots on a date": (
+        "MATCH (ts:TimeSlot) WHERE ts.is_available = true AND ts.date = date($date) "
+        "RETURN count(ts) as total",
+        "date"
+    ),
+}
+
+def schema_object_names():
+    names = []
+    for migration in MIGRATIONS:
+        for statement in migration["statements"]:
+            parts = statement.split()
+            if parts[0] == "CREATE" and parts[1] in ("CONSTRAINT", "INDEX"):
+                names.append((parts[1], parts[2]))
+    return names
+
+async def drop_schema():
+    for kind, name in schema_object_names():
+        await neo4j_service.execute_write(f"DROP {kind} {name} IF EXISTS")
+    await neo4j_service.execute_write("MATCH (m:SchemaMigration) DETACH DELETE m")
+
+async def seed(submissions: int):
+    now = datetime.utcnow()
+    samples = {"submission_id": [], "email": [], "slot_id": [], "client_email": [], "date": []}
+    levels = ["Low", "Moderate", "High"]
+
+    for offset in range(0, submissions, BATCH_SIZE):
+        rows = []
+        for _ in range(min(BATCH_SIZE, submissions - offset)):
+            submission_id = str(uuid.uuid4())
+            rows.append({
+                "submission_id": submission_id,
+                "timestamp": (now - timedelta(minutes=random.randint(0, 365 * 24 * 60))).isoformat(),
+                "overall_score": round(random.uniform(1, 5), 2),
+                "stress_level": random.choice(levels)
+            })
+            if len(samples["submission_id"]) < SAMPLES:
+                samples["submission_id"].append(submission_id)
+        await neo4j_service.execute_write(SEED_SUBMISSIONS, {"rows": rows})
+
+    # Roughly one slot per ten submissions, a third of them booked
+    counselors = max(1, submissions // 2000)
+    slots_per_counselor = max(1, submissions // 10 // counselors)
+    rows = []
+    for i in range(counselors):
+        email = f"bench-counselor-{i}@msu.edu.ph"
+        slots = []
+        for j in range(slots_per_counselor):
+            booked = random.random() < 0.33
+            slot = {
+                "slot_id": str(uuid.uuid4()),
+                "date": (now.date() + timedelta(days=j % 180)).isoformat(),
+                "is_available": not booked,
+                "appointment_id": str(uuid.uuid4()),
+                "client_email": f"student{random.randint(0, submissions)}@msu.edu.ph"
+            }
+            slots.append(slot)
+            if len(samples["slot_id"]) < SAMPLES:
+                samples["slot_id"].append(slot["slot_id"])
+                samples["date"].append(slot["date"])
+            if booked and len(samples["client_email"]) < SAMPLES:
+                samples["client_email"].append(slot["client_email"])
+        rows.append({"counselor_id": str(uuid.uuid4()), "email": email, "slots": slots})
+        samples["email"].append(email)
+        if len(rows) == 10:
+            await neo4j_service.execute_write(SEED_SLOTS, {"rows": rows})
+            rows = []
+    if rows:
+        await neo4j_service.execute_write(SEED_SLOTS, {"rows": rows})
+
+    return samples
+
+async def cleanup():
+    while True:
+        result = await neo4j_service.execute_write("""
+        MATCH (n {bench: true})
+        WITH n LIMIT 10000
+        DETACH DELETE n
+        RETURN count(*) as deleted
+        """)
+        if not result or result["deleted"] == 0:
+            break
+
+async def time_lookups(samples):
+    timings = {}
+    for label, (query, key) in LOOKUPS.items():
+        values = samples[key] if key else [None] * 20
+        if not values:
+            continue
+        elapsed = []
+        for value in values:
+            params = {key: value} if key else {}
+            started = time.perf_counter()
+            await neo4j_service.execute_query(query, params)
+            elapsed.append((time.perf_counter() - started) * 1000)
+        elapsed.sort()
+        timings[label] = (statistics.mean(elapsed), elapsed[int(len(elapsed) * 0.95) - 1])
+    return timings
+
+async def run(submissions: int):
+    try:
+        print("Dropping migration-managed schema...")
+        await drop_schema()
+        print(f"Seeding {submissions} submissions...")
+        samples = await seed(submissions)
+
+        before = await time_lookups(samples)
+        version = await schema_service.apply_migrations()
+        await neo4j_service.execute_query("CALL db.awaitIndexes(300)")
+        after = await time_lookups(samples)
+
+        print(f"\nSchema version {version}")
+        print(f"{'lookup':<32} {'before mean/p95 (ms)':>22} {'after mean/p95 (ms)':>22}")
+        for label in before:
+            b, a = before[label], after[label]
+            print(f"{label:<32} {b[0]:>10.2f} / {b[1]:>9.2f} {a[0]:>10.2f} / {a[1]:>9.2f}")
+    finally:
+        print("\nRemoving seeded nodes...")
+        await cleanup()
+        await neo4j_service.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--submissions", type=int, default=100_000)
+    parser.add_argument("--yes", action="store_true", help="confirm the target database is disposable")
+    args = parser.parse_args()
+
+    if not args.yes:
+        parser.error("this benchmark drops indexes and writes data; pass --yes for a disposable database")
+
+    asyncio.run(run(args.submissions))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Batch scoring throughput: vectorized N×30 matrix vs the per-dict path
+
+Pure CPU, no database. Generates random answer sets, scores them with
+reverse_items + calculate_assessment_score one dict at a time and with
+score_matrix in one pass, checks both agree, and prints rows per second.
+
+Usage:
+    python benchmarks/bench_scoring.py --rows 1000000
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from utils.scoring import SECTIONS, QUESTION_IDS, SCORING_RULES, calculate_assessment_score, reverse_items
+from utils.batch_scoring import answers_to_matrix, score_matrix
+
+# Per-dict rows are built in chunks so 1M answer dicts never sit in memory at once
+CHUNK_SIZE = 100_000
+
+def to_dicts(matrix: np.ndarray) -> list:
+    return [
+        {
+            section: dict(zip(QUESTION_IDS, row[i * 10:(i + 1) * 10].tolist()))
+            for i, section in enumerate(SECTIONS)
+        }
+        for row in matrix
+    ]
+
+def score_dicts(rows: list, rules: dict) -> list:
+    return [
+        calculate_assessment_score(
+            reverse_items(row["section1"], "section1", rules),
+            reverse_items(row["section2"], "section2", rules),
+            reverse_items(row["section3"], "section3", rules),
+            rules
+        )
+        for row in rows
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--version", type=int, default=1, help="scoring version")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rules = SCORING_RULES[args.version]
+    matrix = np.random.default_rng(args.seed).integers(1, 6, size=(args.rows, 30), dtype=np.int8)
+
+    per_dict_s = 0.0
+    pack_s = 0.0
+    mismatches = 0
+    started = time.perf_counter()
+    vectorized = score_matrix(matrix, rules)
+    vectorized_s = time.perf_counter() - started
+
+    for offset in range(0, args.rows, CHUNK_SIZE):
+        chunk = matrix[offset:offset + CHUNK_SIZE]
+        rows = to_dicts(chunk)
+
+        started = time.perf_counter()
+        results = score_dicts(rows, rules)
+        per_dict_s += time.perf_counter() - started
+
+        # Cost of getting from API-shaped dicts to the matrix
+        started = time.perf_counter()
+        answers_to_matrix(rows)
+        pack_s += time.perf_counter() - started
+
+        for i, result in enumerate(results):
+            j = offset + i
+            if (result[3] != vectorized["overall_score"][j]
+                    or result[4] != vectorized["stress_level"][j]):
+                mismatches += 1
+
+    print(f"{'path':<28} {'seconds':>10} {'rows/s':>14}")
+    print(f"{'per-dict':<28} {per_dict_s:>10.3f} {args.rows / per_dict_s:>14,.0f}")
+    print(f"{'vectorized':<28} {vectorized_s:>10.3f} {args.rows / vectorized_s:>14,.0f}")
+    print(f"{'vectorized incl. packing':<28} {vectorized_s + pack_s:>10.3f} {args.rows / (vectorized_s + pack_s):>14,.0f}")
+    print(f"\nSpeedup: {per_dict_s / vectorized_s:.1f}x (scoring only)")
+    print(f"Mismatched rows: {mismatches}")
+
+if __name__ == "__main__":
+    main()
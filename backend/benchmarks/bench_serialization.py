@@ -0,0 +1,209 @@
+"""
+Per-endpoint response serialization cost: previous path vs orjson fast path
+
+No database or server. For each endpoint, a representative driver result is
+turned into response bytes two ways:
+  before: build the Pydantic models the service used to return, then let
+          FastAPI validate them against response_model, run jsonable_encoder
+          and encode with the stdlib JSONResponse (raw dict results skip the
+          model step but still go through jsonable_encoder)
+  after:  hand the driver rows to ORJSONResponse (utils/serialization.json_response)
+Run it after touching a response shape to keep an eye on serialization cost.
+
+Usage:
+    python benchmarks/bench_serialization.py --iterations 2000
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from models.schemas import (
+    AppointmentBookResponse, AppointmentDetailResponse, AppointmentStatusResponse,
+    AssessmentSubmitResponse, CounselorAvailability
+)
+from utils.serialization import json_response
+
+NOW = datetime(2025, 3, 1, 9, 30)
+
+def availability_rows(counselors: int = 20, slots: int = 40) -> list:
+    return [
+        {
+            "counselor_id": str(uuid.uuid4()),
+            "full_name": f"Counselor {c}",
+            "specialization": "Mental Health",
+            "email": f"counselor{c}@university.edu",
+            "available_slots": [
+                {
+                    "slot_id": str(uuid.uuid4()),
+                    "date": (NOW.date() + timedelta(days=s // 8)).isoformat(),
+                    "start_time": f"{8 + s % 8:02d}:00:00",
+                    "end_time": f"{9 + s % 8:02d}:00:00"
+                }
+                for s in range(slots)
+            ]
+        }
+        for c in range(counselors)
+    ]
+
+def status_rows(appointments: int = 5) -> list:
+    return [
+        {
+            "appointment_id": str(uuid.uuid4()),
+            "status": "Pending",
+            "scheduled_date": "2025-03-04",
+            "scheduled_time": "10:00:00",
+            "created_at": "2025-03-01T09:30:00.123456789Z",
+            "counselor_notes": "",
+            "rejection_reason": None,
+            "counselor_name": "Dr. Jane Smith",
+            "counselor_email": "counselor@university.edu"
+        }
+        for _ in range(appointments)
+    ]
+
+def detail_row() -> dict:
+    answers = json.dumps({f"q{i}": 3 for i in range(1, 11)})
+    return {
+        **status_rows(1)[0],
+        "client_full_name": "Juan Dela Cruz",
+        "client_email": "student@university.edu",
+        "client_student_id": "2021-00001",
+        "client_course": "BS Computer Science",
+        "client_year_level": "3rd Year",
+        "client_gender": "Male",
+        "client_age": 20,
+        "client_contact_number": None,
+        "assessment_submission_id": str(uuid.uuid4()),
+        "assessment_timestamp": "2025-03-01T09:00:00.000000000Z",
+        "section1_raw_answers": answers,
+        "section2_raw_answers": answers,
+        "section3_raw_answers": answers,
+        "section1_score": 3.0,
+        "section2_score": 3.0,
+        "section3_score": 3.0,
+        "overall_score": 3.0,
+        "stress_level": "Moderate",
+        "recommendation": "Consider speaking with a counselor."
+    }
+
+def submission_row() -> dict:
+    return {
+        "submission_id": str(uuid.uuid4()),
+        "section1_score": 2.1,
+        "section2_score": 1.8,
+        "section3_score": 3.4,
+        "overall_score": 2.43,
+        "stress_level": "Moderate",
+        "recommendation": "Consider speaking with a counselor.",
+        "timestamp": NOW.isoformat()
+    }
+
+def book_row() -> dict:
+    return {
+        "appointment_id": str(uuid.uuid4()),
+        "status": "Pending",
+        "scheduled_date": "2025-03-04",
+        "scheduled_time": "10:00:00",
+        "counselor_name": "Dr. Jane Smith",
+        "message": "Appointment booked successfully."
+    }
+
+def assessments_page(size: int = 100) -> dict:
+    return {
+        "items": [
+            {
+                "submission_id": str(uuid.uuid4()),
+                "timestamp": "2025-03-01T09:00:00.000000000Z",
+                "overall_score": 2.5,
+                "stress_level": "Moderate",
+                "recommendation": "Consider speaking with a counselor."
+            }
+            for _ in range(size)
+        ],
+        "next_cursor": "WyIyMDI1LTAzLTAxVDA5OjAwOjAwWiIsImFiYyJd"
+    }
+
+def timeseries_rows(days: int = 90) -> list:
+    return [
+        {
+            "day": (NOW.date() - timedelta(days=d)).isoformat(),
+            "total_assessments": 120,
+            "average_score": 2.61,
+            "low_stress": 40,
+            "moderate_stress": 60,
+            "high_stress": 20
+        }
+        for d in range(days)
+    ]
+
+# name, driver result, response_model (None = raw dict result), model the service used to build
+ENDPOINTS = [
+    ("GET /appointment/counselors/available", availability_rows(), List[CounselorAvailability], CounselorAvailability),
+    ("GET /appointment/status/{email}", status_rows(), List[AppointmentStatusResponse], AppointmentStatusResponse),
+    ("POST /appointment/book", book_row(), AppointmentBookResponse, AppointmentBookResponse),
+    ("POST /assessment/submit", submission_row(), AssessmentSubmitResponse, AssessmentSubmitResponse),
+    ("GET /admin/appointment/{id}", detail_row(), AppointmentDetailResponse, AppointmentDetailResponse),
+    ("GET /admin/assessments", assessments_page(), None, None),
+    ("GET /admin/analytics/timeseries", timeseries_rows(), None, None),
+]
+
+def build_models(rows, model):
+    if model is None:
+        return rows
+    if isinstance(rows, list):
+        return [model(**row) for row in rows]
+    return model(**rows)
+
+async def before(rows, field, model) -> bytes:
+    content = build_models(rows, model)
+    if field is None:
+        return JSONResponse(jsonable_encoder(content)).body
+    encoded = await serialize_response(field=field, response_content=content, is_coroutine=True)
+    return JSONResponse(encoded).body
+
+def after(rows) -> bytes:
+    return json_response(rows).body
+
+async def run(iterations: int):
+    print(f"{'endpoint':<40} {'bytes':>7} {'before (µs)':>12} {'after (µs)':>11} {'speedup':>8}")
+    for name, rows, response_model, model in ENDPOINTS:
+        # FastAPI builds the response field once, when the route is registered
+        field = None
+        if response_model is not None:
+            field = create_model_field(name="response", type_=response_model, mode="serialization")
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await before(rows, field, model)
+        before_us = (time.perf_counter() - started) / iterations * 1e6
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            body = after(rows)
+        after_us = (time.perf_counter() - started) / iterations * 1e6
+
+        print(f"{name:<40} {len(body):>7} {before_us:>12.1f} {after_us:>11.1f} {before_us / after_us:>7.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations))
+
+if __name__ == "__main__":
+    main()
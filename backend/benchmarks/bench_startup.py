@@ -0,0 +1,174 @@
+"""
+Cold-start cost: import time, lifespan startup and first-request latency
+
+Each run happens in a fresh child process so imports are really cold. The
+child swaps in a pooled stand-in driver (no database) where opening a
+connection costs --handshake-ms and every query costs --latency-ms, then
+drives the app's lifespan in-process and records:
+
+  import_ms             `import main` (no driver is created at import time)
+  lifespan_ms           lifespan entry until the app can take requests
+  first_live_ms         first GET /health/live
+  ready_ms              lifespan entry until GET /health/ready returns 200
+  first_burst_p50/max   a burst of concurrent DB-backed requests right after
+                        readiness - pays the handshakes a cold pool hasn't
+
+Two configurations are compared: no warmup (NEO4J_WARMUP_CONNECTIONS=0)
+and the given number of concurrently warmed connections. Prints JSON.
+
+Usage:
+    python benchmarks/bench_startup.py --warmup 10 --burst 10 --handshake-ms 80
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import datetime
+import json
+import statistics
+import subprocess
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+def child(args) -> dict:
+    # Same placeholders as bench_async_neo4j.py, without importing it (that
+    # would import main before the clock starts)
+    os.environ.setdefault("NEO4J_URI", "bolt://localhost:7687")
+    os.environ.setdefault("NEO4J_USERNAME", "neo4j")
+    os.environ.setdefault("NEO4J_PASSWORD", "benchmark")
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    os.environ["SCHEMA_MIGRATE_ON_STARTUP"] = "false"
+    os.environ["SUBMISSION_WRITE_BEHIND"] = "false"
+
+    started = time.perf_counter()
+    from main import app
+    import_ms = (time.perf_counter() - started) * 1000
+
+    import httpx
+    from bench_async_neo4j import StandInResult, StandInSession, STATUS_ROW
+    from services.neo4j_service import neo4j_service
+
+    # The open slot index loads every counselor's open slots at startup
+    tomorrow = (datetime.date.today() + datetime.timedelta(days=1)).isoformat()
+    AVAILABILITY_ROW = {
+        "counselor_id": "00000000-0000-0000-0000-0000000000c1",
+        "full_name": "Dr. Maria Santos",
+        "specialization": "Mental Health",
+        "email": "counselor@msu.edu.ph",
+        "available_slots": [
+            {"slot_id": f"00000000-0000-0000-0000-0000000005{hour:02d}", "date": tomorrow,
+             "start_time": f"{hour:02d}:00:00Z", "end_time": f"{hour:02d}:45:00Z"}
+            for hour in range(8, 17)
+        ]
+    }
+
+    class PooledSession(StandInSession):
+        """Holds one pooled connection, opening a new one if none is idle"""
+        def __init__(self, driver):
+            super().__init__(driver.latency, blocking=False)
+            self.driver = driver
+
+        async def __aenter__(self):
+            if self.driver.idle:
+                self.driver.idle -= 1
+            else:
+                await asyncio.sleep(self.driver.handshake)
+                self.driver.opened += 1
+            return self
+
+        async def __aexit__(self, *exc):
+            self.driver.idle += 1
+            return False
+
+        async def run(self, query, parameters=None):
+            await self._wait()
+            if "available_slots" in query:
+                return StandInResult([AVAILABILITY_ROW])
+            return StandInResult([STATUS_ROW])
+
+    class PooledStandInDriver:
+        def __init__(self, handshake: float, latency: float):
+            self.handshake = handshake
+            self.latency = latency
+            self.idle = 0
+            self.opened = 0
+
+        def session(self, **kwargs):
+            return PooledSession(self)
+
+        async def close(self):
+            pass
+
+    driver = neo4j_service.driver = PooledStandInDriver(args.handshake_ms / 1000.0, args.latency_ms / 1000.0)
+
+    async def run() -> dict:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            entered = time.perf_counter()
+            async with app.router.lifespan_context(app):
+                lifespan_ms = (time.perf_counter() - entered) * 1000
+
+                sent = time.perf_counter()
+                (await client.get("/health/live")).raise_for_status()
+                first_live_ms = (time.perf_counter() - sent) * 1000
+
+                deadline = time.perf_counter() + args.ready_timeout
+                while (response := await client.get("/health/ready")).status_code != 200:
+                    if time.perf_counter() > deadline:
+                        raise RuntimeError(f"Not ready after {args.ready_timeout:.0f}s: {response.json().get('error')}")
+                    await asyncio.sleep(0.001)
+                ready_ms = (time.perf_counter() - entered) * 1000
+
+                async def one(i: int) -> float:
+                    sent = time.perf_counter()
+                    response = await client.get(f"/appointment/status/student{i}@msu.edu.ph")
+                    response.raise_for_status()
+                    return (time.perf_counter() - sent) * 1000
+
+                burst = await asyncio.gather(*(one(i) for i in range(args.burst)))
+
+        return {
+            "import_ms": round(import_ms, 1),
+            "lifespan_ms": round(lifespan_ms, 2),
+            "first_live_ms": round(first_live_ms, 2),
+            "ready_ms": round(ready_ms, 1),
+            "first_burst_p50_ms": round(statistics.median(burst), 1),
+            "first_burst_max_ms": round(max(burst), 1),
+            "connections_opened": driver.opened,
+        }
+
+    return asyncio.run(run())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--warmup", type=int, default=10, help="connections warmed at startup")
+    parser.add_argument("--burst", type=int, default=10, help="concurrent requests right after readiness")
+    parser.add_argument("--handshake-ms", type=float, default=80.0, help="stand-in cost of opening a connection")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="stand-in query latency")
+    parser.add_argument("--ready-timeout", type=float, default=30.0, help="give up if /health/ready is not 200 by then")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(child(args)))
+        return
+
+    report = {}
+    for name, warmup in (("no_warmup", 0), ("warmup", args.warmup)):
+        env = dict(os.environ, NEO4J_WARMUP_CONNECTIONS=str(warmup))
+        output = subprocess.run(
+            [sys.executable, __file__, "--child",
+             "--burst", str(args.burst),
+             "--handshake-ms", str(args.handshake_ms),
+             "--latency-ms", str(args.latency_ms),
+             "--ready-timeout", str(args.ready_timeout)],
+            env=env, check=True, capture_output=True, text=True
+        ).stdout
+        report[name] = {"warmup_connections": warmup, **json.loads(output.strip().splitlines()[-1])}
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+End-to-end load test replaying the Flutter app's call sequences
+
+Sessions arrive open-loop (Poisson) at the configured rates and each runs
+one flow, the way flutter_app/lib/services/api_service.dart calls the API:
+
+    student:   GET questions -> POST submit -> GET available counselors
+               -> POST book (a random open slot) -> GET status by email
+    counselor: POST login -> GET dashboard stats -> GET appointments (every
+               page) -> GET this week's slots (every page) -> GET analytics
+
+A session stops at its first failed step. A 409 on booking is the normal
+outcome of losing a slot race: it ends the session but is not an error.
+
+Targets either the app in-process (httpx ASGITransport; memory backend by
+default, seeded with counselors, slots and past submissions) or a running
+server (--url, with --counselor credentials for the counselor flow). The
+report is JSON - per-endpoint p50/p95/p99 latency, throughput, status
+counts and error rate, plus the commit - so runs can be diffed across commits.
+
+Usage:
+    python benchmarks/load_test.py --rate 20 --duration 60 --mix student=9,counselor=1
+    python benchmarks/load_test.py --stage 5:30 --stage 50:60 --output results.json
+    python benchmarks/load_test.py --url http://localhost:8000 --counselor counselor@msu.edu.ph:Admin@2024
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import subprocess
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import httpx
+
+# Password of every seeded counselor in in-process runs
+SEEDED_PASSWORD = "LoadTest@2024"
+
+# Non-2xx statuses a step may legitimately return
+EXPECTED_STATUSES = {
+    "POST /appointment/book": {409},
+}
+
+class Recorder:
+    """Latency and status of every request, by endpoint"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.errors = Counter()
+        self.sessions = defaultdict(Counter)
+        self.dropped = 0
+
+    def record(self, endpoint: str, seconds: float, status, ok: bool):
+        self.latencies[endpoint].append(seconds * 1000)
+        self.statuses[endpoint][str(status)] += 1
+        if not ok:
+            self.errors[endpoint] += 1
+
+def percentile(ordered: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))]
+
+def summarize(latencies: list, errors: int, elapsed: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "error_rate": round(errors / len(ordered), 4) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50), 2),
+        "p95_ms": round(percentile(ordered, 0.95), 2),
+        "p99_ms": round(percentile(ordered, 0.99), 2),
+        "max_ms": round(ordered[-1], 2) if ordered else 0.0
+    }
+
+class Flows:
+    """The two user journeys, recording every call under its route template"""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, counselors: list, think_ms: float):
+        self.client = client
+        self.recorder = recorder
+        self.counselors = counselors
+        self.think_ms = think_ms
+        self.student_ids = itertools.count()
+
+    async def call(self, endpoint: str, method: str, url: str, **kwargs):
+        """One request; returns the response, or None if it failed"""
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.recorder.record(endpoint, time.perf_counter() - started, type(e).__name__, ok=False)
+            return None
+        ok = response.is_success or response.status_code in EXPECTED_STATUSES.get(endpoint, ())
+        self.recorder.record(endpoint, time.perf_counter() - started, response.status_code, ok)
+        return response if ok else None
+
+    async def think(self):
+        if self.think_ms:
+            await asyncio.sleep(random.expovariate(1000 / self.think_ms))
+
+    async def all_pages(self, endpoint: str, url: str, params: dict, headers: dict) -> bool:
+        """Follow next_cursor like ApiService._getAllPages"""
+        cursor = None
+        while True:
+            page_params = dict(params, cursor=cursor) if cursor else params
+            response = await self.call(endpoint, "GET", url, params=page_params, headers=headers)
+            if response is None:
+                return False
+            cursor = response.json()["next_cursor"]
+            if cursor is None:
+                return True
+
+    async def student(self) -> bool:
+        response = await self.call("GET /assessment/questions", "GET", "/assessment/questions")
+        if response is None:
+            return False
+        questionnaire = response.json()
+        await self.think()
+
+        answers = {
+            section: {
+                q["id"]: random.choice(spec["options"])["value"]
+                for q in spec["questions"]
+            }
+            for section, spec in questionnaire.items()
+        }
+        response = await self.call("POST /assessment/submit", "POST", "/assessment/submit", json={"answers": answers})
+        if response is None:
+            return False
+        submission_id = response.json()["submission_id"]
+        await self.think()
+
+        response = await self.call("GET /appointment/counselors/available", "GET", "/appointment/counselors/available")
+        if response is None:
+            return False
+        available = [c for c in response.json() if c["available_slots"]]
+        if not available:
+            return True
+        counselor = random.choice(available)
+        slot = random.choice(counselor["available_slots"])
+        await self.think()
+
+        n = next(self.student_ids)
+        email = f"student{n}@loadtest.edu"
+        response = await self.call("POST /appointment/book", "POST", "/appointment/book", json={
+            "submission_id": submission_id,
+            "counselor_id": counselor["counselor_id"],
+            "slot_id": slot["slot_id"],
+            "client_details": {
+                "full_name": f"Load Test Student {n}",
+                "email": email,
+                "student_id": f"LT-{n:06d}",
+                "course": "BS Computer Science",
+                "year_level": random.choice(["1st Year", "2nd Year", "3rd Year", "4th Year"]),
+                "gender": random.choice(["Male", "Female", "Prefer not to say"]),
+                "age": random.randint(17, 25)
+            }
+        })
+        if response is None:
+            return False
+        if response.status_code == 409:
+            return True
+        await self.think()
+
+        return await self.call("GET /appointment/status/{email}", "GET", f"/appointment/status/{email}") is not None
+
+    async def counselor(self) -> bool:
+        email, password = random.choice(self.counselors)
+        response = await self.call("POST /admin/login", "POST", "/admin/login", json={"email": email, "password": password})
+        if response is None:
+            return False
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        await self.think()
+
+        if await self.call("GET /admin/dashboard/stats", "GET", "/admin/dashboard/stats", headers=headers) is None:
+            return False
+        if not await self.all_pages("GET /admin/appointments", "/admin/appointments", {}, headers):
+            return False
+        await self.think()
+
+        today = date.today()
+        week = {"start_date": today.isoformat(), "end_date": (today + timedelta(days=7)).isoformat()}
+        if not await self.all_pages("GET /admin/slots", "/admin/slots", week, headers):
+            return False
+        await self.think()
+
+        response = await self.call("GET /admin/analytics", "GET", "/admin/analytics", params={"period": "7days"}, headers=headers)
+        return response is not None
+
+async def run_session(flows: Flows, flow: str, recorder: Recorder):
+    recorder.sessions[flow]["started"] += 1
+    try:
+        ok = await getattr(flows, flow)()
+    except Exception:
+        ok = False
+    recorder.sessions[flow]["completed" if ok else "failed"] += 1
+
+async def generate(flows: Flows, recorder: Recorder, stages: list, mix: dict, max_sessions: int) -> float:
+    """Start sessions at Poisson arrivals for every (rate, seconds) stage; returns elapsed seconds"""
+    names, weights = list(mix), list(mix.values())
+    running = set()
+    started = time.perf_counter()
+    deadline = started
+
+    for rate, seconds in stages:
+        deadline += seconds
+        next_arrival = time.perf_counter()
+        while True:
+            next_arrival += random.expovariate(rate)
+            if next_arrival >= deadline:
+                break
+            await asyncio.sleep(max(0.0, next_arrival - time.perf_counter()))
+            if len(running) >= max_sessions:
+                recorder.dropped += 1
+                continue
+            task = asyncio.create_task(run_session(flows, random.choices(names, weights)[0], recorder))
+            running.add(task)
+            task.add_done_callback(running.discard)
+        await asyncio.sleep(max(0.0, deadline - time.perf_counter()))
+
+    if running:
+        await asyncio.gather(*running)
+    return time.perf_counter() - started
+
+def parse_stage(value: str) -> tuple:
+    rate, seconds = value.split(":")
+    return float(rate), float(seconds)
+
+def parse_mix(value: str) -> dict:
+    mix = {}
+    for part in value.split(","):
+        name, weight = part.split("=")
+        if name not in ("student", "counselor"):
+            raise argparse.ArgumentTypeError(f"Unknown flow {name!r} (student, counselor)")
+        mix[name] = float(weight)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+def parse_counselor(value: str) -> tuple:
+    email, _, password = value.partition(":")
+    return email, password
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+async def in_process_target(args):
+    """The app with its lifespan running, seeded when it uses the memory backend"""
+    os.environ.setdefault("REPOSITORY_BACKEND", "memory")
+    os.environ.setdefault("NEO4J_URI", "bolt://loadtest.invalid:7687")
+    os.environ.setdefault("NEO4J_USERNAME", "neo4j")
+    os.environ.setdefault("NEO4J_PASSWORD", "loadtest")
+    os.environ.setdefault("SECRET_KEY", "loadtest-secret")
+    # Every in-process request comes from one client address
+    os.environ.setdefault("LOGIN_MAX_ATTEMPTS_PER_IP", "1000000000")
+
+    from main import app
+    from repositories import appointment_repository, assessment_repository, counselor_repository, slot_repository
+    from services.open_slot_index import open_slot_index
+    from utils.security import password_hasher
+    from bench_memory_repository import seed
+
+    lifespan = app.router.lifespan_context(app)
+    await lifespan.__aenter__()
+    while not getattr(app.state, "ready", False):
+        await asyncio.sleep(0.05)
+
+    counselors = list(args.counselor)
+    if os.environ["REPOSITORY_BACKEND"] == "memory":
+        seeded = await seed(
+            (assessment_repository, counselor_repository, slot_repository, appointment_repository),
+            args.seed_submissions, args.seed_counselors, args.seed_days,
+            password_hash=await password_hasher.hash(SEEDED_PASSWORD)
+        )
+        counselors += [(f"counselor{i:03d}@benchmark.edu", SEEDED_PASSWORD) for i in range(len(seeded["counselor_ids"]))]
+        # Seeded behind the app's back, so the slot index must reread
+        await open_slot_index.load()
+
+    transport = httpx.ASGITransport(app=app)
+    return transport, "http://loadtest", counselors, lifespan
+
+async def main(args) -> dict:
+    lifespan = None
+    if args.url:
+        transport, base_url, counselors = None, args.url, list(args.counselor)
+    else:
+        transport, base_url, counselors, lifespan = await in_process_target(args)
+    if "counselor" in args.mix and not counselors:
+        raise SystemExit("The counselor flow needs --counselor EMAIL:PASSWORD when targeting --url")
+
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.max_sessions, max_keepalive_connections=args.max_sessions)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=args.timeout, limits=limits) as client:
+            flows = Flows(client, recorder, counselors, args.think_ms)
+            elapsed = await generate(flows, recorder, args.stage, args.mix, args.max_sessions)
+    finally:
+        if lifespan is not None:
+            await lifespan.__aexit__(None, None, None)
+
+    endpoints = {
+        endpoint: {**summarize(latencies, recorder.errors[endpoint], elapsed), "statuses": dict(recorder.statuses[endpoint])}
+        for endpoint, latencies in sorted(recorder.latencies.items())
+    }
+    everything = [ms for latencies in recorder.latencies.values() for ms in latencies]
+    return {
+        "commit": current_commit(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "target": args.url or f"in-process ({os.environ.get('REPOSITORY_BACKEND')})",
+        "config": {
+            "stages": [{"rate": rate, "seconds": seconds} for rate, seconds in args.stage],
+            "mix": args.mix,
+            "think_ms": args.think_ms,
+            "max_sessions": args.max_sessions,
+            **({} if args.url else {
+                "seed_submissions": args.seed_submissions,
+                "seed_counselors": args.seed_counselors,
+                "seed_days": args.seed_days
+            })
+        },
+        "elapsed_s": round(elapsed, 2),
+        "sessions": {flow: dict(counts) for flow, counts in recorder.sessions.items()},
+        "dropped_sessions": recorder.dropped,
+        "overall": summarize(everything, sum(recorder.errors.values()), elapsed),
+        "endpoints": endpoints
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="base URL of a running server (default: the app in-process)")
+    parser.add_argument("--rate", type=float, default=10.0, help="sessions started per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to keep starting sessions")
+    parser.add_argument("--stage", type=parse_stage, action="append", default=[],
+                        help="RATE:SECONDS, repeatable; replaces --rate/--duration")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("student=9,counselor=1"),
+                        help="relative weight of each flow (default student=9,counselor=1)")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="mean pause between a session's steps")
+    parser.add_argument("--max-sessions", type=int, default=500, help="concurrent sessions; arrivals beyond it are dropped")
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout (the app's own)")
+    parser.add_argument("--counselor", type=parse_counselor, action="append", default=[], help="EMAIL:PASSWORD, repeatable")
+    parser.add_argument("--seed-submissions", type=int, default=20_000)
+    parser.add_argument("--seed-counselors", type=int, default=20)
+    parser.add_argument("--seed-days", type=int, default=30, help="days of hourly weekday slots per seeded counselor")
+    parser.add_argument("--output", help="write the JSON report here as well as to stdout")
+    args = parser.parse_args()
+    if not args.stage:
+        args.stage = [(args.rate, args.duration)]
+
+    report = asyncio.run(main(args))
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
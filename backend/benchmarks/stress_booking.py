@@ -0,0 +1,125 @@
+"""
+Concurrency stress test for appointment booking
+
+Creates a throwaway counselor, one open slot and N assessment submissions,
+then lets N students try to book that slot at the same moment. Exactly one
+booking must succeed and every other attempt must fail with 409. Repeats
+for several rounds and removes everything it created.
+
+Needs a live (preferably disposable) Neo4j database.
+
+Usage:
+    python benchmarks/stress_booking.py --bookers 50 --rounds 5
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import time
+import uuid
+from collections import Counter
+from datetime import date, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi import HTTPException
+from models.schemas import AppointmentBookRequest, ClientDetails
+from services.appointment_service import appointment_service
+from services.neo4j_service import neo4j_service
+
+SETUP_QUERY = """
+CREATE (c:Counselor {counselor_id: $counselor_id, full_name: 'Stress Test', email: $email, stress_test: true})
+CREATE (c)-[:HAS_SLOT]->(:TimeSlot {
+    slot_id: $slot_id,
+    date: date($date),
+    start_time: time('09:00'),
+    end_time: time('10:00'),
+    is_available: true,
+    stress_test: true
+})
+WITH c
+UNWIND $submission_ids AS submission_id
+CREATE (:AssessmentSubmission {submission_id: submission_id, timestamp: datetime(), stress_test: true})
+RETURN count(*) as created
+"""
+
+CLEANUP_QUERY = """
+MATCH (n {stress_test: true})
+OPTIONAL MATCH (apt:Appointment)-[:OCCUPIES_SLOT]->(n)
+OPTIONAL MATCH (stats:StatsCounter {key: 'counselor:' + n.counselor_id})
+DETACH DELETE apt, n, stats
+RETURN count(*) as deleted
+"""
+
+async def attempt(slot_id: str, counselor_id: str, submission_id: str, i: int) -> int:
+    request = AppointmentBookRequest(
+        submission_id=submission_id,
+        counselor_id=counselor_id,
+        slot_id=slot_id,
+        client_details=ClientDetails(
+            full_name=f"Student {i}",
+            email=f"stress-student-{i}@msu.edu.ph",
+            course="BS Computer Science",
+            year_level="2nd Year",
+            gender="Female",
+            age=19
+        )
+    )
+    try:
+        await appointment_service.book_appointment(request)
+        return 200
+    except HTTPException as e:
+        return e.status_code
+
+async def run_round(bookers: int, round_no: int) -> Counter:
+    counselor_id = str(uuid.uuid4())
+    slot_id = str(uuid.uuid4())
+    submission_ids = [str(uuid.uuid4()) for _ in range(bookers)]
+
+    await neo4j_service.execute_write(SETUP_QUERY, {
+        "counselor_id": counselor_id,
+        "email": f"stress-{counselor_id}@msu.edu.ph",
+        "slot_id": slot_id,
+        "date": (date.today() + timedelta(days=30 + round_no)).isoformat(),
+        "submission_ids": submission_ids
+    })
+
+    started = time.perf_counter()
+    codes = await asyncio.gather(*(
+        attempt(slot_id, counselor_id, submission_id, i)
+        for i, submission_id in enumerate(submission_ids)
+    ))
+    elapsed = time.perf_counter() - started
+
+    outcome = Counter(codes)
+    print(f"round {round_no}: {dict(outcome)} in {elapsed * 1000:.0f} ms")
+    return outcome
+
+async def run(bookers: int, rounds: int) -> bool:
+    ok = True
+    try:
+        for round_no in range(1, rounds + 1):
+            outcome = await run_round(bookers, round_no)
+            if outcome[200] != 1 or outcome[409] != bookers - 1:
+                ok = False
+    finally:
+        await neo4j_service.execute_write(CLEANUP_QUERY)
+        await neo4j_service.close()
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bookers", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    if asyncio.run(run(args.bookers, args.rounds)):
+        print("✅ Exactly one booking per slot in every round")
+    else:
+        print("❌ Double booking or unexpected failure detected")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,62 @@ from functools import lru_cache
 from typing import List
 
 class Settings(BaseSettings):
+    # Storage backend: "neo4j", or "memory" for offline benchmarks (see repositories/)
+    REPOSITORY_BACKEND: str = "neo4j"
+    
     # Neo4j Aura Configuration
     NEO4J_URI: str
     NEO4J_USERNAME: str
     NEO4J_PASSWORD: str
     NEO4J_DATABASE: str = "neo4j"
+    NEO4J_MAX_POOL_SIZE: int = 100
+    NEO4J_WARMUP_CONNECTIONS: int = 5  # opened concurrently during startup
+    NEO4J_RETRY_DEADLINE_SECONDS: float = 10.0  # total budget for one query's retries
+    NEO4J_RETRY_BASE_DELAY_SECONDS: float = 0.1
+    NEO4J_RETRY_MAX_DELAY_SECONDS: float = 2.0
+    NEO4J_BREAKER_FAILURE_THRESHOLD: int = 5
+    NEO4J_BREAKER_RESET_SECONDS: float = 15.0
+    
+    # Query diagnostics (see services/queries.py for the query names)
+    SLOW_QUERY_THRESHOLD_MS: float = 500.0
+    QUERY_PROFILE_SAMPLE_RATE: float = 0.0  # debug: fraction of named queries run under PROFILE
+    QUERY_PROFILE_LOG_PATH: str = "data/query_profiles.log"
+    QUERY_PROFILE_LOG_MAX_BYTES: int = 5_000_000
+    QUERY_PROFILE_LOG_BACKUPS: int = 3
+    SCHEMA_MIGRATE_ON_STARTUP: bool = True
+    
+    # Caching
+    AVAILABILITY_CACHE_TTL_SECONDS: float = 30.0
+    AVAILABILITY_CACHE_SIZE: int = 512  # distinct dates kept, per worker
+    TOKEN_CACHE_SIZE: int = 4096
+    COUNSELOR_DIRECTORY_TTL_SECONDS: float = 30.0
+    STATUS_MISS_CACHE_TTL_SECONDS: float = 5.0  # emails with no appointments, per worker
+    STATUS_MISS_CACHE_SIZE: int = 10000
+    OPEN_SLOT_INDEX_REFRESH_SECONDS: float = 60.0  # reload picks up other workers' slot changes
+    
+    # Write-behind assessment submissions (one WAL file per worker process)
+    SUBMISSION_WRITE_BEHIND: bool = False
+    SUBMISSION_WAL_PATH: str = "data/submissions.wal"
+    SUBMISSION_FLUSH_BATCH_SIZE: int = 500
+    SUBMISSION_FLUSH_INTERVAL_SECONDS: float = 1.0
+    SUBMISSION_WAL_COMMIT_WINDOW_MS: float = 2.0
+    
+    # Assessment scoring (see utils/scoring.py SCORING_RULES)
+    SCORING_VERSION: int = 1
+    SCORING_RULES_FILE: str = ""  # optional JSON with extra versions
     
     # JWT Configuration
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
     
+    # Password hashing and login throttling
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 16  # running + queued bcrypt calls before 503
+    LOGIN_THROTTLE_WINDOW_SECONDS: int = 900
+    LOGIN_MAX_FAILURES_PER_ACCOUNT: int = 5
+    LOGIN_MAX_ATTEMPTS_PER_IP: int = 30
+    
     # Email/Notification Service (Optional)
     SMTP_HOST: str = ""
     SMTP_PORT: int = 587
@@ -1,8 +1,15 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from config import get_settings
 from routers import assessment, appointment, admin
 from services.neo4j_service import neo4j_service
+from services.schema_service import schema_service
+from services.assessment_service import submission_buffer
+from services.open_slot_index import open_slot_index
+from utils.metrics import MetricsMiddleware, event_loop_lag, metrics
+import asyncio
 import logging
 
 # Configure logging
@@ -11,10 +18,73 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+STARTUP_RETRY_SECONDS = 5.0
+
+# The in-memory backend (REPOSITORY_BACKEND=memory) never opens a driver
+uses_neo4j = settings.REPOSITORY_BACKEND == "neo4j"
+
+async def prepare(app: FastAPI):
+    """
+    Warm the connection pool, apply migrations, load the open slot index
+    and start the write-behind buffer. Runs in the background so the
+    process starts serving (and answering liveness probes) before the
+    database is reachable; readiness flips once this succeeds, retrying
+    until it does.
+    """
+    while True:
+        try:
+            if uses_neo4j:
+                await neo4j_service.warm_up(settings.NEO4J_WARMUP_CONNECTIONS)
+                logger.info("📊 Neo4j connection verified")
+            if uses_neo4j and settings.SCHEMA_MIGRATE_ON_STARTUP:
+                version = await schema_service.apply_migrations()
+                logger.info(f"🗂️ Schema at version {version}")
+            open_slots = await open_slot_index.start()
+            logger.info(f"🗓️ Open slot index loaded ({open_slots} slots)")
+            # Last: it replays the log and starts a flusher, so a failed pass
+            # must not have started it already
+            if settings.SUBMISSION_WRITE_BEHIND and not submission_buffer.running:
+                replayed = await submission_buffer.start()
+                logger.info(f"📝 Write-behind submissions enabled ({replayed} replayed)")
+            app.state.startup_error = None
+            app.state.ready = True
+            return
+        except Exception as e:
+            app.state.startup_error = str(e)
+            logger.error(f"❌ Startup preparation failed, retrying in {STARTUP_RETRY_SECONDS:.0f}s: {e}")
+            await asyncio.sleep(STARTUP_RETRY_SECONDS)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("🚀 Starting Guidance and Counseling System API")
+    if uses_neo4j:
+        neo4j_service.open()
+    else:
+        logger.info(f"🧪 Using the {settings.REPOSITORY_BACKEND} repository backend")
+    app.state.ready = False
+    app.state.startup_error = None
+    preparing = asyncio.create_task(prepare(app))
+    event_loop_lag.start()
+    try:
+        yield
+    finally:
+        preparing.cancel()
+        try:
+            await preparing
+        except asyncio.CancelledError:
+            pass
+        await event_loop_lag.stop()
+        await submission_buffer.stop()
+        await open_slot_index.stop()
+        await neo4j_service.close()
+        logger.info("👋 Shutting down API")
+
 app = FastAPI(
     title="Guidance and Counseling System API",
     description="Anonymous Self-Assessment & Non-Authenticated Appointment Scheduling",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS Configuration
@@ -26,21 +96,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency histograms (outermost, so CORS handling is included)
+app.add_middleware(MetricsMiddleware)
+
+def collect_submission_buffer():
+    if not submission_buffer.running:
+        return []
+    stats = submission_buffer.metrics()
+    return [
+        ("submission_buffer_queue_depth", "gauge", "Submissions waiting to be flushed", [({}, stats["queue_depth"])]),
+        ("submission_buffer_flushed_total", "counter", "Submissions written to Neo4j", [({}, stats["flushed"])]),
+        ("submission_buffer_flush_failures_total", "counter", "Failed flush attempts", [({}, stats["flush_failures"])]),
+        ("submission_buffer_flush_last_seconds", "gauge", "Duration of the most recent batch write", [({}, submission_buffer.last_flush_ms / 1000)]),
+        ("submission_buffer_flush_max_seconds", "gauge", "Slowest batch write since start", [({}, submission_buffer.max_flush_ms / 1000)]),
+    ]
+
+metrics.register(collect_submission_buffer)
+
 # Include Routers
 app.include_router(assessment.router, prefix="/assessment", tags=["Assessment"])
 app.include_router(appointment.router, prefix="/appointment", tags=["Appointment"])
 app.include_router(admin.router, prefix="/admin", tags=["Admin"])
 
-@app.on_event("startup")
-async def startup_event():
-    logger.info("🚀 Starting Guidance and Counseling System API")
-    logger.info("📊 Neo4j connection verified")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    neo4j_service.close()
-    logger.info("👋 Shutting down API")
-
 @app.get("/")
 async def root():
     return {
@@ -50,5 +127,40 @@ async def root():
     }
 
 @app.get("/health")
-async def health_check():
-    return {"status": "healthy", "database": "connected"}
+async def health_check(request: Request):
+    ready = getattr(request.app.state, "ready", False)
+    health = {"status": "healthy", "database": "connected" if ready else "connecting"}
+    if uses_neo4j:
+        health["neo4j"] = neo4j_service.metrics()
+    else:
+        health["database"] = settings.REPOSITORY_BACKEND
+    if submission_buffer.running:
+        health["submission_buffer"] = submission_buffer.metrics()
+    if open_slot_index.loaded:
+        health["open_slot_index"] = open_slot_index.stats()
+    return health
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    """Prometheus text exposition format"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/health/live")
+async def liveness():
+    """The process is up and serving; never touches the database"""
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+async def readiness(request: Request):
+    """503 until the pool is warm and migrations have run, or if the write-behind flusher has died"""
+    if not getattr(request.app.state, "ready", False):
+        return ORJSONResponse(
+            {"status": "starting", "error": getattr(request.app.state, "startup_error", None)},
+            status_code=503
+        )
+    if submission_buffer.running and not submission_buffer.healthy:
+        return ORJSONResponse(
+            {"status": "degraded", "error": "Submission flusher stopped"},
+            status_code=503
+        )
+    return {"status": "ready"}
@@ -34,6 +34,20 @@ class AssessmentSubmitResponse(BaseModel):
     recommendation: str
     timestamp: datetime
 
+class AssessmentBatchItem(BaseModel):
+    client_submission_id: str = Field(..., min_length=8, max_length=64, description="Client-generated idempotency key (UUID)")
+    answers: AssessmentAnswers
+
+class AssessmentBatchSubmitRequest(BaseModel):
+    items: List[AssessmentBatchItem] = Field(..., min_length=1, max_length=500)
+
+class AssessmentBatchItemResult(AssessmentSubmitResponse):
+    client_submission_id: str
+    created: bool  # False when this id had already been uploaded
+
+class AssessmentBatchSubmitResponse(BaseModel):
+    results: List[AssessmentBatchItemResult]
+
 # ============= APPOINTMENT SCHEMAS =============
 class ClientDetails(BaseModel):
     full_name: str = Field(..., min_length=2, max_length=100)
@@ -120,14 +134,51 @@ class UpdateAppointmentStatusRequest(BaseModel):
     counselor_notes: Optional[str] = None
     rejection_reason: Optional[str] = None
 
+class AvailableSlot(BaseModel):
+    slot_id: str
+    date: date
+    start_time: time
+    end_time: time
+
 class CounselorAvailability(BaseModel):
     counselor_id: str
     full_name: str
     specialization: str
     email: str
-    available_slots: List[dict]
+    available_slots: List[AvailableSlot]
+
+class FreeWindow(BaseModel):
+    start_time: str  # HH:MM, at the exact slot boundaries
+    end_time: str
+
+class CounselorFreeWindows(BaseModel):
+    counselor_id: str
+    full_name: str
+    specialization: str
+    windows: List[FreeWindow]
+
+class NextAvailableSlot(BaseModel):
+    slot_id: str
+    date: str
+    start_time: str
+    end_time: str
+    counselor_id: str
+    counselor_name: str
+    specialization: str
 
 class TimeSlotCreate(BaseModel):
     date: date
     start_time: time
     end_time: time
+
+class SlotRecurrence(BaseModel):
+    start_date: date
+    end_date: date
+    weekdays: List[int] = Field(..., description="0=Monday ... 6=Sunday")
+    hours: List[int] = Field(..., description="Slot start hours, 0-23")
+    duration_minutes: int = Field(60, ge=15, le=480)
+    exception_dates: List[date] = Field(default_factory=list, description="Dates to skip (holidays)")
+
+class TimeSlotBulkCreate(BaseModel):
+    slots: List[TimeSlotCreate] = Field(default_factory=list)
+    recurrence: Optional[SlotRecurrence] = None
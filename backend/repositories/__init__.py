@@ -0,0 +1,48 @@
+"""
+Data access for the services, one repository per aggregate.
+
+REPOSITORY_BACKEND picks the implementation behind the singletons below:
+"neo4j" runs the named statements in services/queries.py, "memory" keeps
+everything in indexed in-process structures so the full API can be
+benchmarked and load-tested without a database. Both must pass
+tests/test_repositories.py.
+"""
+
+from config import get_settings
+from repositories.base import (
+    AppointmentRepository, AssessmentRepository, CounselorRepository, SlotRepository
+)
+
+settings = get_settings()
+
+BACKENDS = ("neo4j", "memory")
+
+def create_repositories(backend: str) -> tuple:
+    """(assessments, counselors, slots, appointments) for `backend`, sharing one store"""
+    if backend == "neo4j":
+        from repositories.neo4j_repository import (
+            Neo4jAppointmentRepository, Neo4jAssessmentRepository,
+            Neo4jCounselorRepository, Neo4jSlotRepository
+        )
+        return (
+            Neo4jAssessmentRepository(),
+            Neo4jCounselorRepository(),
+            Neo4jSlotRepository(),
+            Neo4jAppointmentRepository()
+        )
+    if backend == "memory":
+        from repositories.memory_repository import (
+            MemoryAppointmentRepository, MemoryAssessmentRepository,
+            MemoryCounselorRepository, MemoryGraph, MemorySlotRepository
+        )
+        graph = MemoryGraph()
+        return (
+            MemoryAssessmentRepository(graph),
+            MemoryCounselorRepository(graph),
+            MemorySlotRepository(graph),
+            MemoryAppointmentRepository(graph)
+        )
+    raise ValueError(f"Unknown repository backend {backend!r} (expected one of {', '.join(BACKENDS)})")
+
+assessment_repository, counselor_repository, slot_repository, appointment_repository = \
+    create_repositories(settings.REPOSITORY_BACKEND)
@@ -0,0 +1,198 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import AsyncIterator, List, Optional
+
+# Rows are plain dicts shaped like the API responses, with dates, times and
+# datetimes as ISO strings (times and datetimes UTC with a "Z" suffix), so
+# services can return them as-is whichever backend produced them.
+#
+# `after` is a decoded pagination cursor: the sort key of the last row of
+# the previous page, as a list of those strings. `limit` None means no limit.
+
+class AssessmentRepository(ABC):
+    """AssessmentSubmission nodes, their dashboard counters and daily rollups"""
+
+    @abstractmethod
+    async def add(self, submission: dict) -> None:
+        """Store one scored submission and count it on the dashboard and in its day bucket"""
+
+    @abstractmethod
+    async def add_batch(self, submissions: List[dict]) -> List[dict]:
+        """
+        Store many submissions keyed by client_submission_id. Ids already
+        stored create nothing and come back with created = false.
+        """
+
+    @abstractmethod
+    async def page(
+        self,
+        limit: int,
+        stress_level: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        after: Optional[list] = None
+    ) -> List[dict]:
+        """Up to `limit` submissions newest first, keyed (timestamp, submission_id)"""
+
+    @abstractmethod
+    async def stress_counts(self) -> dict:
+        """total_assessments and low/moderate/high_stress counts over every submission"""
+
+    @abstractmethod
+    async def rollup_summary(self, days: Optional[int]) -> dict:
+        """Count, score sums and stress counts over the last `days` days (None: all time)"""
+
+    @abstractmethod
+    async def rollup_days(self, days: Optional[int]) -> List[dict]:
+        """One row per day with submissions in the last `days` days, oldest first"""
+
+class CounselorRepository(ABC):
+    """Counselor accounts"""
+
+    @abstractmethod
+    async def by_email(self, email: str) -> Optional[dict]:
+        """counselor_id, full_name, email and password_hash, or None"""
+
+    @abstractmethod
+    async def create(self, counselor: dict) -> str:
+        """Store a new counselor; fails if the email or id is already taken"""
+
+    @abstractmethod
+    async def directory(self) -> List[dict]:
+        """counselor_id, email, full_name and specialization of every counselor"""
+
+    @abstractmethod
+    async def list_all(self) -> List[dict]:
+        """Every counselor without the password hash, ordered by full_name"""
+
+    @abstractmethod
+    async def delete(self, counselor_id: str) -> bool:
+        """
+        Remove a counselor and their counters. Their slots and appointments
+        stay stored but no longer belong to anyone.
+        """
+
+class SlotRepository(ABC):
+    """TimeSlot nodes of each counselor"""
+
+    @abstractmethod
+    async def available(self, target_date: Optional[date] = None) -> List[dict]:
+        """Counselors with open slots, each with its open slots in schedule order"""
+
+    @abstractmethod
+    async def create(self, counselor_id: str, slot: dict) -> Optional[dict]:
+        """
+        Open one slot (slot_id, date, start_time, end_time) unless it overlaps
+        another slot of the counselor that day (slots that only touch do not).
+        Returns slot_id and overlaps (True when nothing was created), or None
+        if the counselor is unknown.
+        """
+
+    @abstractmethod
+    async def create_bulk(self, counselor_id: str, slots: List[dict]) -> Optional[List[dict]]:
+        """
+        Open every slot atomically unless one overlaps an existing slot of
+        the counselor, by the same rule as create(). Returns the conflicts
+        (empty when the slots were created), or None if the counselor is
+        unknown.
+        """
+
+    @abstractmethod
+    async def delete(self, slot_id: str) -> bool:
+        """Delete a slot no appointment occupies"""
+
+    @abstractmethod
+    async def day_bitmaps(self, target_date: date) -> List[dict]:
+        """
+        counselor_id, full_name, specialization and the quarter-hour bitmaps
+        open (available slots) and booked (occupied slots) of each counselor
+        with a bitmap on the date; see utils/day_bitmap.py. Every slot
+        change keeps them in step with the slots. open_slots holds the exact
+        start_time and end_time of the available slots.
+        """
+
+    @abstractmethod
+    async def page(
+        self,
+        counselor_id: str,
+        limit: Optional[int],
+        available: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        after: Optional[list] = None
+    ) -> List[dict]:
+        """Slots in schedule order keyed (date, start_time, slot_id), with their occupying appointment"""
+
+    @abstractmethod
+    def stream(
+        self,
+        counselor_id: str,
+        available: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        after: Optional[list] = None
+    ) -> AsyncIterator[dict]:
+        """Every row page() would return, without a limit, one at a time"""
+
+class AppointmentRepository(ABC):
+    """Appointment nodes, their links and per-counselor status counters"""
+
+    @abstractmethod
+    async def book(self, appointment: dict) -> dict:
+        """
+        Book a slot for a submission, atomically: of any number of concurrent
+        calls for one open slot exactly one gets outcome 'booked'. Others get
+        'submission_not_found', 'slot_not_found', 'counselor_not_found' or
+        'slot_unavailable'. Also returns scheduled_date, scheduled_time and
+        counselor_name.
+
+        `appointment` holds appointment_id, submission_id, counselor_id,
+        slot_id and the client_* fields. The client is stored once per
+        client_email (already normalized by the caller) and linked to the
+        appointment; a later booking's details replace the stored ones.
+        """
+
+    @abstractmethod
+    async def by_client_email(self, email: str) -> List[dict]:
+        """A client's appointments, most recently created first, found through the client"""
+
+    @abstractmethod
+    async def detail(self, appointment_id: str) -> Optional[dict]:
+        """An appointment with its client details and linked assessment"""
+
+    @abstractmethod
+    async def update_status(
+        self,
+        appointment_id: str,
+        status: str,
+        counselor_notes: str,
+        rejection_reason: str
+    ) -> Optional[dict]:
+        """appointment_id, status and client_email after the update, or None if unknown"""
+
+    @abstractmethod
+    async def status_counts(self, counselor_id: str) -> dict:
+        """total_appointments and pending/confirmed/rejected/completed_appointments"""
+
+    @abstractmethod
+    async def page(
+        self,
+        counselor_id: str,
+        limit: Optional[int],
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        after: Optional[list] = None
+    ) -> List[dict]:
+        """A counselor's appointments, latest schedule first, keyed (scheduled_date, scheduled_time, appointment_id)"""
+
+    @abstractmethod
+    def stream(
+        self,
+        counselor_id: str,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        after: Optional[list] = None
+    ) -> AsyncIterator[dict]:
+        """Every row page() would return, without a limit, one at a time"""
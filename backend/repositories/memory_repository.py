@@ -0,0 +1,644 @@
+from repositories.base import (
+    AppointmentRepository, AssessmentRepository, CounselorRepository, SlotRepository
+)
+from utils.day_bitmap import time_mask
+from datetime import date, datetime, time, timedelta, timezone
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+
+STRESS_FIELDS = {"Low": "low_stress", "Moderate": "moderate_stress", "High": "high_stress"}
+STATUS_FIELDS = {
+    "Pending": "pending_appointments",
+    "Confirmed": "confirmed_appointments",
+    "Rejected": "rejected_appointments",
+    "Completed": "completed_appointments",
+}
+
+# Temporal values are stored as naive UTC Python objects and rendered the
+# way Neo4j's toString() renders its zoned types
+
+def _time_str(value: time) -> str:
+    return value.isoformat() + "Z"
+
+def _datetime_str(value: datetime) -> str:
+    return value.isoformat() + "Z"
+
+def _parse_time(value: str) -> time:
+    return time.fromisoformat(value.removesuffix("Z")).replace(tzinfo=None)
+
+def _parse_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value.removesuffix("Z"))
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def _remove(keys: list, key: tuple):
+    index = bisect_left(keys, key)
+    if index < len(keys) and keys[index] == key:
+        del keys[index]
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+class MemoryGraph:
+    """
+    The whole data set in process memory, with the indexes the Neo4j schema
+    provides (unique ids and emails, timestamp and date ranges) kept as
+    dicts and sorted key lists, and the dashboard counters, daily rollups
+    and per-day slot bitmaps maintained as the data changes.
+
+    Repository methods never await while reading or changing it, so each
+    call is atomic with respect to every other coroutine on the event loop.
+    That is what makes booking race-free here; it is single-process only.
+    """
+    def __init__(self):
+        self.submissions: Dict[str, dict] = {}
+        self.submission_ids_by_client: Dict[str, str] = {}
+        # Sorted (timestamp, submission_id), overall and per stress level
+        self.submission_keys: List[tuple] = []
+        self.submission_keys_by_stress: Dict[str, List[tuple]] = {}
+        self.assessment_counts = {"total_assessments": 0, "low_stress": 0, "moderate_stress": 0, "high_stress": 0}
+        self.rollups: Dict[date, dict] = {}
+
+        self.counselors: Dict[str, dict] = {}
+        self.counselor_ids_by_email: Dict[str, str] = {}
+
+        self.slots: Dict[str, dict] = {}
+        # Per counselor, sorted (date, start_time, slot_id); all and open only
+        self.slot_keys: Dict[str, List[tuple]] = {}
+        self.open_slot_keys: Dict[str, List[tuple]] = {}
+        self.slot_occupants: Dict[str, str] = {}
+        # Per date and counselor, [open, booked] quarter-hour bitmaps
+        self.day_bitmaps: Dict[date, Dict[str, List[int]]] = {}
+
+        self.appointments: Dict[str, dict] = {}
+        # Per counselor, sorted (scheduled_date, scheduled_time, appointment_id)
+        self.appointment_keys: Dict[str, List[tuple]] = {}
+        self.appointment_counts: Dict[str, dict] = {}
+
+        # Client details by email, each with its appointment ids in booking
+        # order (the HAS_APPOINTMENT edges); appointments keep only the email
+        self.clients: Dict[str, dict] = {}
+
+    # -- Submissions --------------------------------------------------------
+
+    def add_submission(self, submission: dict) -> dict:
+        stored = dict(submission, timestamp=_parse_datetime(submission["timestamp"]))
+        submission_id = stored["submission_id"]
+        if submission_id in self.submissions:
+            raise ValueError(f"Submission {submission_id} already exists")
+        self.submissions[submission_id] = stored
+        if stored.get("client_submission_id") is not None:
+            self.submission_ids_by_client[stored["client_submission_id"]] = submission_id
+
+        key = (stored["timestamp"], submission_id)
+        insort(self.submission_keys, key)
+        insort(self.submission_keys_by_stress.setdefault(stored["stress_level"], []), key)
+
+        stress_field = STRESS_FIELDS.get(stored["stress_level"])
+        self.assessment_counts["total_assessments"] += 1
+        if stress_field:
+            self.assessment_counts[stress_field] += 1
+
+        rollup = self.rollups.setdefault(stored["timestamp"].date(), {
+            "count": 0, "score_sum": 0.0, "score_sq_sum": 0.0,
+            "low_stress": 0, "moderate_stress": 0, "high_stress": 0
+        })
+        score = stored["overall_score"]
+        rollup["count"] += 1
+        rollup["score_sum"] += score
+        rollup["score_sq_sum"] += score * score
+        if stress_field:
+            rollup[stress_field] += 1
+        return stored
+
+    # -- Slots --------------------------------------------------------------
+
+    def add_slot(self, counselor_id: str, slot: dict) -> dict:
+        stored = {
+            "slot_id": slot["slot_id"],
+            "counselor_id": counselor_id,
+            "date": date.fromisoformat(slot["date"]),
+            "start_time": _parse_time(slot["start_time"]),
+            "end_time": _parse_time(slot["end_time"]),
+            "is_available": True
+        }
+        if stored["slot_id"] in self.slots:
+            raise ValueError(f"Time slot {stored['slot_id']} already exists")
+        self.slots[stored["slot_id"]] = stored
+        key = self.slot_key(stored)
+        insort(self.slot_keys.setdefault(counselor_id, []), key)
+        insort(self.open_slot_keys.setdefault(counselor_id, []), key)
+        bitmaps = self.day_bitmaps.setdefault(stored["date"], {}).setdefault(counselor_id, [0, 0])
+        bitmaps[0] |= time_mask(stored["start_time"], stored["end_time"])
+        return stored
+
+    def refresh_day(self, counselor_id: str, day: date):
+        """Recompute a counselor-day's bitmaps from its slots after one changed"""
+        open_bits = booked_bits = 0
+        for ts in self.day_slots(counselor_id, day):
+            if ts["is_available"]:
+                open_bits |= time_mask(ts["start_time"], ts["end_time"])
+            else:
+                booked_bits |= time_mask(ts["start_time"], ts["end_time"])
+        self.day_bitmaps.setdefault(day, {})[counselor_id] = [open_bits, booked_bits]
+
+    def day_slots(self, counselor_id: str, day: date) -> List[dict]:
+        """A counselor's slots on a day, earliest first"""
+        keys = self.slot_keys.get(counselor_id, [])
+        return [self.slots[slot_id] for _, _, slot_id in keys[bisect_left(keys, (day,)):bisect_left(keys, (day + timedelta(days=1),))]]
+
+    def overlapping_slot(self, counselor_id: str, day: date, start: time, end: time) -> Optional[str]:
+        """
+        A slot of the counselor overlapping start-end on the day, if any.
+        The day's bitmaps rule out most days without looking at the slots;
+        the exact times decide, so slots that only touch do not overlap.
+        """
+        open_bits, booked_bits = self.day_bitmaps.get(day, {}).get(counselor_id, (0, 0))
+        if not (open_bits | booked_bits) & time_mask(start, end):
+            return None
+        return next(
+            (ts["slot_id"] for ts in self.day_slots(counselor_id, day) if ts["start_time"] < end and ts["end_time"] > start),
+            None
+        )
+
+    @staticmethod
+    def slot_key(slot: dict) -> tuple:
+        return (slot["date"], slot["start_time"], slot["slot_id"])
+
+    @staticmethod
+    def appointment_key(appointment: dict) -> tuple:
+        return (appointment["scheduled_date"], appointment["scheduled_time"], appointment["appointment_id"])
+
+    def count_appointment(self, counselor_id: str, old_status: Optional[str], new_status: str):
+        counts = self.appointment_counts.setdefault(counselor_id, {
+            "total_appointments": 0, "pending_appointments": 0, "confirmed_appointments": 0,
+            "rejected_appointments": 0, "completed_appointments": 0
+        })
+        if old_status is None:
+            counts["total_appointments"] += 1
+        elif old_status in STATUS_FIELDS:
+            counts[STATUS_FIELDS[old_status]] -= 1
+        if new_status in STATUS_FIELDS:
+            counts[STATUS_FIELDS[new_status]] += 1
+
+class MemoryAssessmentRepository(AssessmentRepository):
+
+    def __init__(self, graph: MemoryGraph):
+        self.graph = graph
+
+    async def add(self, submission: dict) -> None:
+        self.graph.add_submission(submission)
+
+    async def add_batch(self, submissions: List[dict]) -> List[dict]:
+        results = []
+        for submission in submissions:
+            existing_id = self.graph.submission_ids_by_client.get(submission["client_submission_id"])
+            if existing_id:
+                stored, created = self.graph.submissions[existing_id], False
+            else:
+                stored, created = self.graph.add_submission(submission), True
+            results.append({
+                "client_submission_id": stored["client_submission_id"],
+                "submission_id": stored["submission_id"],
+                "created": created,
+                "timestamp": _datetime_str(stored["timestamp"]),
+                "section1_score": stored["section1_score"],
+                "section2_score": stored["section2_score"],
+                "section3_score": stored["section3_score"],
+                "overall_score": stored["overall_score"],
+                "stress_level": stored["stress_level"],
+                "recommendation": stored["recommendation"]
+            })
+        return results
+
+    async def page(self, limit, stress_level=None, start_date=None, end_date=None, after=None):
+        if stress_level:
+            keys = self.graph.submission_keys_by_stress.get(stress_level, [])
+        else:
+            keys = self.graph.submission_keys
+
+        low = bisect_left(keys, (datetime.combine(start_date, time()),)) if start_date else 0
+        high = bisect_left(keys, (datetime.combine(end_date + timedelta(days=1), time()),)) if end_date else len(keys)
+        if after:
+            high = min(high, bisect_left(keys, (_parse_datetime(after[0]), after[1])))
+
+        rows = []
+        for index in range(high - 1, max(low, high - limit) - 1, -1):
+            a = self.graph.submissions[keys[index][1]]
+            rows.append({
+                "submission_id": a["submission_id"],
+                "timestamp": _datetime_str(a["timestamp"]),
+                "overall_score": a["overall_score"],
+                "stress_level": a["stress_level"],
+                "recommendation": a["recommendation"]
+            })
+        return rows
+
+    async def stress_counts(self) -> dict:
+        return dict(self.graph.assessment_counts)
+
+    def _rollups(self, days: Optional[int]) -> list:
+        since = _utcnow().date() - timedelta(days=days) if days is not None else None
+        return sorted(
+            (day, rollup) for day, rollup in self.graph.rollups.items()
+            if since is None or day > since
+        )
+
+    async def rollup_summary(self, days: Optional[int]) -> dict:
+        summary = {
+            "total_assessments": 0, "score_sum": 0.0, "score_sq_sum": 0.0,
+            "low_stress": 0, "moderate_stress": 0, "high_stress": 0
+        }
+        for _, rollup in self._rollups(days):
+            summary["total_assessments"] += rollup["count"]
+            summary["score_sum"] += rollup["score_sum"]
+            summary["score_sq_sum"] += rollup["score_sq_sum"]
+            for field in STRESS_FIELDS.values():
+                summary[field] += rollup[field]
+        return summary
+
+    async def rollup_days(self, days: Optional[int]) -> List[dict]:
+        return [
+            {
+                "day": day.isoformat(),
+                "total_assessments": rollup["count"],
+                "average_score": rollup["score_sum"] / rollup["count"],
+                "low_stress": rollup["low_stress"],
+                "moderate_stress": rollup["moderate_stress"],
+                "high_stress": rollup["high_stress"]
+            }
+            for day, rollup in self._rollups(days)
+        ]
+
+class MemoryCounselorRepository(CounselorRepository):
+
+    def __init__(self, graph: MemoryGraph):
+        self.graph = graph
+
+    async def by_email(self, email: str) -> Optional[dict]:
+        counselor_id = self.graph.counselor_ids_by_email.get(email)
+        if counselor_id is None:
+            return None
+        c = self.graph.counselors[counselor_id]
+        return {
+            "counselor_id": c["counselor_id"],
+            "full_name": c["full_name"],
+            "email": c["email"],
+            "password_hash": c["password_hash"]
+        }
+
+    async def create(self, counselor: dict) -> str:
+        # Same uniqueness rules as the counselor_email/counselor_id constraints
+        if counselor["email"] in self.graph.counselor_ids_by_email:
+            raise ValueError(f"A counselor with email {counselor['email']} already exists")
+        if counselor["counselor_id"] in self.graph.counselors:
+            raise ValueError(f"Counselor {counselor['counselor_id']} already exists")
+        self.graph.counselors[counselor["counselor_id"]] = dict(counselor, created_at=_utcnow())
+        self.graph.counselor_ids_by_email[counselor["email"]] = counselor["counselor_id"]
+        return counselor["counselor_id"]
+
+    async def directory(self) -> List[dict]:
+        return [
+            {
+                "counselor_id": c["counselor_id"],
+                "email": c["email"],
+                "full_name": c["full_name"],
+                "specialization": c["specialization"]
+            }
+            for c in self.graph.counselors.values()
+        ]
+
+    async def list_all(self) -> List[dict]:
+        return [
+            {
+                "counselor_id": c["counselor_id"],
+                "full_name": c["full_name"],
+                "email": c["email"],
+                "employee_id": c["employee_id"],
+                "specialization": c["specialization"],
+                "created_at": _datetime_str(c["created_at"])
+            }
+            for c in sorted(self.graph.counselors.values(), key=lambda c: c["full_name"])
+        ]
+
+    async def delete(self, counselor_id: str) -> bool:
+        graph = self.graph
+        counselor = graph.counselors.pop(counselor_id, None)
+        if counselor is None:
+            return False
+        graph.counselor_ids_by_email.pop(counselor["email"], None)
+        graph.appointment_counts.pop(counselor_id, None)
+
+        # Like DETACH DELETE: slots and appointments survive without their
+        # counselor; the day bitmaps go with the counselor
+        for slot_date, _, slot_id in graph.slot_keys.pop(counselor_id, []):
+            graph.slots[slot_id]["counselor_id"] = None
+            graph.day_bitmaps.get(slot_date, {}).pop(counselor_id, None)
+        graph.open_slot_keys.pop(counselor_id, None)
+        for _, _, appointment_id in graph.appointment_keys.pop(counselor_id, []):
+            graph.appointments[appointment_id]["counselor_id"] = None
+        return True
+
+class MemorySlotRepository(SlotRepository):
+
+    def __init__(self, graph: MemoryGraph):
+        self.graph = graph
+
+    async def available(self, target_date: Optional[date] = None) -> List[dict]:
+        results = []
+        for counselor_id, keys in self.graph.open_slot_keys.items():
+            if target_date:
+                keys = keys[bisect_left(keys, (target_date,)):bisect_left(keys, (target_date + timedelta(days=1),))]
+            if not keys:
+                continue
+            c = self.graph.counselors[counselor_id]
+            results.append({
+                "counselor_id": c["counselor_id"],
+                "full_name": c["full_name"],
+                "specialization": c["specialization"],
+                "email": c["email"],
+                "available_slots": [
+                    {
+                        "slot_id": slot_id,
+                        "date": slot_date.isoformat(),
+                        "start_time": _time_str(start_time),
+                        "end_time": _time_str(self.graph.slots[slot_id]["end_time"])
+                    }
+                    for slot_date, start_time, slot_id in keys
+                ]
+            })
+        return results
+
+    async def create(self, counselor_id: str, slot: dict) -> Optional[dict]:
+        if counselor_id not in self.graph.counselors:
+            return None
+        day = date.fromisoformat(slot["date"])
+        if self.graph.overlapping_slot(counselor_id, day, _parse_time(slot["start_time"]), _parse_time(slot["end_time"])):
+            return {"slot_id": slot["slot_id"], "overlaps": True}
+        return {"slot_id": self.graph.add_slot(counselor_id, slot)["slot_id"], "overlaps": False}
+
+    async def create_bulk(self, counselor_id: str, slots: List[dict]) -> Optional[List[dict]]:
+        if counselor_id not in self.graph.counselors:
+            return None
+        conflicts = []
+        for s in slots:
+            # The same rule as create()
+            existing = self.graph.overlapping_slot(
+                counselor_id, date.fromisoformat(s["date"]), _parse_time(s["start_time"]), _parse_time(s["end_time"])
+            )
+            if existing:
+                conflicts.append({
+                    "date": s["date"],
+                    "start_time": s["start_time"],
+                    "end_time": s["end_time"],
+                    "existing_slot_id": existing
+                })
+        if not conflicts:
+            for s in slots:
+                self.graph.add_slot(counselor_id, s)
+        return conflicts
+
+    async def delete(self, slot_id: str) -> bool:
+        graph = self.graph
+        slot = graph.slots.get(slot_id)
+        if slot is None or slot_id in graph.slot_occupants:
+            return False
+        del graph.slots[slot_id]
+        if slot["counselor_id"] is not None:
+            key = graph.slot_key(slot)
+            _remove(graph.slot_keys[slot["counselor_id"]], key)
+            _remove(graph.open_slot_keys[slot["counselor_id"]], key)
+            graph.refresh_day(slot["counselor_id"], slot["date"])
+        return True
+
+    async def day_bitmaps(self, target_date: date) -> List[dict]:
+        results = []
+        for counselor_id, (open_bits, booked_bits) in self.graph.day_bitmaps.get(target_date, {}).items():
+            c = self.graph.counselors[counselor_id]
+            results.append({
+                "counselor_id": counselor_id,
+                "full_name": c["full_name"],
+                "specialization": c["specialization"],
+                "open": open_bits,
+                "booked": booked_bits,
+                "open_slots": [
+                    {"start_time": _time_str(ts["start_time"]), "end_time": _time_str(ts["end_time"])}
+                    for ts in self.graph.day_slots(counselor_id, target_date) if ts["is_available"]
+                ]
+            })
+        return results
+
+    def _range(self, counselor_id, available, start_date, end_date, after) -> tuple:
+        """The counselor's sorted slot keys and the index range matching the filters"""
+        if available:
+            keys = self.graph.open_slot_keys.get(counselor_id, [])
+        else:
+            keys = self.graph.slot_keys.get(counselor_id, [])
+
+        low = bisect_left(keys, (start_date,)) if start_date else 0
+        high = bisect_left(keys, (end_date + timedelta(days=1),)) if end_date else len(keys)
+        if after:
+            low = max(low, bisect_right(keys, (date.fromisoformat(after[0]), _parse_time(after[1]), after[2])))
+        return keys, low, high
+
+    def _rows(self, keys: Iterable[tuple], available: Optional[bool]) -> Iterator[dict]:
+        graph = self.graph
+        for _, _, slot_id in keys:
+            ts = graph.slots.get(slot_id)
+            if ts is None or (available is not None and ts["is_available"] != available):
+                continue
+            apt = graph.appointments.get(graph.slot_occupants.get(slot_id))
+            yield {
+                "slot_id": slot_id,
+                "date": ts["date"].isoformat(),
+                "start_time": _time_str(ts["start_time"]),
+                "end_time": _time_str(ts["end_time"]),
+                "is_available": ts["is_available"],
+                "appointment_id": apt["appointment_id"] if apt else None,
+                "client_name": graph.clients[apt["client_email"]]["full_name"] if apt else None,
+                "appointment_status": apt["status"] if apt else None
+            }
+
+    async def page(self, counselor_id, limit, available=None, start_date=None, end_date=None, after=None):
+        keys, low, high = self._range(counselor_id, available, start_date, end_date, after)
+        rows = self._rows((keys[i] for i in range(low, high)), available)
+        return list(islice(rows, limit) if limit else rows)
+
+    async def stream(self, counselor_id, available=None, start_date=None, end_date=None, after=None) -> AsyncIterator[dict]:
+        # Iterate over a copy of the key range, so slots added or deleted
+        # while the consumer awaits cannot shift the iteration
+        keys, low, high = self._range(counselor_id, available, start_date, end_date, after)
+        for row in self._rows(keys[low:high], available):
+            yield row
+
+class MemoryAppointmentRepository(AppointmentRepository):
+
+    def __init__(self, graph: MemoryGraph):
+        self.graph = graph
+
+    async def book(self, appointment: dict) -> dict:
+        graph = self.graph
+        ts = graph.slots.get(appointment["slot_id"])
+        c = None
+        if ts is not None and ts["counselor_id"] == appointment["counselor_id"]:
+            c = graph.counselors.get(appointment["counselor_id"])
+        a = graph.submissions.get(appointment["submission_id"])
+
+        if a is None:
+            outcome = "submission_not_found"
+        elif ts is None:
+            outcome = "slot_not_found"
+        elif c is None:
+            outcome = "counselor_not_found"
+        elif not ts["is_available"]:
+            outcome = "slot_unavailable"
+        else:
+            outcome = "booked"
+
+        if outcome == "booked":
+            details = {
+                field[len("client_"):]: value for field, value in appointment.items() if field.startswith("client_")
+            }
+            apt = dict(
+                {field: value for field, value in appointment.items() if not field.startswith("client_")},
+                client_email=details["email"],
+                created_at=_utcnow(),
+                scheduled_date=ts["date"],
+                scheduled_time=ts["start_time"],
+                status="Pending",
+                counselor_notes="",
+                rejection_reason=None
+            )
+            graph.appointments[apt["appointment_id"]] = apt
+            insort(graph.appointment_keys.setdefault(c["counselor_id"], []), graph.appointment_key(apt))
+            client = graph.clients.setdefault(details["email"], {"appointment_ids": []})
+            client.update(details)
+            client["appointment_ids"].append(apt["appointment_id"])
+            graph.slot_occupants[ts["slot_id"]] = apt["appointment_id"]
+            ts["is_available"] = False
+            _remove(graph.open_slot_keys[c["counselor_id"]], graph.slot_key(ts))
+            graph.refresh_day(c["counselor_id"], ts["date"])
+            graph.count_appointment(c["counselor_id"], None, "Pending")
+
+        return {
+            "outcome": outcome,
+            "scheduled_date": ts["date"].isoformat() if ts else None,
+            "scheduled_time": _time_str(ts["start_time"]) if ts else None,
+            "counselor_name": c["full_name"] if c else None
+        }
+
+    async def by_client_email(self, email: str) -> List[dict]:
+        graph = self.graph
+        client = graph.clients.get(email)
+        if client is None:
+            return []
+        rows = []
+        # Newest booking first, like ORDER BY created_at DESC
+        for appointment_id in reversed(client["appointment_ids"]):
+            apt = graph.appointments[appointment_id]
+            c = graph.counselors.get(apt["counselor_id"])
+            if c is None:
+                continue
+            rows.append({
+                "appointment_id": apt["appointment_id"],
+                "status": apt["status"],
+                "scheduled_date": apt["scheduled_date"].isoformat(),
+                "scheduled_time": _time_str(apt["scheduled_time"]),
+                "created_at": _datetime_str(apt["created_at"]),
+                "counselor_notes": apt["counselor_notes"],
+                "rejection_reason": apt["rejection_reason"],
+                "counselor_name": c["full_name"],
+                "counselor_email": c["email"]
+            })
+        return rows
+
+    async def detail(self, appointment_id: str) -> Optional[dict]:
+        apt = self.graph.appointments.get(appointment_id)
+        if apt is None or apt["counselor_id"] not in self.graph.counselors:
+            return None
+        a = self.graph.submissions[apt["submission_id"]]
+        cl = self.graph.clients[apt["client_email"]]
+        return {
+            "appointment_id": apt["appointment_id"],
+            "status": apt["status"],
+            "scheduled_date": apt["scheduled_date"].isoformat(),
+            "scheduled_time": _time_str(apt["scheduled_time"]),
+            "created_at": _datetime_str(apt["created_at"]),
+            "counselor_notes": apt["counselor_notes"],
+            "rejection_reason": apt["rejection_reason"],
+            "client_full_name": cl["full_name"],
+            "client_email": cl["email"],
+            "client_student_id": cl["student_id"],
+            "client_course": cl["course"],
+            "client_year_level": cl["year_level"],
+            "client_gender": cl["gender"],
+            "client_age": cl["age"],
+            "client_contact_number": cl["contact_number"],
+            "assessment_submission_id": a["submission_id"],
+            "assessment_timestamp": _datetime_str(a["timestamp"]),
+            "section1_raw_answers": a["section1_raw_answers"],
+            "section2_raw_answers": a["section2_raw_answers"],
+            "section3_raw_answers": a["section3_raw_answers"],
+            "section1_score": a["section1_score"],
+            "section2_score": a["section2_score"],
+            "section3_score": a["section3_score"],
+            "overall_score": a["overall_score"],
+            "stress_level": a["stress_level"],
+            "recommendation": a["recommendation"]
+        }
+
+    async def update_status(self, appointment_id, status, counselor_notes, rejection_reason) -> Optional[dict]:
+        apt = self.graph.appointments.get(appointment_id)
+        if apt is None:
+            return None
+        old_status = apt["status"]
+        apt.update(status=status, counselor_notes=counselor_notes, rejection_reason=rejection_reason)
+        if apt["counselor_id"] is not None:
+            self.graph.count_appointment(apt["counselor_id"], old_status, status)
+        return {
+            "appointment_id": apt["appointment_id"],
+            "status": apt["status"],
+            "client_email": apt["client_email"]
+        }
+
+    async def status_counts(self, counselor_id: str) -> dict:
+        counts = self.graph.appointment_counts.get(counselor_id)
+        if counts is None:
+            return {"total_appointments": 0, **{field: 0 for field in STATUS_FIELDS.values()}}
+        return dict(counts)
+
+    def _range(self, counselor_id, start_date, end_date, after) -> tuple:
+        """The counselor's sorted appointment keys and the index range matching the filters"""
+        keys = self.graph.appointment_keys.get(counselor_id, [])
+        low = bisect_left(keys, (start_date,)) if start_date else 0
+        high = bisect_left(keys, (end_date + timedelta(days=1),)) if end_date else len(keys)
+        if after:
+            high = min(high, bisect_left(keys, (date.fromisoformat(after[0]), _parse_time(after[1]), after[2])))
+        return keys, low, high
+
+    def _rows(self, keys: Iterable[tuple], status: Optional[str]) -> Iterator[dict]:
+        for _, _, appointment_id in keys:
+            apt = self.graph.appointments[appointment_id]
+            if status and apt["status"] != status:
+                continue
+            yield {
+                "appointment_id": apt["appointment_id"],
+                "status": apt["status"],
+                "scheduled_date": apt["scheduled_date"].isoformat(),
+                "scheduled_time": _time_str(apt["scheduled_time"]),
+                "created_at": _datetime_str(apt["created_at"]),
+                "client_full_name": self.graph.clients[apt["client_email"]]["full_name"],
+                "client_email": apt["client_email"]
+            }
+
+    async def page(self, counselor_id, limit, status=None, start_date=None, end_date=None, after=None):
+        keys, low, high = self._range(counselor_id, start_date, end_date, after)
+        rows = self._rows((keys[i] for i in range(high - 1, low - 1, -1)), status)
+        return list(islice(rows, limit) if limit else rows)
+
+    async def stream(self, counselor_id, status=None, start_date=None, end_date=None, after=None) -> AsyncIterator[dict]:
+        keys, low, high = self._range(counselor_id, start_date, end_date, after)
+        for row in self._rows(keys[low:high][::-1], status):
+            yield row
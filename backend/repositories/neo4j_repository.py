@@ -0,0 +1,208 @@
+from services.neo4j_service import neo4j_service
+from services.queries import (
+    APPOINTMENT_FILTERS, ASSESSMENT_CURSOR_FILTER, ASSESSMENT_STRESS_FILTER,
+    AVAILABILITY_DATE_FILTER, LIMIT_CLAUSE, SLOT_FILTERS, where
+)
+from repositories.base import (
+    AppointmentRepository, AssessmentRepository, CounselorRepository, SlotRepository
+)
+from utils.day_bitmap import from_words, quarter_span
+from datetime import date, time, timedelta
+from typing import AsyncIterator, List, Optional
+
+# Every statement is a named query from services/queries.py; the counter and
+# rollup fragments embedded in them keep the materialized dashboard and
+# analytics nodes in step with the data.
+
+class Neo4jAssessmentRepository(AssessmentRepository):
+
+    async def add(self, submission: dict) -> None:
+        await neo4j_service.write("assessment.submit", {"submission": submission})
+
+    async def add_batch(self, submissions: List[dict]) -> List[dict]:
+        result = await neo4j_service.write("assessment.write_batch", {"submissions": submissions})
+        return result["results"] if result else []
+
+    async def page(self, limit, stress_level=None, start_date=None, end_date=None, after=None):
+        params = {
+            "start": f"{start_date.isoformat()}T00:00:00Z" if start_date else "1970-01-01T00:00:00Z",
+            "end": f"{(end_date + timedelta(days=1)).isoformat()}T00:00:00Z" if end_date else "9999-12-31T23:59:59Z",
+            "limit": limit
+        }
+
+        stress_filter = ""
+        if stress_level:
+            stress_filter = ASSESSMENT_STRESS_FILTER
+            params["stress_level"] = stress_level
+
+        cursor_filter = ""
+        if after:
+            cursor_filter = ASSESSMENT_CURSOR_FILTER
+            params["cursor_timestamp"], params["cursor_id"] = after
+
+        return await neo4j_service.query(
+            "assessment.page", params, stress_filter=stress_filter, cursor_filter=cursor_filter
+        )
+
+    async def stress_counts(self) -> dict:
+        return (await neo4j_service.query("stats.assessment_counts"))[0]
+
+    async def rollup_summary(self, days: Optional[int]) -> dict:
+        return (await neo4j_service.query("analytics.summary", {"days": days}))[0]
+
+    async def rollup_days(self, days: Optional[int]) -> List[dict]:
+        return await neo4j_service.query("analytics.timeseries", {"days": days})
+
+class Neo4jCounselorRepository(CounselorRepository):
+
+    async def by_email(self, email: str) -> Optional[dict]:
+        result = await neo4j_service.query("counselor.by_email", {"email": email})
+        return result[0] if result else None
+
+    async def create(self, counselor: dict) -> str:
+        result = await neo4j_service.write("counselor.create", counselor)
+        return result["counselor_id"]
+
+    async def directory(self) -> List[dict]:
+        return await neo4j_service.query("counselor.directory")
+
+    async def list_all(self) -> List[dict]:
+        return await neo4j_service.query("counselor.list")
+
+    async def delete(self, counselor_id: str) -> bool:
+        result = await neo4j_service.write("counselor.delete", {"counselor_id": counselor_id})
+        return bool(result and result.get("deleted", 0) > 0)
+
+def _slot_clauses(counselor_id, available, start_date, end_date, after, limit) -> tuple:
+    """Template clauses and parameters for the slot.* list statements"""
+    filters = []
+    params = {"counselor_id": counselor_id}
+
+    if available is not None:
+        filters.append(SLOT_FILTERS["available"])
+        params["available"] = available
+    if start_date:
+        filters.append(SLOT_FILTERS["start_date"])
+        params["start_date"] = start_date.isoformat()
+    if end_date:
+        filters.append(SLOT_FILTERS["end_date"])
+        params["end_date"] = end_date.isoformat()
+    if after:
+        filters.append(SLOT_FILTERS["cursor"])
+        params["cursor_date"], params["cursor_time"], params["cursor_id"] = after
+
+    limit_clause = ""
+    if limit:
+        limit_clause = LIMIT_CLAUSE
+        params["limit"] = limit
+
+    return {"where": where(filters), "limit_clause": limit_clause}, params
+
+class Neo4jSlotRepository(SlotRepository):
+
+    async def available(self, target_date: Optional[date] = None) -> List[dict]:
+        date_filter = ""
+        params = {}
+        if target_date:
+            date_filter = AVAILABILITY_DATE_FILTER
+            params["target_date"] = target_date.isoformat()
+        return await neo4j_service.query("availability.list", params, date_filter=date_filter)
+
+    async def create(self, counselor_id: str, slot: dict) -> Optional[dict]:
+        # The bitmap prefilter and the exact overlap test run inside the statement
+        first, last = quarter_span(time.fromisoformat(slot["start_time"]), time.fromisoformat(slot["end_time"]))
+        return await neo4j_service.write("slot.create", {
+            "counselor_id": counselor_id,
+            "first": first,
+            "last": last,
+            **slot
+        })
+
+    async def create_bulk(self, counselor_id: str, slots: List[dict]) -> Optional[List[dict]]:
+        # The statement locks the counselor, so concurrent bulk requests
+        # cannot interleave between the overlap check and the writes; it
+        # applies the same overlap rule as create()
+        spans = [quarter_span(time.fromisoformat(s["start_time"]), time.fromisoformat(s["end_time"])) for s in slots]
+        result = await neo4j_service.write("slot.create_bulk", {
+            "counselor_id": counselor_id,
+            "slots": [dict(s, first=first, last=last) for s, (first, last) in zip(slots, spans)],
+            "days": sorted({s["date"] for s in slots})
+        })
+        return result["conflicts"] if result else None
+
+    async def delete(self, slot_id: str) -> bool:
+        result = await neo4j_service.write("slot.delete", {"slot_id": slot_id})
+        return bool(result and result.get("deleted", 0) > 0)
+
+    async def day_bitmaps(self, target_date: date) -> List[dict]:
+        rows = await neo4j_service.query("slot.day_bitmaps", {"date": target_date.isoformat()})
+        return [dict(row, open=from_words(row["open"]), booked=from_words(row["booked"])) for row in rows]
+
+    async def page(self, counselor_id, limit, available=None, start_date=None, end_date=None, after=None):
+        clauses, params = _slot_clauses(counselor_id, available, start_date, end_date, after, limit)
+        return await neo4j_service.query("slot.page", params, **clauses)
+
+    def stream(self, counselor_id, available=None, start_date=None, end_date=None, after=None) -> AsyncIterator[dict]:
+        clauses, params = _slot_clauses(counselor_id, available, start_date, end_date, after, None)
+        return neo4j_service.stream("slot.stream", params, **clauses)
+
+def _appointment_clauses(counselor_id, status, start_date, end_date, after, limit) -> tuple:
+    """Template clauses and parameters for the appointment.* list statements"""
+    filters = []
+    params = {"counselor_id": counselor_id}
+
+    if status:
+        filters.append(APPOINTMENT_FILTERS["status"])
+        params["status"] = status
+    if start_date:
+        filters.append(APPOINTMENT_FILTERS["start_date"])
+        params["start_date"] = start_date.isoformat()
+    if end_date:
+        filters.append(APPOINTMENT_FILTERS["end_date"])
+        params["end_date"] = end_date.isoformat()
+    if after:
+        filters.append(APPOINTMENT_FILTERS["cursor"])
+        params["cursor_date"], params["cursor_time"], params["cursor_id"] = after
+
+    limit_clause = ""
+    if limit:
+        limit_clause = LIMIT_CLAUSE
+        params["limit"] = limit
+
+    return {"where": where(filters), "limit_clause": limit_clause}, params
+
+class Neo4jAppointmentRepository(AppointmentRepository):
+
+    async def book(self, appointment: dict) -> dict:
+        # One statement: the slot's write lock is taken before is_available
+        # is read, so concurrent bookers of a slot serialize on it
+        return await neo4j_service.write("appointment.book", appointment)
+
+    async def by_client_email(self, email: str) -> List[dict]:
+        return await neo4j_service.query("appointment.status_by_email", {"email": email})
+
+    async def detail(self, appointment_id: str) -> Optional[dict]:
+        result = await neo4j_service.query("appointment.detail", {"appointment_id": appointment_id})
+        return result[0] if result else None
+
+    async def update_status(self, appointment_id, status, counselor_notes, rejection_reason) -> Optional[dict]:
+        return await neo4j_service.write("appointment.update_status", {
+            "appointment_id": appointment_id,
+            "status": status,
+            "counselor_notes": counselor_notes,
+            "rejection_reason": rejection_reason
+        })
+
+    async def status_counts(self, counselor_id: str) -> dict:
+        result = await neo4j_service.query("stats.counselor_counts", {
+            "counselor_key": f"counselor:{counselor_id}"
+        })
+        return result[0]
+
+    async def page(self, counselor_id, limit, status=None, start_date=None, end_date=None, after=None):
+        clauses, params = _appointment_clauses(counselor_id, status, start_date, end_date, after, limit)
+        return await neo4j_service.query("appointment.page", params, **clauses)
+
+    def stream(self, counselor_id, status=None, start_date=None, end_date=None, after=None) -> AsyncIterator[dict]:
+        clauses, params = _appointment_clauses(counselor_id, status, start_date, end_date, after, None)
+        return neo4j_service.stream("appointment.stream", params, **clauses)
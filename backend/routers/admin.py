@@ -1,14 +1,23 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from pydantic import BaseModel, EmailStr
 from models.schemas import (
     AdminLoginRequest, AdminLoginResponse,
     AppointmentDetailResponse, UpdateAppointmentStatusRequest,
-    TimeSlotCreate
+    TimeSlotCreate, TimeSlotBulkCreate, StressLevel
 )
 from services.auth_service import auth_service
+from services.assessment_service import assessment_service
 from services.appointment_service import appointment_service
-from services.neo4j_service import neo4j_service
+from services.stats_service import stats_service
+from services.analytics_service import analytics_service
+from repositories import counselor_repository
+from services.counselor_directory import counselor_directory
+from services.open_slot_index import open_slot_index
 from utils.security import get_current_counselor
+from utils.streaming import ndjson_response
+from utils.serialization import json_response
+from datetime import date
+from typing import Optional
 
 class CreateCounselorRequest(BaseModel):
     full_name: str
@@ -20,13 +29,15 @@ class CreateCounselorRequest(BaseModel):
 router = APIRouter()
 
 @router.post("/login", response_model=AdminLoginResponse)
-async def admin_login(request: AdminLoginRequest):
+async def admin_login(request: AdminLoginRequest, http_request: Request):
     """
     Counselor/Admin login
     Returns JWT token
+    429 when the account or client IP has too many recent attempts
     """
     try:
-        return auth_service.authenticate_counselor(request.email, request.password)
+        client_ip = http_request.client.host if http_request.client else None
+        return await auth_service.authenticate_counselor(request.email, request.password, client_ip)
     except HTTPException:
         raise
     except Exception as e:
@@ -35,27 +46,25 @@ async def admin_login(request: AdminLoginRequest):
 @router.get("/assessments")
 async def get_all_assessments(
     current_user: dict = Depends(get_current_counselor),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(50, ge=1, le=100)
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    stress_level: Optional[StressLevel] = Query(None),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None)
 ):
     """
-    Get all anonymous assessment submissions
+    Get anonymous assessment submissions, newest first
+    Pass the returned next_cursor to fetch the following page
+    Optionally filter by stress level and date range (YYYY-MM-DD, inclusive)
     Requires authentication
     """
-    query = """
-    MATCH (a:AssessmentSubmission)
-    RETURN a.submission_id as submission_id,
-           a.timestamp as timestamp,
-           a.overall_score as overall_score,
-           a.stress_level as stress_level,
-           a.recommendation as recommendation
-    ORDER BY a.timestamp DESC
-    SKIP $skip
-    LIMIT $limit
-    """
-    
-    results = neo4j_service.execute_query(query, {"skip": skip, "limit": limit})
-    return results
+    return json_response(await assessment_service.list_submissions(
+        limit,
+        cursor=cursor,
+        stress_level=stress_level,
+        start_date=start_date,
+        end_date=end_date
+    ))
 
 @router.get("/appointment/{appointment_id}", response_model=AppointmentDetailResponse)
 async def get_appointment_detail(
@@ -66,7 +75,7 @@ async def get_appointment_detail(
     Get full appointment details including linked assessment
     Requires authentication
     """
-    return appointment_service.get_appointment_detail(appointment_id)
+    return json_response(await appointment_service.get_appointment_detail(appointment_id))
 
 @router.put("/appointment/{appointment_id}/status")
 async def update_appointment_status(
@@ -79,7 +88,7 @@ async def update_appointment_status(
     Requires authentication
     Triggers email notification to client
     """
-    result = appointment_service.update_appointment_status(appointment_id, request)
+    result = await appointment_service.update_appointment_status(appointment_id, request)
     return {
         "message": "Appointment status updated successfully",
         "appointment_id": result["appointment_id"],
@@ -93,9 +102,10 @@ async def create_time_slot(
 ):
     """
     Create a new time slot for the authenticated counselor
+    Rejected with 409 if it overlaps another slot that day
     Requires authentication
     """
-    result = appointment_service.create_time_slot(
+    result = await appointment_service.create_time_slot(
         current_user["counselor_id"],
         slot
     )
@@ -104,34 +114,60 @@ async def create_time_slot(
         "slot_id": result["slot_id"]
     }
 
+@router.post("/slots/bulk")
+async def create_time_slots_bulk(
+    request: TimeSlotBulkCreate,
+    current_user: dict = Depends(get_current_counselor)
+):
+    """
+    Create many time slots for the authenticated counselor in one transaction
+    Accepts an explicit list of slots and/or a weekly recurrence template
+    Rejects the whole request with 409 if any slot overlaps
+    Requires authentication
+    """
+    slot_ids = await appointment_service.create_time_slots_bulk(
+        current_user["counselor_id"],
+        request
+    )
+    return {
+        "message": f"{len(slot_ids)} time slots created successfully",
+        "slot_ids": slot_ids
+    }
+
 @router.get("/appointments")
 async def get_counselor_appointments(
     current_user: dict = Depends(get_current_counselor),
-    status: str = Query(None)
+    status: Optional[str] = Query(None),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+    format: str = Query("json", pattern="^(json|ndjson)$")
 ):
     """
-    Get all appointments for the authenticated counselor
+    Get appointments for the authenticated counselor, latest schedule first
+    Optionally filter by status and scheduled date range (YYYY-MM-DD, inclusive)
+    format=json returns a page ({items, next_cursor}); format=ndjson streams
+    every matching row, one JSON object per line
     Requires authentication
     """
-    query = """
-    MATCH (apt:Appointment)-[:ASSIGNED_TO]->(c:Counselor {counselor_id: $counselor_id})
-    WHERE $status IS NULL OR apt.status = $status
-    RETURN apt.appointment_id as appointment_id,
-           apt.status as status,
-           toString(apt.scheduled_date) as scheduled_date,
-           toString(apt.scheduled_time) as scheduled_time,
-           toString(apt.created_at) as created_at,
-           apt.client_full_name as client_full_name,
-           apt.client_email as client_email
-    ORDER BY apt.scheduled_date DESC, apt.scheduled_time DESC
-    """
-    
-    results = neo4j_service.execute_query(query, {
-        "counselor_id": current_user["counselor_id"],
-        "status": status
-    })
+    if format == "ndjson":
+        return ndjson_response(appointment_service.stream_counselor_appointments(
+            current_user["counselor_id"],
+            cursor=cursor,
+            status=status,
+            start_date=start_date,
+            end_date=end_date
+        ))
     
-    return results
+    return json_response(await appointment_service.list_counselor_appointments(
+        current_user["counselor_id"],
+        limit,
+        cursor=cursor,
+        status=status,
+        start_date=start_date,
+        end_date=end_date
+    ))
 
 @router.get("/dashboard/stats")
 async def get_dashboard_statistics(
@@ -141,43 +177,7 @@ async def get_dashboard_statistics(
     Get dashboard statistics for the authenticated counselor
     Returns counts and analytics data
     """
-    stats_query = """
-    MATCH (c:Counselor {counselor_id: $counselor_id})
-    OPTIONAL MATCH (apt:Appointment)-[:ASSIGNED_TO]->(c)
-    OPTIONAL MATCH (a:AssessmentSubmission)
-    WITH c, 
-         count(DISTINCT apt) as total_appointments,
-         count(DISTINCT CASE WHEN apt.status = 'Pending' THEN apt END) as pending_appointments,
-         count(DISTINCT CASE WHEN apt.status = 'Confirmed' THEN apt END) as confirmed_appointments,
-         count(DISTINCT CASE WHEN apt.status = 'Rejected' THEN apt END) as rejected_appointments,
-         count(DISTINCT CASE WHEN apt.status = 'Completed' THEN apt END) as completed_appointments,
-         count(DISTINCT a) as total_assessments
-    OPTIONAL MATCH (a2:AssessmentSubmission)
-    WITH total_appointments, pending_appointments, confirmed_appointments, 
-         rejected_appointments, completed_appointments, total_assessments,
-         count(DISTINCT CASE WHEN a2.stress_level = 'Low' THEN a2 END) as low_stress,
-         count(DISTINCT CASE WHEN a2.stress_level = 'Moderate' THEN a2 END) as moderate_stress,
-         count(DISTINCT CASE WHEN a2.stress_level = 'High' THEN a2 END) as high_stress
-    RETURN total_appointments, pending_appointments, confirmed_appointments,
-           rejected_appointments, completed_appointments, total_assessments,
-           low_stress, moderate_stress, high_stress
-    """
-    
-    result = neo4j_service.execute_query(stats_query, {
-        "counselor_id": current_user["counselor_id"]
-    })
-    
-    return result[0] if result else {
-        "total_appointments": 0,
-        "pending_appointments": 0,
-        "confirmed_appointments": 0,
-        "rejected_appointments": 0,
-        "completed_appointments": 0,
-        "total_assessments": 0,
-        "low_stress": 0,
-        "moderate_stress": 0,
-        "high_stress": 0
-    }
+    return json_response(await stats_service.get_dashboard_stats(current_user["counselor_id"]))
 
 @router.get("/counselors")
 async def get_all_counselors(
@@ -187,19 +187,7 @@ async def get_all_counselors(
     Get all counselors
     Requires authentication
     """
-    query = """
-    MATCH (c:Counselor)
-    RETURN c.counselor_id as counselor_id,
-           c.full_name as full_name,
-           c.email as email,
-           c.employee_id as employee_id,
-           c.specialization as specialization,
-           c.created_at as created_at
-    ORDER BY c.full_name
-    """
-    
-    results = neo4j_service.execute_query(query, {})
-    return results
+    return json_response(await counselor_repository.list_all())
 
 @router.post("/counselors")
 async def create_counselor(
@@ -211,7 +199,7 @@ async def create_counselor(
     Requires authentication
     """
     try:
-        counselor_id = auth_service.create_counselor(
+        counselor_id = await auth_service.create_counselor(
             full_name=request.full_name,
             email=request.email,
             employee_id=request.employee_id,
@@ -222,6 +210,8 @@ async def create_counselor(
             "message": "Counselor created successfully",
             "counselor_id": counselor_id
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -234,15 +224,12 @@ async def delete_counselor(
     Delete a counselor
     Requires authentication
     """
-    query = """
-    MATCH (c:Counselor {counselor_id: $counselor_id})
-    DETACH DELETE c
-    RETURN count(c) as deleted
-    """
-    
-    result = neo4j_service.execute_write(query, {"counselor_id": counselor_id})
-    
-    if result and result.get('deleted', 0) > 0:
+    if await counselor_repository.delete(counselor_id):
+        # The counselor's slots drop out of the public availability list,
+        # and their tokens stop working right away
+        appointment_service.bump_availability()
+        open_slot_index.remove_counselor(counselor_id)
+        counselor_directory.remove(counselor_id)
         return {"message": "Counselor deleted successfully"}
     else:
         raise HTTPException(status_code=404, detail="Counselor not found")
@@ -250,38 +237,36 @@ async def delete_counselor(
 @router.get("/slots")
 async def get_all_slots(
     current_user: dict = Depends(get_current_counselor),
-    start_date: str = Query(None),
-    end_date: str = Query(None)
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    available: Optional[bool] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=500),
+    format: str = Query("json", pattern="^(json|ndjson)$")
 ):
     """
-    Get all time slots for the authenticated counselor
-    Optionally filter by date range
-    """
-    date_filter = ""
-    params = {"counselor_id": current_user["counselor_id"]}
-    
-    if start_date and end_date:
-        date_filter = "AND date(ts.date) >= date($start_date) AND date(ts.date) <= date($end_date)"
-        params["start_date"] = start_date
-        params["end_date"] = end_date
+    Get time slots for the authenticated counselor in schedule order
+    Optionally filter by date range (YYYY-MM-DD, inclusive) and availability
+    format=json returns a page ({items, next_cursor}); format=ndjson streams
+    every matching row, one JSON object per line
+    """
+    if format == "ndjson":
+        return ndjson_response(appointment_service.stream_counselor_slots(
+            current_user["counselor_id"],
+            cursor=cursor,
+            available=available,
+            start_date=start_date,
+            end_date=end_date
+        ))
     
-    query = f"""
-    MATCH (c:Counselor {{counselor_id: $counselor_id}})-[:HAS_SLOT]->(ts:TimeSlot)
-    WHERE 1=1 {date_filter}
-    OPTIONAL MATCH (apt:Appointment)-[:OCCUPIES_SLOT]->(ts)
-    RETURN ts.slot_id as slot_id,
-           toString(ts.date) as date,
-           toString(ts.start_time) as start_time,
-           toString(ts.end_time) as end_time,
-           ts.is_available as is_available,
-           apt.appointment_id as appointment_id,
-           apt.client_full_name as client_name,
-           apt.status as appointment_status
-    ORDER BY ts.date, ts.start_time
-    """
-    
-    results = neo4j_service.execute_query(query, params)
-    return results
+    return json_response(await appointment_service.list_counselor_slots(
+        current_user["counselor_id"],
+        limit,
+        cursor=cursor,
+        available=available,
+        start_date=start_date,
+        end_date=end_date
+    ))
 
 @router.delete("/slots/{slot_id}")
 async def delete_slot(
@@ -292,18 +277,7 @@ async def delete_slot(
     Delete a time slot
     Only if it's not occupied by an appointment
     """
-    query = """
-    MATCH (ts:TimeSlot {slot_id: $slot_id})
-    OPTIONAL MATCH (apt:Appointment)-[:OCCUPIES_SLOT]->(ts)
-    WITH ts, apt
-    WHERE apt IS NULL
-    DETACH DELETE ts
-    RETURN count(ts) as deleted
-    """
-    
-    result = neo4j_service.execute_write(query, {"slot_id": slot_id})
-    
-    if result and result.get('deleted', 0) > 0:
+    if await appointment_service.delete_time_slot(slot_id):
         return {"message": "Time slot deleted successfully"}
     else:
         raise HTTPException(status_code=400, detail="Cannot delete slot with existing appointment")
@@ -317,41 +291,15 @@ async def get_analytics(
     Get analytics data for assessments
     Period: 7days, 30days, 90days, all
     """
-    # Calculate date filter based on period
-    date_filter = ""
-    if period == '7days':
-        date_filter = "AND a.timestamp >= datetime() - duration('P7D')"
-    elif period == '30days':
-        date_filter = "AND a.timestamp >= datetime() - duration('P30D')"
-    elif period == '90days':
-        date_filter = "AND a.timestamp >= datetime() - duration('P90D')"
-    
-    query = f"""
-    MATCH (a:AssessmentSubmission)
-    WHERE 1=1 {date_filter}
-    WITH count(a) as total_assessments,
-         avg(a.overall_score) as average_score,
-         count(CASE WHEN a.stress_level = 'High' THEN 1 END) as high_stress_count,
-         count(CASE WHEN a.stress_level = 'Low' THEN 1 END) as low_stress,
-         count(CASE WHEN a.stress_level = 'Moderate' THEN 1 END) as moderate_stress,
-         count(CASE WHEN a.stress_level = 'High' THEN 1 END) as high_stress
-    RETURN total_assessments,
-           average_score,
-           high_stress_count,
-           low_stress,
-           moderate_stress,
-           high_stress,
-           100.0 as completion_rate
+    return json_response(await analytics_service.get_analytics(period))
+
+@router.get("/analytics/timeseries")
+async def get_analytics_timeseries(
+    current_user: dict = Depends(get_current_counselor),
+    period: str = Query('30days')
+):
     """
-    
-    result = neo4j_service.execute_query(query, {})
-    
-    return result[0] if result else {
-        "total_assessments": 0,
-        "average_score": 0.0,
-        "high_stress_count": 0,
-        "low_stress": 0,
-        "moderate_stress": 0,
-        "high_stress": 0,
-        "completion_rate": 0.0
-    }
+    Get per-day assessment counts, average score and stress levels for charts
+    Period: 7days, 30days, 90days, all
+    """
+    return json_response(await analytics_service.get_timeseries(period))
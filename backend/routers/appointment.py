@@ -1,15 +1,17 @@
 from fastapi import APIRouter, HTTPException, Query
 from models.schemas import (
     AppointmentBookRequest, AppointmentBookResponse,
-    AppointmentStatusResponse
+    AppointmentStatusResponse, CounselorAvailability, CounselorFreeWindows,
+    NextAvailableSlot
 )
 from services.appointment_service import appointment_service
-from datetime import date
-from typing import Optional
+from utils.serialization import json_response
+import datetime
+from typing import List, Optional
 
 router = APIRouter()
 
-@router.get("/counselors/available")
+@router.get("/counselors/available", response_model=List[CounselorAvailability])
 async def get_available_counselors(date: Optional[str] = Query(None)):
     """
     Get all counselors with their available time slots
@@ -18,11 +20,55 @@ async def get_available_counselors(date: Optional[str] = Query(None)):
     target_date = None
     if date:
         try:
-            target_date = date.fromisoformat(date)
+            target_date = datetime.date.fromisoformat(date)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
     
-    return appointment_service.get_available_counselors(target_date)
+    return json_response(await appointment_service.get_available_counselors(target_date))
+
+@router.get("/counselors/free", response_model=List[CounselorFreeWindows])
+async def get_free_counselors(
+    date: str = Query(..., description="YYYY-MM-DD"),
+    start_time: Optional[str] = Query(None, description="HH:MM, default start of day"),
+    end_time: Optional[str] = Query(None, description="HH:MM, default end of day"),
+    min_minutes: int = Query(15, ge=15, le=1440)
+):
+    """
+    Counselors with open time in a window on a date, e.g. Thursday afternoon,
+    with their free windows between exact slot times
+    No authentication required
+    """
+    try:
+        target_date = datetime.date.fromisoformat(date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+    try:
+        start = datetime.time.fromisoformat(start_time) if start_time else None
+        end = datetime.time.fromisoformat(end_time) if end_time else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid time format. Use HH:MM")
+    if start and end and start >= end:
+        raise HTTPException(status_code=400, detail="end_time must be after start_time")
+    
+    return json_response(await appointment_service.find_free_counselors(target_date, start, end, min_minutes))
+
+@router.get("/slots/next", response_model=List[NextAvailableSlot])
+async def get_next_available_slots(
+    after: Optional[str] = Query(None, description="YYYY-MM-DD or YYYY-MM-DDTHH:MM, default now"),
+    specialization: Optional[str] = Query(None),
+    limit: int = Query(10, ge=1, le=100)
+):
+    """
+    The earliest open slots with any counselor, soonest first
+    Optionally only counselors with a specialization (case-insensitive)
+    No authentication required
+    """
+    try:
+        start = datetime.datetime.fromisoformat(after) if after else datetime.datetime.now()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid after format. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM")
+    
+    return json_response(appointment_service.next_available_slots(start, specialization, limit))
 
 @router.post("/book", response_model=AppointmentBookResponse)
 async def book_appointment(request: AppointmentBookRequest):
@@ -31,19 +77,19 @@ async def book_appointment(request: AppointmentBookRequest):
     No authentication required - client provides personal details directly
     """
     try:
-        return appointment_service.book_appointment(request)
+        return json_response(await appointment_service.book_appointment(request))
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/status/{email}")
+@router.get("/status/{email}", response_model=List[AppointmentStatusResponse])
 async def get_appointment_status(email: str):
     """
     Check appointment status by email
     No authentication required
     """
-    appointments = appointment_service.get_appointment_status_by_email(email)
+    appointments = await appointment_service.get_appointment_status_by_email(email)
     
     if not appointments:
         raise HTTPException(
@@ -51,4 +97,4 @@ async def get_appointment_status(email: str):
             detail="No appointments found for this email"
         )
     
-    return appointments
+    return json_response(appointments)
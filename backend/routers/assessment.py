@@ -1,16 +1,35 @@
-from fastapi import APIRouter, HTTPException
-from models.schemas import AssessmentSubmitRequest, AssessmentSubmitResponse
-from services.assessment_service import assessment_service
+from fastapi import APIRouter, HTTPException, Request
+from models.schemas import (
+    AssessmentSubmitRequest, AssessmentSubmitResponse,
+    AssessmentBatchSubmitRequest, AssessmentBatchSubmitResponse
+)
+from services.assessment_service import assessment_service, questionnaire
+from utils.http_cache import cached_bytes_response
+from utils.serialization import json_response
+
+# The questionnaire only changes with a deploy; clients revalidate with the ETag
+QUESTIONS_CACHE_CONTROL = "public, max-age=300"
 
 router = APIRouter()
 
 @router.get("/questions")
-async def get_questions():
+async def get_questions(request: Request):
     """
     Get the assessment questionnaire
+    Served from bytes encoded at startup (gzip when accepted) with a strong
+    ETag; If-None-Match returns 304
     No authentication required
     """
-    return assessment_service.get_questions()
+    response = cached_bytes_response(
+        request,
+        questionnaire.body,
+        questionnaire.gzip_body,
+        questionnaire.etag,
+        questionnaire.gzip_etag,
+        QUESTIONS_CACHE_CONTROL
+    )
+    response.headers["X-Questionnaire-Version"] = str(questionnaire.version)
+    return response
 
 @router.post("/submit", response_model=AssessmentSubmitResponse)
 async def submit_assessment(request: AssessmentSubmitRequest):
@@ -19,6 +38,25 @@ async def submit_assessment(request: AssessmentSubmitRequest):
     No authentication required
     """
     try:
-        return assessment_service.submit_assessment(request.answers)
+        return json_response(await assessment_service.submit_assessment(request.answers))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/submit/batch", response_model=AssessmentBatchSubmitResponse)
+async def submit_assessment_batch(request: AssessmentBatchSubmitRequest):
+    """
+    Submit many answer sets at once (kiosk / offline upload).
+    Each item carries a client_submission_id; re-sending an id returns the
+    stored result with created = false instead of storing it twice.
+    No authentication required
+    """
+    try:
+        results = await assessment_service.submit_assessment_batch(request.items)
+        return json_response({"results": results})
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
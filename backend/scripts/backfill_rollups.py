@@ -0,0 +1,32 @@
+"""
+Analytics rollup backfill
+Rebuilds the daily AssessmentRollup buckets from existing submissions
+
+Usage:
+    python scripts/backfill_rollups.py
+"""
+
+import sys
+import os
+import asyncio
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.analytics_service import analytics_service
+from services.neo4j_service import neo4j_service
+
+async def main():
+    try:
+        return await analytics_service.backfill()
+    finally:
+        await neo4j_service.close()
+
+if __name__ == "__main__":
+    print("Backfilling daily assessment rollups...")
+    try:
+        buckets = asyncio.run(main())
+        print(f"✅ Rebuilt {buckets} daily buckets")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
@@ -1,24 +1,31 @@
 """
 Database initialization script
-Creates initial counselor account and sample time slots
+Applies schema migrations, then creates initial counselor account and sample time slots
+
+Usage:
+    python scripts/init_db.py                 # schema + seed data
+    python scripts/init_db.py --schema-only   # schema migrations only
 """
 
 import sys
 import os
+import asyncio
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from services.auth_service import auth_service
 from services.appointment_service import appointment_service
-from models.schemas import TimeSlotCreate
-from datetime import date, time, timedelta
+from services.neo4j_service import neo4j_service
+from services.schema_service import schema_service
+from models.schemas import TimeSlotBulkCreate, SlotRecurrence
+from datetime import date, timedelta
 
-def create_initial_counselor():
+async def create_initial_counselor():
     """Create the first counselor account"""
     print("Creating initial counselor account...")
     
-    counselor_id = auth_service.create_counselor(
+    counselor_id = await auth_service.create_counselor(
         full_name="Dr. Maria Santos",
         email="counselor@msu.edu.ph",
         employee_id="MSU-2024-001",
@@ -32,35 +39,41 @@ def create_initial_counselor():
     
     return counselor_id
 
-def create_sample_slots(counselor_id: str):
+async def create_sample_slots(counselor_id: str):
     """Create sample time slots for the next 7 days"""
     print("\nCreating sample time slots...")
     
     today = date.today()
     
-    # Create slots for next 7 days (9 AM - 5 PM, 1-hour slots)
-    for day_offset in range(1, 8):
-        target_date = today + timedelta(days=day_offset)
-        
-        # Morning slots
-        for hour in [9, 10, 11]:
-            slot = TimeSlotCreate(
-                date=target_date,
-                start_time=time(hour, 0),
-                end_time=time(hour + 1, 0)
-            )
-            appointment_service.create_time_slot(counselor_id, slot)
-        
-        # Afternoon slots
-        for hour in [13, 14, 15, 16]:
-            slot = TimeSlotCreate(
-                date=target_date,
-                start_time=time(hour, 0),
-                end_time=time(hour + 1, 0)
-            )
-            appointment_service.create_time_slot(counselor_id, slot)
+    # Slots for next 7 days (9 AM - 5 PM, 1-hour slots, lunch break at 12),
+    # written in a single bulk request
+    request = TimeSlotBulkCreate(
+        recurrence=SlotRecurrence(
+            start_date=today + timedelta(days=1),
+            end_date=today + timedelta(days=7),
+            weekdays=[0, 1, 2, 3, 4, 5, 6],
+            hours=[9, 10, 11, 13, 14, 15, 16]
+        )
+    )
+    slot_ids = await appointment_service.create_time_slots_bulk(counselor_id, request)
     
-    print(f"✅ Created 49 time slots (7 days × 7 slots/day)")
+    print(f"✅ Created {len(slot_ids)} time slots (7 days × 7 slots/day)")
+
+async def apply_schema():
+    """Create constraints and indexes"""
+    print("Applying schema migrations...")
+    version = await schema_service.apply_migrations()
+    print(f"✅ Schema at version {version}")
+
+async def main(schema_only: bool = False):
+    try:
+        await apply_schema()
+        if schema_only:
+            return
+        counselor_id = await create_initial_counselor()
+        await create_sample_slots(counselor_id)
+    finally:
+        await neo4j_service.close()
 
 if __name__ == "__main__":
     print("=" * 60)
@@ -68,8 +81,7 @@ if __name__ == "__main__":
     print("=" * 60)
     
     try:
-        counselor_id = create_initial_counselor()
-        create_sample_slots(counselor_id)
+        asyncio.run(main(schema_only="--schema-only" in sys.argv))
         
         print("\n" + "=" * 60)
         print("✅ Database initialized successfully!")
@@ -0,0 +1,34 @@
+"""
+Dashboard counter reconciliation
+Rebuilds every StatsCounter node from the underlying submissions and appointments
+
+Usage:
+    python scripts/rebuild_stats.py
+"""
+
+import sys
+import os
+import asyncio
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from services.stats_service import stats_service
+from services.neo4j_service import neo4j_service
+
+async def main():
+    try:
+        return await stats_service.rebuild()
+    finally:
+        await neo4j_service.close()
+
+if __name__ == "__main__":
+    print("Rebuilding dashboard counters...")
+    try:
+        result = asyncio.run(main())
+        print(f"✅ Counted {result['total_assessments']} assessments")
+        print(f"✅ Rebuilt counters for {result['counselors']} counselors")
+        print(f"✅ Removed {result['orphans_removed']} orphaned counters")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
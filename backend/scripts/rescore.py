@@ -0,0 +1,142 @@
+"""
+Historical rescoring
+Re-applies a scoring version (utils/scoring.py SCORING_RULES) to every stored
+submission scored with a different version, streaming submissions out of
+Neo4j in chunks and writing each chunk back with one UNWIND statement.
+Dashboard counters and daily rollups are rebuilt afterwards, since stress
+levels and scores may have moved.
+
+Resumable: submissions already at the target version are skipped.
+
+Usage:
+    python scripts/rescore.py [--version N] [--chunk-size 5000] [--dry-run]
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import json
+from collections import Counter
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import get_settings
+from services.neo4j_service import neo4j_service
+from services.stats_service import stats_service
+from services.analytics_service import analytics_service
+from utils.scoring import SECTIONS, get_scoring_rules, load_scoring_rules
+from utils.batch_scoring import answers_to_matrix, flip_reversed, score_matrix, recommendations_for, COLUMNS
+
+def rescore_chunk(records: list, version: int, rules: dict) -> list:
+    """
+    Turn fetched submissions into writeback rows scored with `rules`.
+    Stored answers have their own version's reversed items flipped, so they
+    are flipped back to the answers as entered before rescoring.
+    """
+    by_version = {}
+    for record in records:
+        by_version.setdefault(record["scoring_version"], []).append(record)
+
+    rows = []
+    for stored_version, group in by_version.items():
+        stored_rules = get_scoring_rules(stored_version)
+        entered = flip_reversed(answers_to_matrix([r["answers"] for r in group]), stored_rules)
+
+        scores = score_matrix(entered, rules)
+        processed = flip_reversed(entered, rules)
+        recommendations = recommendations_for(scores["stress_level"])
+
+        for i, record in enumerate(group):
+            stored = {}
+            for section_no, section in enumerate(SECTIONS):
+                values = processed[i, section_no * 10:(section_no + 1) * 10]
+                questions = [question for s, question in COLUMNS if s == section]
+                stored[f"{section}_raw_answers"] = json.dumps(dict(zip(questions, values.tolist())))
+            rows.append({
+                "submission_id": record["submission_id"],
+                "previous_stress_level": record["stress_level"],
+                **stored,
+                "section1_score": float(scores["section1_score"][i]),
+                "section2_score": float(scores["section2_score"][i]),
+                "section3_score": float(scores["section3_score"][i]),
+                "overall_score": float(scores["overall_score"][i]),
+                "stress_level": scores["stress_level"][i],
+                "recommendation": recommendations[i],
+                "scoring_version": version
+            })
+    return rows
+
+async def main(version: int, chunk_size: int, dry_run: bool):
+    rules = get_scoring_rules(version)
+    print(f"Rescoring with version {version}: {rules['description']}")
+
+    transitions = Counter()
+    rescored = 0
+    skipped = 0
+    after = ""
+    try:
+        while True:
+            records = await neo4j_service.query("rescore.fetch", {"after": after, "limit": chunk_size})
+            if not records:
+                break
+            after = records[-1]["submission_id"]
+
+            complete = []
+            for record in records:
+                if record["scoring_version"] == version:
+                    continue
+                try:
+                    answers = {section: json.loads(record[section]) for section in SECTIONS}
+                except (TypeError, ValueError):
+                    answers = None
+                if not answers or any(question not in answers[section] for section, question in COLUMNS):
+                    skipped += 1
+                    continue
+                record["answers"] = answers
+                complete.append(record)
+            if not complete:
+                continue
+
+            rows = rescore_chunk(complete, version, rules)
+            for row in rows:
+                transitions[(row.pop("previous_stress_level"), row["stress_level"])] += 1
+            if not dry_run:
+                await neo4j_service.write("rescore.write", {"rows": rows})
+            rescored += len(rows)
+            print(f"  {rescored} rescored...")
+
+        if rescored and not dry_run:
+            print("Rebuilding dashboard counters and daily rollups...")
+            await stats_service.rebuild()
+            await analytics_service.backfill()
+    finally:
+        await neo4j_service.close()
+
+    return rescored, skipped, transitions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--version", type=int, default=None, help="scoring version (default: SCORING_VERSION)")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--dry-run", action="store_true", help="report changes without writing")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    if settings.SCORING_RULES_FILE:
+        load_scoring_rules(settings.SCORING_RULES_FILE)
+    version = args.version if args.version is not None else settings.SCORING_VERSION
+
+    try:
+        rescored, skipped, transitions = asyncio.run(main(version, args.chunk_size, args.dry_run))
+        verb = "Would rescore" if args.dry_run else "Rescored"
+        print(f"✅ {verb} {rescored} submissions")
+        for (before, after), count in sorted(transitions.items()):
+            if before != after:
+                print(f"   {before} → {after}: {count}")
+        if skipped:
+            print(f"⚠️ Skipped {skipped} submissions with incomplete answers")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
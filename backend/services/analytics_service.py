@@ -0,0 +1,61 @@
+from services.neo4j_service import neo4j_service
+from repositories import assessment_repository
+import math
+
+# Daily assessment rollups
+#
+# (:AssessmentRollup {day: date}) holds count, score_sum, score_sq_sum and
+# per-stress-level counts for submissions whose (UTC) timestamp falls on
+# that day. Analytics merge at most one bucket per day in the window
+# instead of scanning every submission. New submissions are added to their
+# bucket by the RECORD_ASSESSMENT_ROLLUP fragment in services/queries.py.
+
+# Window length in days per analytics period; anything else means all time
+PERIOD_DAYS = {
+    "7days": 7,
+    "30days": 30,
+    "90days": 90,
+}
+
+class AnalyticsService:
+
+    @staticmethod
+    async def get_analytics(period: str = "7days") -> dict:
+        """
+        Aggregate assessment analytics over the last N days (today included)
+        by merging daily rollup buckets
+        """
+        r = await assessment_repository.rollup_summary(PERIOD_DAYS.get(period))
+
+        total = r["total_assessments"]
+        average = r["score_sum"] / total if total else None
+        variance = r["score_sq_sum"] / total - average * average if total else None
+
+        return {
+            "total_assessments": total,
+            "average_score": average,
+            "score_stddev": math.sqrt(max(variance, 0.0)) if total else None,
+            "high_stress_count": r["high_stress"],
+            "low_stress": r["low_stress"],
+            "moderate_stress": r["moderate_stress"],
+            "high_stress": r["high_stress"],
+            "completion_rate": 100.0
+        }
+
+    @staticmethod
+    async def get_timeseries(period: str = "30days") -> list:
+        """
+        Per-day assessment series for charts, one entry per day that has submissions
+        """
+        return await assessment_repository.rollup_days(PERIOD_DAYS.get(period))
+
+    @staticmethod
+    async def backfill() -> int:
+        """
+        Rebuild every Neo4j daily bucket from the stored submissions.
+        Idempotent: buckets are overwritten, not incremented.
+        """
+        result = await neo4j_service.write("analytics.backfill")
+        return result["buckets"] if result else 0
+
+analytics_service = AnalyticsService()
@@ -1,16 +1,60 @@
-from services.neo4j_service import neo4j_service
+from repositories import appointment_repository, slot_repository
+from services.assessment_service import submission_buffer
+from services.counselor_directory import counselor_directory
+from services.open_slot_index import open_slot_index
+from utils.cache import ExpiringLRUCache, VersionedCache
+from utils.metrics import metrics
+from config import get_settings
 from models.schemas import (
-    TimeSlotCreate, AppointmentBookRequest, AppointmentBookResponse,
-    AppointmentDetailResponse, AppointmentStatusResponse,
-    UpdateAppointmentStatusRequest, CounselorAvailability
+    TimeSlotCreate, TimeSlotBulkCreate, SlotRecurrence, AppointmentBookRequest,
+    UpdateAppointmentStatusRequest
 )
-from datetime import datetime, date, time
+from datetime import datetime, date, time, timedelta
+from utils.pagination import decode_cursor, paginate
+from utils.day_bitmap import QUARTER_MINUTES, QUARTERS_PER_DAY, quarter_span, span_mask, windows
 from fastapi import HTTPException, status
+from typing import Optional, AsyncIterator
 import uuid
 import json
 
+settings = get_settings()
+
+# Upper bound on slots written by one bulk request (a full semester of hourly slots fits)
+MAX_BULK_SLOTS = 2000
+
+# Booking outcomes reported by the repository -> (HTTP status, detail)
+BOOKING_FAILURES = {
+    "submission_not_found": (status.HTTP_404_NOT_FOUND, "Assessment submission not found"),
+    "slot_not_found": (status.HTTP_404_NOT_FOUND, "Time slot not found"),
+    "counselor_not_found": (status.HTTP_404_NOT_FOUND, "Counselor not found for this time slot"),
+    "slot_unavailable": (status.HTTP_409_CONFLICT, "Time slot is no longer available"),
+}
+
 class AppointmentService:
     
+    # Per-date availability, invalidated exactly by bump_availability()
+    # whenever slots or bookings change, with a TTL for other workers' writes
+    availability_cache = VersionedCache(
+        ttl_seconds=settings.AVAILABILITY_CACHE_TTL_SECONDS,
+        max_entries=settings.AVAILABILITY_CACHE_SIZE
+    )
+    
+    # Emails with no appointments, so students polling before they book do
+    # not reach the database on every poll. A booking here forgets its email
+    # at once; bookings made by other workers show up within the TTL
+    status_misses = ExpiringLRUCache(max_entries=settings.STATUS_MISS_CACHE_SIZE)
+    bookings = 0
+    
+    @staticmethod
+    def bump_availability():
+        """Invalidate cached availability after any slot or booking change"""
+        AppointmentService.availability_cache.bump()
+    
+    @staticmethod
+    def client_key(email: str) -> str:
+        """Clients are keyed by case-insensitive email"""
+        return email.strip().lower()
+    
     @staticmethod
     def json_converter(obj):
         if isinstance(obj, (datetime, date, time)):
@@ -19,125 +63,136 @@ class AppointmentService:
                         f'is not JSON serializable')
 
     @staticmethod
-    def get_available_counselors(target_date: date = None) -> list[CounselorAvailability]:
-        """
-        Get all counselors with their available time slots
-        """
-        date_filter = ""
-        params = {}
-        
-        if target_date:
-            date_filter = "AND date(ts.date) = date($target_date)"
-            params["target_date"] = target_date.isoformat()
-        
-        query = f"""
-        MATCH (c:Counselor)-[:HAS_SLOT]->(ts:TimeSlot)
-        WHERE ts.is_available = true {date_filter}
-        WITH c, ts
-        ORDER BY ts.date, ts.start_time
-        RETURN c.counselor_id as counselor_id,
-               c.full_name as full_name,
-               c.specialization as specialization,
-               c.email as email,
-               collect({{
-                   slot_id: ts.slot_id,
-                   date: toString(ts.date),
-                   start_time: toString(ts.start_time),
-                   end_time: toString(ts.end_time)
-               }}) as available_slots
-        """
-        
-        results = neo4j_service.execute_query(query, params)
-        
-        return [
-            CounselorAvailability(
-                counselor_id=r["counselor_id"],
-                full_name=r["full_name"],
-                specialization=r["specialization"],
-                email=r["email"],
-                available_slots=r["available_slots"]
-            )
-            for r in results
-        ]
+    async def get_available_counselors(target_date: date = None) -> list[dict]:
+        """
+        Get all counselors with their available time slots, as rows shaped
+        like CounselorAvailability
+        """
+        cache = AppointmentService.availability_cache
+        cache_key = target_date.isoformat() if target_date else None
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        version = cache.version
+        
+        # Rows already have the CounselorAvailability shape
+        availability = await slot_repository.available(target_date)
+        cache.put(cache_key, availability, version)
+        return availability
     
     @staticmethod
-    def book_appointment(request: AppointmentBookRequest) -> AppointmentBookResponse:
+    async def find_free_counselors(
+        target_date: date,
+        start_time: Optional[time] = None,
+        end_time: Optional[time] = None,
+        min_minutes: int = QUARTER_MINUTES
+    ) -> list[dict]:
         """
-        Create a new appointment booking
+        Counselors with open slot time between start_time and end_time on a
+        date, each with its free windows of at least min_minutes, earliest
+        first. Each counselor's quarter-hour bitmap rules them out cheaply;
+        the windows themselves follow the exact slot times.
         """
-        appointment_id = str(uuid.uuid4())
+        first = quarter_span(start_time, start_time)[0] if start_time else 0
+        last = quarter_span(end_time, end_time)[1] if end_time else QUARTERS_PER_DAY
+        wanted = span_mask(first, last)
+        min_quarters = max(1, -(-min_minutes // QUARTER_MINUTES))
         
-        # Verify submission exists
-        verify_query = """
-        MATCH (a:AssessmentSubmission {submission_id: $submission_id})
-        RETURN a.submission_id as submission_id
+        results = []
+        for row in await slot_repository.day_bitmaps(target_date):
+            # Quarters round slots outward, so no real window is missed here
+            if not windows(row["open"] & wanted, min_quarters):
+                continue
+            free = AppointmentService.free_windows(row["open_slots"], start_time, end_time, min_minutes)
+            if free:
+                results.append({
+                    "counselor_id": row["counselor_id"],
+                    "full_name": row["full_name"],
+                    "specialization": row["specialization"],
+                    "windows": free
+                })
+        results.sort(key=lambda r: (r["windows"][0]["start_time"], r["full_name"]))
+        return results
+    
+    @staticmethod
+    def next_available_slots(
+        after: datetime,
+        specialization: Optional[str] = None,
+        limit: int = 10
+    ) -> list[dict]:
         """
-        assessment = neo4j_service.execute_query(verify_query, {"submission_id": request.submission_id})
-        
-        if not assessment:
+        The earliest open slots across all counselors starting at or after
+        `after`, optionally for one specialization (case-insensitive).
+        Served from the in-memory open slot index; 503 until it has loaded.
+        """
+        if not open_slot_index.loaded:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Assessment submission not found"
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Slot index is loading, try again shortly"
             )
-        
-        # Create appointment with relationships
-        query = """
-        MATCH (a:AssessmentSubmission {submission_id: $submission_id})
-        MATCH (c:Counselor {counselor_id: $counselor_id})
-        MATCH (ts:TimeSlot {slot_id: $slot_id})
-        WHERE ts.is_available = true
-        
-        CREATE (apt:Appointment {
-            appointment_id: $appointment_id,
-            created_at: datetime(),
-            scheduled_date: date($scheduled_date),
-            scheduled_time: time($scheduled_time),
-            status: 'Pending',
-            counselor_notes: '',
-            client_full_name: $client_full_name,
-            client_email: $client_email,
-            client_student_id: $client_student_id,
-            client_course: $client_course,
-            client_year_level: $client_year_level,
-            client_gender: $client_gender,
-            client_age: $client_age,
-            client_contact_number: $client_contact_number
-        })
-        
-        CREATE (apt)-[:BASED_ON_ASSESSMENT]->(a)
-        CREATE (apt)-[:ASSIGNED_TO]->(c)
-        CREATE (apt)-[:OCCUPIES_SLOT]->(ts)
-        
-        SET ts.is_available = false
-        
-        RETURN apt.appointment_id as appointment_id,
-               toString(apt.scheduled_date) as scheduled_date,
-               toString(apt.scheduled_time) as scheduled_time,
-               c.full_name as counselor_name
+        return open_slot_index.next(after, specialization, limit)
+    
+    @staticmethod
+    async def index_open_slots(counselor_id: str, rows: list[dict]):
+        """Add slots this worker just created to the open slot index"""
+        counselor = await counselor_directory.get(counselor_id)
+        if counselor is None:
+            # Not in the directory yet; the index's next reload picks them up
+            return
+        open_slot_index.add(counselor, rows)
+    
+    @staticmethod
+    def free_windows(
+        open_slots: list[dict],
+        start_time: Optional[time],
+        end_time: Optional[time],
+        min_minutes: int
+    ) -> list[dict]:
         """
+        Runs of back-to-back open slots, clipped to start_time-end_time and
+        at least min_minutes long, as HH:MM windows
+        """
+        runs = []
+        spans = sorted(
+            (time.fromisoformat(s["start_time"].removesuffix("Z")), time.fromisoformat(s["end_time"].removesuffix("Z")))
+            for s in open_slots
+        )
+        for start, end in spans:
+            if runs and start <= runs[-1][1]:
+                runs[-1][1] = max(runs[-1][1], end)
+            else:
+                runs.append([start, end])
         
-        # Extract date and time from slot
-        slot_query = """
-        MATCH (ts:TimeSlot {slot_id: $slot_id})
-        RETURN toString(ts.date) as date, toString(ts.start_time) as start_time
+        free = []
+        for start, end in runs:
+            start = max(start, start_time) if start_time else start
+            end = min(end, end_time) if end_time else end
+            minutes = (datetime.combine(date.min, end) - datetime.combine(date.min, start)).total_seconds() / 60
+            if minutes >= min_minutes:
+                free.append({"start_time": start.strftime("%H:%M"), "end_time": end.strftime("%H:%M")})
+        return free
+    
+    @staticmethod
+    async def book_appointment(request: AppointmentBookRequest) -> dict:
         """
-        slot_info = neo4j_service.execute_query(slot_query, {"slot_id": request.slot_id})
+        Create a new appointment booking; returns an AppointmentBookResponse-shaped dict
+
+        The repository books atomically, so of concurrent bookers for the
+        same slot exactly one wins and the rest get 409.
+        """
+        appointment_id = str(uuid.uuid4())
+        client_email = AppointmentService.client_key(request.client_details.email)
         
-        if not slot_info:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Time slot not found"
-            )
+        # A submission made moments ago may still be in the write-behind buffer
+        await submission_buffer.ensure_persisted(request.submission_id)
         
-        result = neo4j_service.execute_write(query, {
+        result = await appointment_repository.book({
             "appointment_id": appointment_id,
             "submission_id": request.submission_id,
             "counselor_id": request.counselor_id,
             "slot_id": request.slot_id,
-            "scheduled_date": slot_info[0]["date"],
-            "scheduled_time": slot_info[0]["start_time"],
             "client_full_name": request.client_details.full_name,
-            "client_email": request.client_details.email,
+            "client_email": client_email,
             "client_student_id": request.client_details.student_id,
             "client_course": request.client_details.course,
             "client_year_level": request.client_details.year_level,
@@ -146,88 +201,50 @@ class AppointmentService:
             "client_contact_number": request.client_details.contact_number
         })
         
-        return AppointmentBookResponse(
-            appointment_id=result["appointment_id"],
-            status="Pending",
-            scheduled_date=result["scheduled_date"],
-            scheduled_time=result["scheduled_time"],
-            counselor_name=result["counselor_name"],
-            message="Appointment booked successfully. You will receive a confirmation email soon."
-        )
+        outcome = result["outcome"]
+        if outcome != "booked":
+            status_code, detail = BOOKING_FAILURES[outcome]
+            raise HTTPException(status_code=status_code, detail=detail)
+        
+        AppointmentService.bump_availability()
+        open_slot_index.remove([request.slot_id])
+        AppointmentService.bookings += 1
+        AppointmentService.status_misses.discard(client_email)
+        
+        return {
+            "appointment_id": appointment_id,
+            "status": "Pending",
+            "scheduled_date": result["scheduled_date"],
+            "scheduled_time": result["scheduled_time"],
+            "counselor_name": result["counselor_name"],
+            "message": "Appointment booked successfully. You will receive a confirmation email soon."
+        }
     
     @staticmethod
-    def get_appointment_status_by_email(email: str) -> list[AppointmentStatusResponse]:
+    async def get_appointment_status_by_email(email: str) -> list[dict]:
         """
         Get all appointments for a client by email
         """
-        query = """
-        MATCH (apt:Appointment {client_email: $email})-[:ASSIGNED_TO]->(c:Counselor)
-        RETURN apt.appointment_id as appointment_id,
-               apt.status as status,
-               toString(apt.scheduled_date) as scheduled_date,
-               toString(apt.scheduled_time) as scheduled_time,
-               toString(apt.created_at) as created_at,
-               apt.counselor_notes as counselor_notes,
-               apt.rejection_reason as rejection_reason,
-               c.full_name as counselor_name,
-               c.email as counselor_email
-        ORDER BY apt.created_at DESC
-        """
-        
-        results = neo4j_service.execute_query(query, {"email": email})
-        
-        return [
-            AppointmentStatusResponse(
-                appointment_id=r["appointment_id"],
-                status=r["status"],
-                scheduled_date=r["scheduled_date"],
-                scheduled_time=r["scheduled_time"],
-                created_at=r["created_at"],
-                counselor_notes=r.get("counselor_notes"),
-                rejection_reason=r.get("rejection_reason"),
-                counselor_name=r["counselor_name"],
-                counselor_email=r["counselor_email"]
-            )
-            for r in results
-        ]
+        email = AppointmentService.client_key(email)
+        misses = AppointmentService.status_misses
+        if misses.get(email) is not None:
+            return []
+        bookings = AppointmentService.bookings
+        
+        # Rows already have the AppointmentStatusResponse shape
+        appointments = await appointment_repository.by_client_email(email)
+        
+        # Not cached if a booking finished meanwhile: it may be this email's
+        if not appointments and bookings == AppointmentService.bookings:
+            misses.put(email, True, datetime.now().timestamp() + settings.STATUS_MISS_CACHE_TTL_SECONDS)
+        return appointments
     
     @staticmethod
-    def get_appointment_detail(appointment_id: str) -> AppointmentDetailResponse:
+    async def get_appointment_detail(appointment_id: str) -> dict:
         """
         Get full appointment details including linked assessment (Admin only)
         """
-        query = """
-        MATCH (apt:Appointment {appointment_id: $appointment_id})-[:BASED_ON_ASSESSMENT]->(a:AssessmentSubmission)
-        MATCH (apt)-[:ASSIGNED_TO]->(c:Counselor)
-        RETURN apt.appointment_id as appointment_id,
-               apt.status as status,
-               toString(apt.scheduled_date) as scheduled_date,
-               toString(apt.scheduled_time) as scheduled_time,
-               toString(apt.created_at) as created_at,
-               apt.counselor_notes as counselor_notes,
-               apt.rejection_reason as rejection_reason,
-               apt.client_full_name as client_full_name,
-               apt.client_email as client_email,
-               apt.client_student_id as client_student_id,
-               apt.client_course as client_course,
-               apt.client_year_level as client_year_level,
-               apt.client_gender as client_gender,
-               apt.client_age as client_age,
-               apt.client_contact_number as client_contact_number,
-               a.submission_id as assessment_submission_id,
-               toString(a.timestamp) as assessment_timestamp,
-               a.section1_raw_answers as section1_raw_answers,
-               a.section2_raw_answers as section2_raw_answers,
-               a.section3_raw_answers as section3_raw_answers,
-               a.section1_score as section1_score,
-               a.section2_score as section2_score,
-               a.section3_score as section3_score,
-               a.overall_score as overall_score,
-               a.stress_level as stress_level,
-               a.recommendation as recommendation
-        """
-        
-        result = neo4j_service.execute_query(query, {"appointment_id": appointment_id})
+        result = await appointment_repository.detail(appointment_id)
         
         if not result:
             raise HTTPException(
@@ -235,31 +252,20 @@ class AppointmentService:
                 detail="Appointment not found"
             )
         
-        r = result[0]
-        # Keep JSON strings as-is, don't parse them
-        return AppointmentDetailResponse(**r)
+        # Shaped like AppointmentDetailResponse; JSON answer strings stay as-is
+        return result
     
     @staticmethod
-    def update_appointment_status(appointment_id: str, request: UpdateAppointmentStatusRequest) -> dict:
+    async def update_appointment_status(appointment_id: str, request: UpdateAppointmentStatusRequest) -> dict:
         """
         Update appointment status (Admin only)
         """
-        query = """
-        MATCH (apt:Appointment {appointment_id: $appointment_id})
-        SET apt.status = $status,
-            apt.counselor_notes = $counselor_notes,
-            apt.rejection_reason = $rejection_reason
-        RETURN apt.appointment_id as appointment_id,
-               apt.status as status,
-               apt.client_email as client_email
-        """
-        
-        result = neo4j_service.execute_write(query, {
-            "appointment_id": appointment_id,
-            "status": request.status.value,
-            "counselor_notes": request.counselor_notes or "",
-            "rejection_reason": request.rejection_reason or ""
-        })
+        result = await appointment_repository.update_status(
+            appointment_id,
+            request.status.value,
+            request.counselor_notes or "",
+            request.rejection_reason or ""
+        )
         
         if not result:
             raise HTTPException(
@@ -267,42 +273,229 @@ class AppointmentService:
                 detail="Appointment not found"
             )
         
+        AppointmentService.bump_availability()
+        
         # TODO: Send email notification to client
         # notification_service.send_status_update(result["client_email"], request.status)
         
         return result
     
     @staticmethod
-    def create_time_slot(counselor_id: str, slot: TimeSlotCreate) -> dict:
+    async def create_time_slot(counselor_id: str, slot: TimeSlotCreate) -> dict:
         """
         Create a new time slot for a counselor (Admin only)
+        
+        Refused with 409 if it overlaps another of the counselor's slots
+        that day; the day's bitmap spares the exact comparison on days
+        where nothing can overlap.
         """
+        if slot.start_time >= slot.end_time:
+            raise HTTPException(status_code=400, detail="Each slot must end after it starts")
+        
         slot_id = str(uuid.uuid4())
         
-        query = """
-        MATCH (c:Counselor {counselor_id: $counselor_id})
-        CREATE (ts:TimeSlot {
-            slot_id: $slot_id,
-            date: date($date),
-            start_time: time($start_time),
-            end_time: time($end_time),
-            is_available: true
+        result = await slot_repository.create(counselor_id, {
+            "slot_id": slot_id,
+            "date": slot.date.isoformat(),
+            "start_time": slot.start_time.isoformat(),
+            "end_time": slot.end_time.isoformat()
         })
-        CREATE (c)-[:HAS_SLOT]->(ts)
-        RETURN ts.slot_id as slot_id
-        """
         
-        result = neo4j_service.execute_write(query, {
-            "counselor_id": counselor_id,
+        if result and result["overlaps"]:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Slot overlaps an existing slot"
+            )
+        
+        AppointmentService.bump_availability()
+        await AppointmentService.index_open_slots(counselor_id, [{
             "slot_id": slot_id,
             "date": slot.date.isoformat(),
             "start_time": slot.start_time.isoformat(),
             "end_time": slot.end_time.isoformat()
-        })
+        }])
+        return {"slot_id": slot_id}
+    
+    @staticmethod
+    def expand_recurrence(recurrence: SlotRecurrence) -> list[TimeSlotCreate]:
+        """
+        Expand a weekly recurrence template into concrete slots
+        """
+        if recurrence.end_date < recurrence.start_date:
+            raise HTTPException(status_code=400, detail="end_date must not be before start_date")
+        if any(d < 0 or d > 6 for d in recurrence.weekdays):
+            raise HTTPException(status_code=400, detail="weekdays must be between 0 (Monday) and 6 (Sunday)")
+        if any(h < 0 or h > 23 for h in recurrence.hours):
+            raise HTTPException(status_code=400, detail="hours must be between 0 and 23")
+        
+        weekdays = set(recurrence.weekdays)
+        skipped = set(recurrence.exception_dates)
+        duration = timedelta(minutes=recurrence.duration_minutes)
+        slots = []
+        
+        day = recurrence.start_date
+        while day <= recurrence.end_date:
+            if day.weekday() in weekdays and day not in skipped:
+                for hour in sorted(set(recurrence.hours)):
+                    start = datetime.combine(day, time(hour, 0))
+                    end = start + duration
+                    if end.date() != day:
+                        raise HTTPException(status_code=400, detail="Slots must end on the day they start")
+                    slots.append(TimeSlotCreate(date=day, start_time=start.time(), end_time=end.time()))
+                    if len(slots) > MAX_BULK_SLOTS:
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"Too many slots in one request (max {MAX_BULK_SLOTS})"
+                        )
+            day += timedelta(days=1)
+        
+        return slots
+    
+    @staticmethod
+    async def create_time_slots_bulk(counselor_id: str, request: TimeSlotBulkCreate) -> list[str]:
+        """
+        Create many time slots for a counselor in one write transaction (Admin only)
+        
+        Accepts an explicit list, a weekly recurrence template, or both.
+        Nothing is written if any slot overlaps another slot in the request
+        or an existing slot of the counselor (the rule create_time_slot
+        applies); the 409 lists the conflicts.
+        """
+        slots = list(request.slots)
+        if request.recurrence:
+            slots += AppointmentService.expand_recurrence(request.recurrence)
+        
+        if not slots:
+            raise HTTPException(status_code=400, detail="No slots to create")
+        if len(slots) > MAX_BULK_SLOTS:
+            raise HTTPException(status_code=400, detail=f"Too many slots in one request (max {MAX_BULK_SLOTS})")
+        
+        if any(s.start_time >= s.end_time for s in slots):
+            raise HTTPException(status_code=400, detail="Each slot must end after it starts")
+        
+        # Overlaps within the request itself, by exact times (the rule the
+        # repository applies against existing slots); slots that touch fit
+        conflicts = []
+        ordered = sorted(slots, key=lambda s: (s.date, s.start_time))
+        covered_until = {}
+        for current in ordered:
+            if current.start_time < covered_until.get(current.date, time.min):
+                conflicts.append({
+                    "date": current.date.isoformat(),
+                    "start_time": current.start_time.isoformat(),
+                    "end_time": current.end_time.isoformat(),
+                    "existing_slot_id": None
+                })
+            covered_until[current.date] = max(current.end_time, covered_until.get(current.date, time.min))
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={"message": "Slots in the request overlap each other", "conflicts": conflicts}
+            )
+        
+        rows = [
+            {
+                "slot_id": str(uuid.uuid4()),
+                "date": s.date.isoformat(),
+                "start_time": s.start_time.isoformat(),
+                "end_time": s.end_time.isoformat()
+            }
+            for s in ordered
+        ]
+        
+        # Checked and written atomically, so concurrent bulk requests cannot
+        # interleave between the overlap check and the writes
+        conflicts = await slot_repository.create_bulk(counselor_id, rows)
         
-        if result:
-            return result
-        else:
-            return {"slot_id": slot_id}
+        if conflicts is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Counselor not found")
+        if conflicts:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={"message": "Slots overlap existing slots", "conflicts": conflicts}
+            )
+        
+        AppointmentService.bump_availability()
+        await AppointmentService.index_open_slots(counselor_id, rows)
+        return [row["slot_id"] for row in rows]
+    
+    @staticmethod
+    async def delete_time_slot(slot_id: str) -> bool:
+        """
+        Delete a time slot unless it is occupied by an appointment (Admin only)
+        Returns True if the slot was deleted
+        """
+        if await slot_repository.delete(slot_id):
+            AppointmentService.bump_availability()
+            open_slot_index.remove([slot_id])
+            return True
+        return False
+
+    @staticmethod
+    async def list_counselor_appointments(
+        counselor_id: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> dict:
+        """
+        Page through a counselor's appointments, latest schedule first (Admin only)
+        """
+        results = await appointment_repository.page(
+            counselor_id, limit + 1, status, start_date, end_date, decode_cursor(cursor, 3)
+        )
+        return paginate(results, limit, ["scheduled_date", "scheduled_time", "appointment_id"])
+    
+    @staticmethod
+    def stream_counselor_appointments(
+        counselor_id: str,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> AsyncIterator[dict]:
+        """
+        Stream every matching appointment without materializing the result (Admin only)
+        """
+        return appointment_repository.stream(
+            counselor_id, status, start_date, end_date, decode_cursor(cursor, 3)
+        )
+    
+    @staticmethod
+    async def list_counselor_slots(
+        counselor_id: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        available: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> dict:
+        """
+        Page through a counselor's time slots in schedule order (Admin only)
+        """
+        results = await slot_repository.page(
+            counselor_id, limit + 1, available, start_date, end_date, decode_cursor(cursor, 3)
+        )
+        return paginate(results, limit, ["date", "start_time", "slot_id"])
+    
+    @staticmethod
+    def stream_counselor_slots(
+        counselor_id: str,
+        cursor: Optional[str] = None,
+        available: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> AsyncIterator[dict]:
+        """
+        Stream every matching time slot without materializing the result (Admin only)
+        """
+        return slot_repository.stream(
+            counselor_id, available, start_date, end_date, decode_cursor(cursor, 3)
+        )
 
 appointment_service = AppointmentService()
+
+metrics.register_cache("availability", AppointmentService.availability_cache)
+metrics.register_cache("appointment_status_misses", AppointmentService.status_misses)
@@ -1,10 +1,32 @@
-from services.neo4j_service import neo4j_service
-from utils.scoring import calculate_assessment_score, reverse_score_for_q8
-from models.schemas import AssessmentAnswers, AssessmentSubmitResponse
-from datetime import datetime
+from repositories import assessment_repository
+from services.submission_buffer import SubmissionBuffer
+from config import get_settings
+from utils.scoring import calculate_assessment_score, get_scoring_rules, load_scoring_rules, reverse_items
+from utils.pagination import decode_cursor, paginate
+from utils.serialization import project
+from utils.questionnaire import QUESTIONNAIRES, LATEST_QUESTIONNAIRE_VERSION, CompiledQuestionnaire
+from models.schemas import (
+    AssessmentAnswers, AssessmentSubmitResponse, StressLevel, AssessmentBatchItem
+)
+from fastapi import HTTPException, status
+from datetime import datetime, date
+from typing import Optional
 import uuid
 import json
 
+settings = get_settings()
+
+# Extra scoring versions (methodology revisions) may come from a JSON file
+if settings.SCORING_RULES_FILE:
+    load_scoring_rules(settings.SCORING_RULES_FILE)
+
+# Compiled once: serves /assessment/questions and validates every submission
+questionnaire = CompiledQuestionnaire(
+    LATEST_QUESTIONNAIRE_VERSION,
+    QUESTIONNAIRES[LATEST_QUESTIONNAIRE_VERSION],
+    get_scoring_rules(settings.SCORING_VERSION)
+)
+
 class AssessmentService:
     
     @staticmethod
@@ -12,137 +34,144 @@ class AssessmentService:
         """
         Return the assessment questionnaire structure
         """
-        return {
-            "section1": {
-                "title": "Mental Health Quality",
-                "description": "Rate your current state (Excellent to Poor)",
-                "questions": [
-                    {"id": "q1", "text": "Rate your mental wellbeing", "valence": "positive"},
-                    {"id": "q2", "text": "Your mood for the past 2 weeks", "valence": "positive"},
-                    {"id": "q3", "text": "Your outlook in life", "valence": "positive"},
-                    {"id": "q4", "text": "Intrapersonal relationship", "valence": "positive"},
-                    {"id": "q5", "text": "Feelings towards your surroundings", "valence": "positive"},
-                    {"id": "q6", "text": "Sleep cycle", "valence": "positive"},
-                    {"id": "q7", "text": "Sleep quality", "valence": "positive"},
-                    {"id": "q8", "text": "Relationship with family", "valence": "positive"},
-                    {"id": "q9", "text": "Relationship with friends", "valence": "positive"},
-                    {"id": "q10", "text": "Physical Health", "valence": "positive"}
-                ],
-                "options": [
-                    {"value": 1, "label": "Excellent"},
-                    {"value": 2, "label": "Good"},
-                    {"value": 3, "label": "Fair"},
-                    {"value": 4, "label": "Bad"},
-                    {"value": 5, "label": "Poor"}
-                ]
-            },
-            "section2": {
-                "title": "University Life",
-                "description": "Answer YES or NO",
-                "questions": [
-                    {"id": "q1", "text": "Are you finding it easy to adjust to your new environment?", "valence": "positive"},
-                    {"id": "q2", "text": "Are you happy with your current course?", "valence": "positive"},
-                    {"id": "q3", "text": "Do you feel productive with your course?", "valence": "positive"},
-                    {"id": "q4", "text": "Are you satisfied with your current academic performance?", "valence": "positive"},
-                    {"id": "q5", "text": "Are your professors/instructors approachable and understanding?", "valence": "positive"},
-                    {"id": "q6", "text": "Is your allowance sufficient for your needs?", "valence": "positive"},
-                    {"id": "q7", "text": "Do you feel safe and at ease on campus?", "valence": "positive"},
-                    {"id": "q8", "text": "Are you comfortable making new friends at university?", "valence": "positive"},
-                    {"id": "q9", "text": "Have you felt sense of personal growth or development since starting university?", "valence": "positive"},
-                    {"id": "q10", "text": "Do you feel like you have a good work-life balance?", "valence": "positive"}
-                ],
-                "options": [
-                    {"value": 1, "label": "YES"},
-                    {"value": 5, "label": "NO"}
-                ]
-            },
-            "section3": {
-                "title": "Self Assessment",
-                "description": "How often do you experience these? (Not at all/Never to Very Much/Always)",
-                "questions": [
-                    {"id": "q1", "text": "Are you having a difficulty coping with your stressors?", "valence": "negative"},
-                    {"id": "q2", "text": "Do people's perception about you affects you?", "valence": "negative"},
-                    {"id": "q3", "text": "Does your medical health or mental wellbeing limits your daily productivity?", "valence": "negative"},
-                    {"id": "q4", "text": "Do you have trouble sleeping?", "valence": "negative"},
-                    {"id": "q5", "text": "Do you smoke cigarettes/e-cigars?", "valence": "negative"},
-                    {"id": "q6", "text": "Do you drink liquors?", "valence": "negative"},
-                    {"id": "q7", "text": "Do you get in conflict with your partner or family members?", "valence": "negative"},
-                    {"id": "q8", "text": "Do you feel calmness and happiness?", "valence": "positive", "note": "REVERSED SCORING"},
-                    {"id": "q9", "text": "Do you feel sad and depress?", "valence": "negative"},
-                    {"id": "q10", "text": "Do you feel angry and aggressive?", "valence": "negative"}
-                ],
-                "options": [
-                    {"value": 1, "label": "Not at all/Never"},
-                    {"value": 2, "label": "Rarely"},
-                    {"value": 3, "label": "Sometimes"},
-                    {"value": 4, "label": "Often"},
-                    {"value": 5, "label": "Very Much/Always"}
-                ]
-            }
-        }
+        return questionnaire.payload
     
     @staticmethod
-    def submit_assessment(answers: AssessmentAnswers) -> AssessmentSubmitResponse:
+    def build_submission(answers: AssessmentAnswers, client_submission_id: Optional[str] = None) -> dict:
         """
-        Process and store assessment submission
+        Validate and score one answer set and return the
+        AssessmentSubmission properties to store
         """
-        # Reverse Q8 in Section 3 (positive question in negative section)
-        section3_processed = answers.section3.copy()
-        if "q8" in section3_processed:
-            section3_processed["q8"] = reverse_score_for_q8(section3_processed["q8"])
+        errors = questionnaire.validation_errors(answers.model_dump())
+        if errors:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=errors
+            )
+        
+        # Flip reversed items (section 3 Q8: positive question in negative section)
+        version = settings.SCORING_VERSION
+        rules = get_scoring_rules(version)
+        section1 = reverse_items(answers.section1, "section1", rules)
+        section2 = reverse_items(answers.section2, "section2", rules)
+        section3 = reverse_items(answers.section3, "section3", rules)
         
         # Calculate scores
         s1_score, s2_score, s3_score, overall, stress_level, recommendation = calculate_assessment_score(
-            answers.section1,
-            answers.section2,
-            section3_processed
+            section1, section2, section3, rules
         )
         
-        # Generate submission ID
-        submission_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow()
-        
-        # Store in Neo4j (convert dicts to JSON strings)
-        query = """
-        CREATE (a:AssessmentSubmission {
-            submission_id: $submission_id,
-            timestamp: datetime($timestamp),
-            section1_raw_answers: $section1_raw,
-            section2_raw_answers: $section2_raw,
-            section3_raw_answers: $section3_raw,
-            section1_score: $section1_score,
-            section2_score: $section2_score,
-            section3_score: $section3_score,
-            overall_score: $overall_score,
-            stress_level: $stress_level,
-            recommendation: $recommendation
-        })
-        RETURN a.submission_id as submission_id
-        """
-        
-        neo4j_service.execute_write(query, {
-            "submission_id": submission_id,
-            "timestamp": timestamp.isoformat(),
-            "section1_raw": json.dumps(answers.section1),
-            "section2_raw": json.dumps(answers.section2),
-            "section3_raw": json.dumps(section3_processed),
+        # Answers are stored as JSON strings, with the reversed items of
+        # `scoring_version` already flipped
+        return {
+            "submission_id": str(uuid.uuid4()),
+            "client_submission_id": client_submission_id,
+            "timestamp": datetime.utcnow().isoformat(),
+            "section1_raw_answers": json.dumps(section1),
+            "section2_raw_answers": json.dumps(section2),
+            "section3_raw_answers": json.dumps(section3),
             "section1_score": s1_score,
             "section2_score": s2_score,
             "section3_score": s3_score,
             "overall_score": overall,
             "stress_level": stress_level,
-            "recommendation": recommendation
-        })
+            "recommendation": recommendation,
+            "scoring_version": version,
+            "questionnaire_version": questionnaire.version
+        }
+    
+    @staticmethod
+    async def submit_assessment(answers: AssessmentAnswers) -> dict:
+        """
+        Process and store assessment submission; returns an
+        AssessmentSubmitResponse-shaped dict
+        """
+        submission = AssessmentService.build_submission(answers)
+        
+        # Write-behind mode: durable in the local log now, in Neo4j with the
+        # next flush. The submission id doubles as the idempotency key so a
+        # replayed log cannot store it twice.
+        if submission_buffer.running:
+            submission["client_submission_id"] = submission["submission_id"]
+            await submission_buffer.add(submission)
+            return project(submission, AssessmentSubmitResponse)
+        
+        # Store it, count it on the dashboard and add it to its daily
+        # analytics bucket
+        await assessment_repository.add(submission)
         
-        return AssessmentSubmitResponse(
-            submission_id=submission_id,
-            section1_score=s1_score,
-            section2_score=s2_score,
-            section3_score=s3_score,
-            overall_score=overall,
-            stress_level=stress_level,
-            recommendation=recommendation,
-            timestamp=timestamp
+        return project(submission, AssessmentSubmitResponse)
+    
+    @staticmethod
+    async def write_submissions(submissions: list[dict]) -> list[dict]:
+        """
+        Persist many scored submissions in one repository call (a single
+        UNWIND statement on Neo4j).
+        
+        Each submission is merged on its client_submission_id, so re-sending
+        the same ids creates nothing new: the stored submission is returned
+        with created = false and counters/rollups are left untouched.
+        """
+        return await assessment_repository.add_batch(submissions)
+    
+    @staticmethod
+    async def submit_assessment_batch(items: list[AssessmentBatchItem]) -> list[dict]:
+        """
+        Score and store a batch of answer sets (kiosk / offline upload).
+        Items are keyed by their client_submission_id, so uploading the same
+        batch again is harmless.
+        """
+        # A repeated id inside one batch is the same submission; errors
+        # name the position of its first occurrence in the request
+        unique = {}
+        for position, item in enumerate(items):
+            unique.setdefault(item.client_submission_id, (position, item))
+        
+        submissions = []
+        for client_submission_id, (position, item) in unique.items():
+            try:
+                submissions.append(AssessmentService.build_submission(item.answers, client_submission_id))
+            except HTTPException as e:
+                raise HTTPException(
+                    status_code=e.status_code,
+                    detail=[f"items[{position}] ({client_submission_id}) {error}" for error in e.detail]
+                )
+        
+        stored = await AssessmentService.write_submissions(submissions)
+        by_client_id = {r["client_submission_id"]: r for r in stored}
+        
+        # Rows already have the AssessmentBatchItemResult shape
+        return [by_client_id[item.client_submission_id] for item in items]
+    
+    @staticmethod
+    async def list_submissions(
+        limit: int,
+        cursor: Optional[str] = None,
+        stress_level: Optional[StressLevel] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> dict:
+        """
+        Page through submissions newest first using keyset pagination on
+        (timestamp, submission_id). Every page is a range seek on the
+        timestamp index (or the stress_level/timestamp composite index),
+        so deep pages cost the same as the first one.
+        """
+        results = await assessment_repository.page(
+            limit + 1,
+            stress_level.value if stress_level else None,
+            start_date,
+            end_date,
+            decode_cursor(cursor, 2)
         )
+        return paginate(results, limit, ["timestamp", "submission_id"])
 
 assessment_service = AssessmentService()
+
+submission_buffer = SubmissionBuffer(
+    settings.SUBMISSION_WAL_PATH,
+    AssessmentService.write_submissions,
+    batch_size=settings.SUBMISSION_FLUSH_BATCH_SIZE,
+    flush_interval=settings.SUBMISSION_FLUSH_INTERVAL_SECONDS,
+    commit_window=settings.SUBMISSION_WAL_COMMIT_WINDOW_MS / 1000
+)
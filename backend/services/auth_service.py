@@ -1,43 +1,69 @@
-from services.neo4j_service import neo4j_service
-from utils.security import verify_password, create_access_token, hash_password
+from repositories import counselor_repository
+from utils.security import create_access_token, password_hasher
+from utils.rate_limit import SlidingWindowLimiter
+from services.counselor_directory import counselor_directory
 from fastapi import HTTPException, status
 from datetime import timedelta
+from typing import Optional
 from config import get_settings
+import math
 
 settings = get_settings()
 
+# Failed logins per email, and all login attempts per client IP
+account_failures = SlidingWindowLimiter(
+    settings.LOGIN_MAX_FAILURES_PER_ACCOUNT, settings.LOGIN_THROTTLE_WINDOW_SECONDS
+)
+ip_attempts = SlidingWindowLimiter(
+    settings.LOGIN_MAX_ATTEMPTS_PER_IP, settings.LOGIN_THROTTLE_WINDOW_SECONDS
+)
+
+def _too_many_attempts(retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many login attempts, please try again later",
+        headers={"Retry-After": str(math.ceil(retry_after))}
+    )
+
 class AuthService:
     
     @staticmethod
-    def authenticate_counselor(email: str, password: str) -> dict:
+    async def authenticate_counselor(email: str, password: str, client_ip: Optional[str] = None) -> dict:
         """
         Authenticate counselor/admin and return JWT token
+
+        Throttled per account (failures) and per client IP (attempts) before
+        any bcrypt work is done, so brute force cannot burn CPU.
         """
-        query = """
-        MATCH (c:Counselor {email: $email})
-        RETURN c.counselor_id as counselor_id, 
-               c.full_name as full_name,
-               c.email as email,
-               c.password_hash as password_hash
-        """
+        account_key = email.lower()
+        retry_after = max(
+            account_failures.retry_after(account_key),
+            ip_attempts.retry_after(client_ip) if client_ip else 0.0
+        )
+        if retry_after > 0:
+            raise _too_many_attempts(retry_after)
+        if client_ip:
+            ip_attempts.hit(client_ip)
         
-        result = neo4j_service.execute_query(query, {"email": email})
+        counselor = await counselor_repository.by_email(email)
         
-        if not result:
+        if not counselor:
+            account_failures.hit(account_key)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
             )
         
-        counselor = result[0]
-        
-        # Verify password
-        if not verify_password(password, counselor["password_hash"]):
+        # Verify password (off the event loop)
+        if not await password_hasher.verify(password, counselor["password_hash"]):
+            account_failures.hit(account_key)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password"
             )
         
+        account_failures.reset(account_key)
+        
         # Generate JWT token
         access_token = create_access_token(
             data={
@@ -56,29 +82,16 @@ class AuthService:
         }
     
     @staticmethod
-    def create_counselor(full_name: str, email: str, employee_id: str, 
+    async def create_counselor(full_name: str, email: str, employee_id: str, 
                         specialization: str, password: str) -> str:
         """
         Create a new counselor account (for initial setup)
         """
         import uuid
         counselor_id = str(uuid.uuid4())
-        password_hash = hash_password(password)
+        password_hash = await password_hasher.hash(password)
         
-        query = """
-        CREATE (c:Counselor {
-            counselor_id: $counselor_id,
-            full_name: $full_name,
-            email: $email,
-            employee_id: $employee_id,
-            specialization: $specialization,
-            password_hash: $password_hash,
-            created_at: datetime()
-        })
-        RETURN c.counselor_id as counselor_id
-        """
-        
-        result = neo4j_service.execute_write(query, {
+        await counselor_repository.create({
             "counselor_id": counselor_id,
             "full_name": full_name,
             "email": email,
@@ -87,6 +100,13 @@ class AuthService:
             "password_hash": password_hash
         })
         
-        return result["counselor_id"]
+        counselor_directory.add({
+            "counselor_id": counselor_id,
+            "email": email,
+            "full_name": full_name,
+            "specialization": specialization
+        })
+        
+        return counselor_id
 
 auth_service = AuthService()
@@ -0,0 +1,49 @@
+from repositories import counselor_repository
+from config import get_settings
+from typing import Dict, Optional
+import asyncio
+import time
+
+settings = get_settings()
+
+class CounselorDirectory:
+    """
+    In-memory map of every counselor account, so authenticated requests can
+    check that the token's counselor still exists with a dict lookup.
+
+    create_counselor and delete_counselor update it directly, so changes
+    made through this worker apply immediately. The whole map is reloaded
+    after COUNSELOR_DIRECTORY_TTL_SECONDS to pick up changes made by other
+    workers.
+    """
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._counselors: Dict[str, dict] = {}
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def _refresh(self):
+        async with self._lock:
+            # Another request may have reloaded while we waited
+            if time.monotonic() < self._expires_at:
+                return
+            rows = await counselor_repository.directory()
+            self._counselors = {row["counselor_id"]: row for row in rows}
+            self._expires_at = time.monotonic() + self.ttl_seconds
+
+    async def get(self, counselor_id: str) -> Optional[dict]:
+        if time.monotonic() >= self._expires_at:
+            await self._refresh()
+        return self._counselors.get(counselor_id)
+
+    def add(self, counselor: dict):
+        self._counselors[counselor["counselor_id"]] = counselor
+
+    def remove(self, counselor_id: str):
+        self._counselors.pop(counselor_id, None)
+
+    def invalidate(self):
+        """Force a reload on the next lookup"""
+        self._expires_at = 0.0
+
+counselor_directory = CounselorDirectory(settings.COUNSELOR_DIRECTORY_TTL_SECONDS)
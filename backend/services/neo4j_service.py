@@ -1,77 +1,344 @@
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase
+from neo4j.exceptions import DriverError, Neo4jError
+from fastapi import HTTPException
 from config import get_settings
-from typing import Optional, List, Dict, Any
+from utils.circuit_breaker import CircuitBreaker, OPEN
+from utils.metrics import metrics as metrics_registry
+from utils.query_profile import QueryProfileLog
+from services.queries import render
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable
+import asyncio
 import logging
+import math
+import random
+import time
 
 logger = logging.getLogger(__name__)
 
-class Neo4jService:
+query_latency = metrics_registry.histogram(
+    "neo4j_query_duration_seconds",
+    "Neo4j query latency by logical query name, retries included",
+    ("query", "outcome")
+)
+transaction_start = metrics_registry.histogram(
+    "neo4j_transaction_start_seconds",
+    "Time until a managed transaction function starts (pool wait plus BEGIN)",
+    ()
+)
+
+class AsyncNeo4jService:
+    """
+    Non-blocking Neo4j access built on the driver's AsyncGraphDatabase.
+    Queries are awaited, so a slow Aura round trip only suspends the
+    request that issued it instead of the whole worker.
+
+    Importing this module does no I/O: the driver is created by open()
+    (called from the app lifespan, or on first use by scripts) and the pool
+    connects on demand.
+    """
     def __init__(self):
         settings = get_settings()
-        self.driver = GraphDatabase.driver(
-            settings.NEO4J_URI,
-            auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD),
-            max_connection_lifetime=3600,
-            max_connection_pool_size=50,
-            connection_acquisition_timeout=120,
-            connection_timeout=30,
-            keep_alive=True
+        self.driver = None
+        self.database = None
+        self.retry_deadline = settings.NEO4J_RETRY_DEADLINE_SECONDS
+        self.retry_base_delay = settings.NEO4J_RETRY_BASE_DELAY_SECONDS
+        self.retry_max_delay = settings.NEO4J_RETRY_MAX_DELAY_SECONDS
+        self.breaker = CircuitBreaker(
+            settings.NEO4J_BREAKER_FAILURE_THRESHOLD,
+            settings.NEO4J_BREAKER_RESET_SECONDS
+        )
+        self.counters = {"attempts": 0, "retries": 0, "gave_up": 0, "non_retryable": 0}
+        self.slow_query_ms = settings.SLOW_QUERY_THRESHOLD_MS
+        self.slow_queries = 0
+        self.profiles = QueryProfileLog(
+            settings.QUERY_PROFILE_LOG_PATH,
+            settings.QUERY_PROFILE_SAMPLE_RATE,
+            settings.QUERY_PROFILE_LOG_MAX_BYTES,
+            settings.QUERY_PROFILE_LOG_BACKUPS
         )
-        self._verify_connection()
-    
-    def _verify_connection(self):
+
+    def open(self):
+        """Create the driver if needed (no network round trip) and return it"""
+        if self.driver is None:
+            settings = get_settings()
+            self.database = settings.NEO4J_DATABASE
+            self.driver = AsyncGraphDatabase.driver(
+                settings.NEO4J_URI,
+                auth=(settings.NEO4J_USERNAME, settings.NEO4J_PASSWORD),
+                max_connection_lifetime=3600,
+                max_connection_pool_size=settings.NEO4J_MAX_POOL_SIZE,
+                connection_acquisition_timeout=120,
+                connection_timeout=30,
+                keep_alive=True,
+                # Retries are ours (_with_retries): one attempt per managed
+                # transaction so backoff, deadline and breaker stay in charge
+                max_transaction_retry_time=0
+            )
+        return self.driver
+
+    def _session(self):
+        return self.open().session(database=self.database)
+
+    async def verify_connection(self):
         """Verify connection to Neo4j Aura"""
         try:
-            with self.driver.session() as session:
-                result = session.run("RETURN 1 as test")
-                result.single()
+            async with self._session() as session:
+                result = await session.run("RETURN 1 as test")
+                await result.single()
                 logger.info("✅ Successfully connected to Neo4j Aura")
         except Exception as e:
             logger.error(f"❌ Failed to connect to Neo4j: {e}")
             raise
-    
-    def close(self):
-        self.driver.close()
-    
-    def execute_query(self, query: str, parameters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-        """Execute a Cypher query and return results with retry logic"""
-        max_retries = 3
-        retry_count = 0
-        
-        while retry_count < max_retries:
+
+    async def warm_up(self, connections: int):
+        """
+        Open `connections` pooled connections at once, so the first real
+        requests after a cold start don't each pay for a TLS handshake
+        """
+        async def ping():
+            async with self._session() as session:
+                result = await session.run("RETURN 1")
+                await result.consume()
+
+        await asyncio.gather(*(ping() for _ in range(connections)))
+
+    async def close(self):
+        if self.driver is not None:
+            await self.driver.close()
+            self.driver = None
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1)))
+
+    def _refuse(self):
+        raise HTTPException(
+            status_code=503,
+            detail="Database temporarily unavailable. Please try again shortly.",
+            headers={"Retry-After": str(max(1, math.ceil(self.breaker.retry_after())))}
+        )
+
+    async def _with_retries(self, operation: Callable[[], Awaitable[Any]], name: str) -> Any:
+        """
+        Run `operation`, retrying only errors the driver marks retryable
+        (transient server errors, expired sessions, lost connections) until
+        the retry deadline. Anything else - syntax errors, constraint
+        violations - is raised on the first attempt. Connection-level
+        failures feed the circuit breaker; while it is open calls fail fast
+        with a 503 instead of waiting on an unreachable server.
+        """
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await self._attempt(operation)
+            outcome = "ok"
+            return result
+        except HTTPException:
+            outcome = "refused"
+            raise
+        finally:
+            query_latency.observe((name, outcome), time.perf_counter() - started)
+
+    async def _attempt(self, operation: Callable[[], Awaitable[Any]]) -> Any:
+        deadline = time.monotonic() + self.retry_deadline
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                self._refuse()
+            attempt += 1
+            self.counters["attempts"] += 1
             try:
-                with self.driver.session() as session:
-                    result = session.run(query, parameters or {})
-                    return [record.data() for record in result]
-            except Exception as e:
-                retry_count += 1
-                if retry_count >= max_retries:
-                    logger.error(f"Query failed after {max_retries} retries: {e}")
+                result = await operation()
+            except (DriverError, Neo4jError) as e:
+                if not is_transient(e):
+                    # The server answered, so the connection is fine
+                    self.breaker.record_success()
+                    self.counters["non_retryable"] += 1
                     raise
-                logger.warning(f"Query retry {retry_count}/{max_retries} after error: {e}")
-                import time
-                time.sleep(1 * retry_count)
-    
-    def execute_write(self, query: str, parameters: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
-        """Execute a write transaction with retry logic"""
-        max_retries = 3
-        retry_count = 0
-        
-        while retry_count < max_retries:
-            try:
-                with self.driver.session() as session:
-                    result = session.write_transaction(
-                        lambda tx: tx.run(query, parameters or {}).single()
-                    )
-                    return result.data() if result else None
-            except Exception as e:
-                retry_count += 1
-                if retry_count >= max_retries:
-                    logger.error(f"Failed after {max_retries} retries: {e}")
+                self.breaker.record_failure()
+                delay = self._backoff(attempt)
+                if self.breaker.state == OPEN or time.monotonic() + delay > deadline:
+                    self.counters["gave_up"] += 1
+                    logger.error(f"Query failed after {attempt} attempts: {e}")
                     raise
-                logger.warning(f"Retry {retry_count}/{max_retries} after error: {e}")
-                import time
-                time.sleep(1 * retry_count)  # Exponential backoff
+                self.counters["retries"] += 1
+                logger.warning(f"Retry {attempt} in {delay:.2f}s after transient error: {e}")
+                await asyncio.sleep(delay)
+            else:
+                self.breaker.record_success()
+                return result
+
+    def _log_if_slow(self, name: str, elapsed: float, summary, parameters: Optional[Dict[str, Any]]):
+        """
+        Warn about statements slower than SLOW_QUERY_THRESHOLD_MS, with the
+        server's own timings so network and pool waits can be told apart
+        from planning and execution. Parameter names only - values may be
+        personal data.
+        """
+        elapsed_ms = elapsed * 1000
+        if elapsed_ms < self.slow_query_ms:
+            return
+        self.slow_queries += 1
+        available = getattr(summary, "result_available_after", None)
+        consumed = getattr(summary, "result_consumed_after", None)
+        logger.warning(
+            f"Slow query {name}: {elapsed_ms:.0f} ms total, server first row after "
+            f"{available} ms, consumed after {consumed} ms, params {sorted(parameters or {})}"
+        )
+
+    async def _read(self, query: str, parameters: Optional[Dict[str, Any]], name: str) -> tuple:
+        """Rows and result summary of a managed read transaction"""
+        async def work(tx):
+            transaction_start.observe((), time.perf_counter() - requested)
+            result = await tx.run(query, parameters or {})
+            rows = [record.data() async for record in result]
+            return rows, await result.consume()
+
+        async def attempt():
+            nonlocal requested
+            requested = time.perf_counter()
+            async with self._session() as session:
+                return await session.execute_read(work)
+
+        requested = 0.0
+        started = time.perf_counter()
+        rows, summary = await self._with_retries(attempt, name)
+        self._log_if_slow(name, time.perf_counter() - started, summary, parameters)
+        return rows, summary
+
+    async def _write(self, query: str, parameters: Optional[Dict[str, Any]], name: str) -> tuple:
+        """Single row (or None) and result summary of a managed write transaction"""
+        async def work(tx):
+            transaction_start.observe((), time.perf_counter() - requested)
+            result = await tx.run(query, parameters or {})
+            record = await result.single()
+            return (record.data() if record else None), await result.consume()
+
+        async def attempt():
+            nonlocal requested
+            requested = time.perf_counter()
+            async with self._session() as session:
+                return await session.execute_write(work)
+
+        requested = 0.0
+        started = time.perf_counter()
+        row, summary = await self._with_retries(attempt, name)
+        self._log_if_slow(name, time.perf_counter() - started, summary, parameters)
+        return row, summary
+
+    async def _profiled(self, run, name: str, text: str, parameters: Optional[Dict[str, Any]]):
+        """Run a named statement, under PROFILE when it is sampled"""
+        if not self.profiles.should_sample():
+            return (await run(text, parameters, name))[0]
+        started = time.perf_counter()
+        result, summary = await run("PROFILE " + text, parameters, name)
+        self.profiles.record(name, (time.perf_counter() - started) * 1000, getattr(summary, "profile", None))
+        return result
+
+    async def query(self, name: str, parameters: Dict[str, Any] = None, **clauses) -> List[Dict[str, Any]]:
+        """
+        Run the read statement registered as `name` in services/queries.py
+        (template slots filled from `clauses`) and return its rows
+        """
+        return await self._profiled(self._read, name, render(name, **clauses), parameters)
+
+    async def write(self, name: str, parameters: Dict[str, Any] = None, **clauses) -> Optional[Dict[str, Any]]:
+        """
+        Run the write statement registered as `name` in services/queries.py
+        and return its single row
+        """
+        return await self._profiled(self._write, name, render(name, **clauses), parameters)
+
+    def stream(self, name: str, parameters: Dict[str, Any] = None, **clauses) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the rows of the read statement registered as `name`"""
+        return self.stream_query(render(name, **clauses), parameters, name=name)
+
+    async def execute_query(self, query: str, parameters: Dict[str, Any] = None, name: str = "unnamed") -> List[Dict[str, Any]]:
+        """
+        Run an ad-hoc read statement in a managed read transaction and
+        return its rows. `name` labels it in metrics and the slow-query log.
+        """
+        return (await self._read(query, parameters, name))[0]
+
+    async def stream_query(self, query: str, parameters: Dict[str, Any] = None, name: str = "unnamed") -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield result rows as the driver receives them, keeping memory flat
+        for large results. The session stays open until the iterator is
+        exhausted or closed; no retries, since rows may already be sent.
+        """
+        if not self.breaker.allow():
+            query_latency.observe((name, "refused"), 0.0)
+            self._refuse()
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            async with self._session() as session:
+                result = await session.run(query, parameters or {})
+                async for record in result:
+                    yield record.data()
+            outcome = "ok"
+        except (DriverError, Neo4jError) as e:
+            if is_transient(e):
+                self.breaker.record_failure()
+            raise
+        finally:
+            # Includes the time the client took to consume the stream
+            query_latency.observe((name, outcome), time.perf_counter() - started)
+        self.breaker.record_success()
+
+    async def execute_write(self, query: str, parameters: Dict[str, Any] = None, name: str = "unnamed") -> Optional[Dict[str, Any]]:
+        """
+        Run an ad-hoc write statement (e.g. a schema migration) in a managed
+        write transaction and return its single row
+        """
+        return (await self._write(query, parameters, name))[0]
+
+    def metrics(self) -> dict:
+        return {
+            **self.counters,
+            "slow_queries": self.slow_queries,
+            "profiles_captured": self.profiles.captured,
+            "breaker": self.breaker.metrics()
+        }
+
+    def pool_stats(self) -> dict:
+        """
+        Connection counts read from the driver's pool. The driver has no
+        public API for this, so the private structure is read defensively.
+        """
+        in_use = idle = 0
+        pool = getattr(self.driver, "_pool", None)
+        for connections in list(getattr(pool, "connections", {}).values()):
+            for connection in list(connections):
+                if getattr(connection, "in_use", False):
+                    in_use += 1
+                else:
+                    idle += 1
+        return {"in_use": in_use, "idle": idle, "max_size": get_settings().NEO4J_MAX_POOL_SIZE}
+
+    def collect(self):
+        """Families for the /metrics endpoint"""
+        pool = self.pool_stats()
+        breaker = self.breaker.metrics()
+        return [
+            ("neo4j_pool_connections", "gauge", "Pooled connections by state",
+             [({"state": "in_use"}, pool["in_use"]), ({"state": "idle"}, pool["idle"])]),
+            ("neo4j_pool_max_size", "gauge", "Configured maximum pool size", [({}, pool["max_size"])]),
+            ("neo4j_attempts_total", "counter", "Query attempts, retries included", [({}, self.counters["attempts"])]),
+            ("neo4j_retries_total", "counter", "Retries after transient errors", [({}, self.counters["retries"])]),
+            ("neo4j_gave_up_total", "counter", "Queries that failed after retrying", [({}, self.counters["gave_up"])]),
+            ("neo4j_non_retryable_errors_total", "counter", "Errors raised without retrying", [({}, self.counters["non_retryable"])]),
+            ("neo4j_slow_queries_total", "counter", "Statements slower than SLOW_QUERY_THRESHOLD_MS", [({}, self.slow_queries)]),
+            ("neo4j_breaker_open", "gauge", "1 while the circuit breaker refuses calls",
+             [({}, 0 if breaker["state"] == "closed" else 1)]),
+            ("neo4j_breaker_opens_total", "counter", "Times the circuit breaker opened", [({}, breaker["opens"])]),
+            ("neo4j_breaker_rejected_total", "counter", "Calls refused by the open breaker", [({}, breaker["rejected"])]),
+        ]
+
+def is_transient(error: Exception) -> bool:
+    """True for errors worth retrying: the driver's own classification"""
+    return isinstance(error, (DriverError, Neo4jError)) and error.is_retryable()
 
-# Singleton instance
-neo4j_service = Neo4jService()
+# Singleton instance; the app lifespan opens and closes its driver
+neo4j_service = AsyncNeo4jService()
+metrics_registry.register(neo4j_service.collect)
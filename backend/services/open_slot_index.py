@@ -0,0 +1,164 @@
+from repositories import slot_repository
+from config import get_settings
+from bisect import bisect_left, insort
+from datetime import date, datetime, time
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+def _parse_time(value: str) -> time:
+    # Repositories render times the way Neo4j's toString() does ("09:00:00Z")
+    return time.fromisoformat(value.removesuffix("Z"))
+
+def _row(counselor: dict, slot: dict) -> dict:
+    """One index entry, with times rendered the way the repositories do"""
+    return {
+        "slot_id": slot["slot_id"],
+        "date": slot["date"],
+        "start_time": _parse_time(slot["start_time"]).isoformat() + "Z",
+        "end_time": _parse_time(slot["end_time"]).isoformat() + "Z",
+        "counselor_id": counselor["counselor_id"],
+        "counselor_name": counselor["full_name"],
+        "specialization": counselor["specialization"]
+    }
+
+class _OpenSlots:
+    """Open slots keyed (start, slot_id), overall and per specialization"""
+
+    def __init__(self):
+        self.slots: Dict[str, dict] = {}
+        self.keys: List[tuple] = []
+        self.keys_by_specialization: Dict[str, List[tuple]] = {}
+
+    @staticmethod
+    def key(slot: dict) -> tuple:
+        return (datetime.combine(date.fromisoformat(slot["date"]), _parse_time(slot["start_time"])), slot["slot_id"])
+
+    def add(self, slots: Iterable[dict]):
+        for slot in slots:
+            # Idempotent, so changes replayed after a reload are harmless
+            if slot["slot_id"] in self.slots:
+                continue
+            self.slots[slot["slot_id"]] = slot
+            key = self.key(slot)
+            insort(self.keys, key)
+            insort(self.keys_by_specialization.setdefault(slot["specialization"].casefold(), []), key)
+
+    def remove(self, slot_ids: Iterable[str]):
+        for slot_id in slot_ids:
+            slot = self.slots.pop(slot_id, None)
+            if slot is None:
+                continue
+            key = self.key(slot)
+            for keys in (self.keys, self.keys_by_specialization[slot["specialization"].casefold()]):
+                i = bisect_left(keys, key)
+                if i < len(keys) and keys[i] == key:
+                    del keys[i]
+
+class OpenSlotIndex:
+    """
+    Every open slot of every counselor, sorted by start, in process memory,
+    so "the next K open slots" is a bisect and a slice that never reaches
+    the database.
+
+    The booking and slot-management code paths update it as they change
+    slots, so this worker's changes apply immediately. A background task
+    reloads it every OPEN_SLOT_INDEX_REFRESH_SECONDS to pick up changes
+    made by other workers; changes made while a reload is reading are
+    replayed onto the new copy before it replaces the old one.
+    """
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.loaded = False
+        self.reloads = 0
+        self._current = _OpenSlots()
+        self._journal: Optional[list] = None
+        self._refresher: Optional[asyncio.Task] = None
+
+    async def load(self) -> int:
+        """Rebuild from the repository; returns the number of open slots"""
+        if self._journal is not None:
+            return len(self._current.slots)
+        self._journal = []
+        try:
+            today = date.today()
+            fresh = _OpenSlots()
+            fresh.add(
+                _row(counselor, slot)
+                for counselor in await slot_repository.available()
+                for slot in counselor["available_slots"]
+                if date.fromisoformat(slot["date"]) >= today
+            )
+            for operation, argument in self._journal:
+                getattr(fresh, operation)(argument)
+            self._current = fresh
+            self.loaded = True
+            self.reloads += 1
+            return len(fresh.slots)
+        finally:
+            self._journal = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.load()
+            except Exception as e:
+                logger.warning(f"Open slot index reload failed, serving the previous copy: {e}")
+
+    async def start(self) -> int:
+        """Load, then keep reloading in the background; returns the number of open slots"""
+        if self._refresher is not None:
+            return len(self._current.slots)
+        count = await self.load()
+        self._refresher = asyncio.create_task(self._run())
+        return count
+
+    async def stop(self):
+        if self._refresher is None:
+            return
+        self._refresher.cancel()
+        try:
+            await self._refresher
+        except asyncio.CancelledError:
+            pass
+        self._refresher = None
+
+    def _apply(self, operation: str, argument: list):
+        getattr(self._current, operation)(argument)
+        if self._journal is not None:
+            self._journal.append((operation, argument))
+
+    def add(self, counselor: dict, slots: List[dict]):
+        """Slots (slot_id, date, start_time, end_time) just opened for a counselor"""
+        self._apply("add", [_row(counselor, slot) for slot in slots])
+
+    def remove(self, slot_ids: List[str]):
+        """Slots just booked or deleted"""
+        self._apply("remove", list(slot_ids))
+
+    def remove_counselor(self, counselor_id: str):
+        self.remove([s["slot_id"] for s in self._current.slots.values() if s["counselor_id"] == counselor_id])
+
+    def next(self, after: datetime, specialization: Optional[str] = None, limit: int = 10) -> List[dict]:
+        """The first `limit` open slots starting at or after `after`, earliest first"""
+        if after.tzinfo is not None:
+            # Slots are naive local wall-clock times
+            after = after.astimezone().replace(tzinfo=None)
+        current = self._current
+        if specialization is None:
+            keys = current.keys
+        else:
+            keys = current.keys_by_specialization.get(specialization.casefold(), [])
+        start = bisect_left(keys, (after,))
+        return [current.slots[slot_id] for _, slot_id in islice(keys, start, start + limit)]
+
+    def stats(self) -> dict:
+        return {"open_slots": len(self._current.slots), "reloads": self.reloads}
+
+open_slot_index = OpenSlotIndex(settings.OPEN_SLOT_INDEX_REFRESH_SECONDS)
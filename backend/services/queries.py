@@ -0,0 +1,764 @@
+"""
+Every Cypher statement the app runs, by name.
+
+The Neo4j repositories (repositories/neo4j_repository.py) and maintenance
+services call neo4j_service.query / write / stream with a name from QUERIES;
+the same name labels the statement in the latency metrics, the slow-query
+log and PROFILE captures. Statements with optional parts are templates:
+their {slots} are filled with clause text (also defined here) and their
+literal braces are doubled. Statements without slots are used as written.
+
+Schema migration statements stay in schema_service.MIGRATIONS.
+"""
+
+# ---------------------------------------------------------------------------
+# Counter, rollup and bitmap fragments
+#
+# Embedded in the statements that change the underlying data, so dashboard
+# counters, daily analytics buckets and day bitmaps move in the same
+# transaction.
+#
+# (:StatsCounter {key: 'global'})              assessment totals by stress level
+# (:StatsCounter {key: 'counselor:<id>'})      appointment totals by status
+# (:AssessmentRollup {day: date})              per-day count, score sums and
+#                                              per-stress-level counts
+# (:CounselorDay {key: '<counselor id>:<date>'}) quarter-hour bitmaps of a
+#                                              counselor's slots that day
+# ---------------------------------------------------------------------------
+
+# Count one new submission `a`
+RECORD_ASSESSMENT = """
+MERGE (stats:StatsCounter {key: 'global'})
+SET stats.total_assessments = coalesce(stats.total_assessments, 0) + 1,
+    stats.low_stress = coalesce(stats.low_stress, 0) + CASE WHEN a.stress_level = 'Low' THEN 1 ELSE 0 END,
+    stats.moderate_stress = coalesce(stats.moderate_stress, 0) + CASE WHEN a.stress_level = 'Moderate' THEN 1 ELSE 0 END,
+    stats.high_stress = coalesce(stats.high_stress, 0) + CASE WHEN a.stress_level = 'High' THEN 1 ELSE 0 END
+"""
+
+# Add one submission `a` to its day bucket
+RECORD_ASSESSMENT_ROLLUP = """
+MERGE (rollup:AssessmentRollup {day: date(a.timestamp)})
+SET rollup.count = coalesce(rollup.count, 0) + 1,
+    rollup.score_sum = coalesce(rollup.score_sum, 0.0) + a.overall_score,
+    rollup.score_sq_sum = coalesce(rollup.score_sq_sum, 0.0) + a.overall_score * a.overall_score,
+    rollup.low_stress = coalesce(rollup.low_stress, 0) + CASE WHEN a.stress_level = 'Low' THEN 1 ELSE 0 END,
+    rollup.moderate_stress = coalesce(rollup.moderate_stress, 0) + CASE WHEN a.stress_level = 'Moderate' THEN 1 ELSE 0 END,
+    rollup.high_stress = coalesce(rollup.high_stress, 0) + CASE WHEN a.stress_level = 'High' THEN 1 ELSE 0 END
+"""
+
+# Count one new Pending appointment for counselor `c`
+RECORD_APPOINTMENT = """
+MERGE (stats:StatsCounter {key: 'counselor:' + c.counselor_id})
+SET stats.total_appointments = coalesce(stats.total_appointments, 0) + 1,
+    stats.pending_appointments = coalesce(stats.pending_appointments, 0) + 1
+"""
+
+# Move one appointment of counselor `c` from `old_status` to $status
+RECORD_STATUS_CHANGE = """
+MERGE (stats:StatsCounter {key: 'counselor:' + c.counselor_id})
+SET stats.pending_appointments = coalesce(stats.pending_appointments, 0)
+        + CASE WHEN $status = 'Pending' THEN 1 ELSE 0 END - CASE WHEN old_status = 'Pending' THEN 1 ELSE 0 END,
+    stats.confirmed_appointments = coalesce(stats.confirmed_appointments, 0)
+        + CASE WHEN $status = 'Confirmed' THEN 1 ELSE 0 END - CASE WHEN old_status = 'Confirmed' THEN 1 ELSE 0 END,
+    stats.rejected_appointments = coalesce(stats.rejected_appointments, 0)
+        + CASE WHEN $status = 'Rejected' THEN 1 ELSE 0 END - CASE WHEN old_status = 'Rejected' THEN 1 ELSE 0 END,
+    stats.completed_appointments = coalesce(stats.completed_appointments, 0)
+        + CASE WHEN $status = 'Completed' THEN 1 ELSE 0 END - CASE WHEN old_status = 'Completed' THEN 1 ELSE 0 END
+"""
+
+# Recompute the quarter-hour bitmaps of counselor `c` on date `day` from
+# that day's slots (see utils/day_bitmap.py): `open` has the quarters of
+# available slots, `booked` those of occupied ones, each as two 48-bit
+# words. Cypher has no bitwise operators, so bit q of a word is added as
+# 2^q. The day node is locked before its slots are read, so concurrent
+# changes to one day apply in turn. Rows where `c` or `day` is null are
+# left alone; the row count is unchanged.
+# True when any quarter from {first} to {last} (exclusive) is set in the
+# day's `open` or `booked` words. Both slot creation paths use it to skip
+# the exact-time comparison on days where no slot can overlap
+QUARTERS_TAKEN = """any(q IN range({first}, {last} - 1) WHERE
+         toInteger(floor(open[q / 48] / 2 ^ (q % 48))) % 2 = 1
+         OR toInteger(floor(booked[q / 48] / 2 ^ (q % 48))) % 2 = 1)"""
+
+RECORD_DAY_BITMAPS = """
+CALL {
+    WITH c, day
+    WITH c, day
+    WHERE c IS NOT NULL AND day IS NOT NULL
+    MERGE (d:CounselorDay {key: c.counselor_id + ':' + toString(day)})
+    ON CREATE SET d.counselor_id = c.counselor_id, d.date = day
+    MERGE (c)-[:HAS_DAY]->(d)
+    SET d._lock = true
+    WITH c, d, day
+    OPTIONAL MATCH (c)-[:HAS_SLOT]->(s:TimeSlot)
+    WHERE s.date = day
+    WITH d, [x IN collect(s) | {
+        first: (x.start_time.hour * 60 + x.start_time.minute) / 15,
+        last: (x.end_time.hour * 60 + x.end_time.minute + 14) / 15,
+        open: x.is_available
+    }] as spans
+    SET d.open = [w IN [0, 1] | reduce(bits = 0, q IN range(0, 47) | bits + CASE
+            WHEN any(x IN spans WHERE x.open AND x.first <= w * 48 + q AND w * 48 + q < x.last)
+            THEN toInteger(2 ^ q) ELSE 0 END)],
+        d.booked = [w IN [0, 1] | reduce(bits = 0, q IN range(0, 47) | bits + CASE
+            WHEN any(x IN spans WHERE NOT x.open AND x.first <= w * 48 + q AND w * 48 + q < x.last)
+            THEN toInteger(2 ^ q) ELSE 0 END)]
+    REMOVE d._lock
+}
+"""
+
+# ---------------------------------------------------------------------------
+# Optional clauses for the list templates
+# ---------------------------------------------------------------------------
+
+AVAILABILITY_DATE_FILTER = "AND ts.date = date($target_date)"
+
+ASSESSMENT_STRESS_FILTER = "AND a.stress_level = $stress_level"
+ASSESSMENT_CURSOR_FILTER = """AND a.timestamp <= datetime($cursor_timestamp)
+          AND (a.timestamp < datetime($cursor_timestamp) OR a.submission_id < $cursor_id)"""
+
+# Joined with AND into the {where} slot
+APPOINTMENT_FILTERS = {
+    "status": "apt.status = $status",
+    "start_date": "apt.scheduled_date >= date($start_date)",
+    "end_date": "apt.scheduled_date <= date($end_date)",
+    "cursor": """(apt.scheduled_date < date($cursor_date)
+           OR (apt.scheduled_date = date($cursor_date) AND apt.scheduled_time < time($cursor_time))
+           OR (apt.scheduled_date = date($cursor_date) AND apt.scheduled_time = time($cursor_time)
+               AND apt.appointment_id < $cursor_id))""",
+}
+
+SLOT_FILTERS = {
+    "available": "ts.is_available = $available",
+    "start_date": "ts.date >= date($start_date)",
+    "end_date": "ts.date <= date($end_date)",
+    "cursor": """(ts.date > date($cursor_date)
+           OR (ts.date = date($cursor_date) AND ts.start_time > time($cursor_time))
+           OR (ts.date = date($cursor_date) AND ts.start_time = time($cursor_time)
+               AND ts.slot_id > $cursor_id))""",
+}
+
+LIMIT_CLAUSE = "LIMIT $limit"
+
+def where(filters: list) -> str:
+    """WHERE clause for the {where} slot (empty when there are no filters)"""
+    return "WHERE " + "\n          AND ".join(filters) if filters else ""
+
+# ---------------------------------------------------------------------------
+# Statements shared by more than one name
+# ---------------------------------------------------------------------------
+
+# Slots: where, limit_clause
+COUNSELOR_APPOINTMENTS = """
+MATCH (apt:Appointment)-[:ASSIGNED_TO]->(c:Counselor {{counselor_id: $counselor_id}})
+{where}
+WITH apt
+ORDER BY apt.scheduled_date DESC, apt.scheduled_time DESC, apt.appointment_id DESC
+{limit_clause}
+OPTIONAL MATCH (cl:Client)-[:HAS_APPOINTMENT]->(apt)
+RETURN apt.appointment_id as appointment_id,
+       apt.status as status,
+       toString(apt.scheduled_date) as scheduled_date,
+       toString(apt.scheduled_time) as scheduled_time,
+       toString(apt.created_at) as created_at,
+       cl.full_name as client_full_name,
+       cl.email as client_email
+ORDER BY apt.scheduled_date DESC, apt.scheduled_time DESC, apt.appointment_id DESC
+"""
+
+# Slots: where, limit_clause
+COUNSELOR_SLOTS = """
+MATCH (c:Counselor {{counselor_id: $counselor_id}})-[:HAS_SLOT]->(ts:TimeSlot)
+{where}
+WITH ts
+ORDER BY ts.date, ts.start_time, ts.slot_id
+{limit_clause}
+OPTIONAL MATCH (apt:Appointment)-[:OCCUPIES_SLOT]->(ts)
+OPTIONAL MATCH (cl:Client)-[:HAS_APPOINTMENT]->(apt)
+RETURN ts.slot_id as slot_id,
+       toString(ts.date) as date,
+       toString(ts.start_time) as start_time,
+       toString(ts.end_time) as end_time,
+       ts.is_available as is_available,
+       apt.appointment_id as appointment_id,
+       cl.full_name as client_name,
+       apt.status as appointment_status
+ORDER BY ts.date, ts.start_time, ts.slot_id
+"""
+
+QUERIES = {
+    # -- Assessments -------------------------------------------------------
+
+    # Store a submission, count it on the dashboard and add it to its
+    # daily analytics bucket
+    "assessment.submit": """
+CREATE (a:AssessmentSubmission)
+SET a += $submission,
+    a.timestamp = datetime($submission.timestamp)
+WITH a
+""" + RECORD_ASSESSMENT + RECORD_ASSESSMENT_ROLLUP + """
+RETURN a.submission_id as submission_id
+""",
+
+    # Merge many submissions on client_submission_id; only new ones are counted
+    "assessment.write_batch": """
+UNWIND $submissions AS submission
+MERGE (a:AssessmentSubmission {client_submission_id: submission.client_submission_id})
+ON CREATE SET a += submission,
+              a.timestamp = datetime(submission.timestamp),
+              a._created = true
+WITH a, a._created IS NOT NULL as created
+REMOVE a._created
+FOREACH (_ IN CASE WHEN created THEN [1] ELSE [] END |
+    """ + RECORD_ASSESSMENT + RECORD_ASSESSMENT_ROLLUP + """
+)
+RETURN collect({
+    client_submission_id: a.client_submission_id,
+    submission_id: a.submission_id,
+    created: created,
+    timestamp: toString(a.timestamp),
+    section1_score: a.section1_score,
+    section2_score: a.section2_score,
+    section3_score: a.section3_score,
+    overall_score: a.overall_score,
+    stress_level: a.stress_level,
+    recommendation: a.recommendation
+}) as results
+""",
+
+    # Keyset page, newest first. Slots: stress_filter, cursor_filter
+    "assessment.page": """
+MATCH (a:AssessmentSubmission)
+WHERE a.timestamp >= datetime($start) AND a.timestamp < datetime($end)
+  {stress_filter}
+  {cursor_filter}
+RETURN a.submission_id as submission_id,
+       toString(a.timestamp) as timestamp,
+       a.overall_score as overall_score,
+       a.stress_level as stress_level,
+       a.recommendation as recommendation
+ORDER BY a.timestamp DESC, a.submission_id DESC
+LIMIT $limit
+""",
+
+    # -- Availability and booking ------------------------------------------
+
+    # Slots: date_filter
+    "availability.list": """
+MATCH (c:Counselor)-[:HAS_SLOT]->(ts:TimeSlot)
+WHERE ts.is_available = true {date_filter}
+WITH c, ts
+ORDER BY ts.date, ts.start_time
+RETURN c.counselor_id as counselor_id,
+       c.full_name as full_name,
+       c.specialization as specialization,
+       c.email as email,
+       collect({{
+           slot_id: ts.slot_id,
+           date: toString(ts.date),
+           start_time: toString(ts.start_time),
+           end_time: toString(ts.end_time)
+       }}) as available_slots
+""",
+
+    # One statement: the slot's write lock is taken before is_available is
+    # read, so concurrent bookers of a slot serialize and one of them wins.
+    # Client details live once on the Client node, keyed by email; the
+    # latest booking's details replace earlier ones
+    "appointment.book": """
+OPTIONAL MATCH (ts:TimeSlot {slot_id: $slot_id})
+OPTIONAL MATCH (c:Counselor {counselor_id: $counselor_id})-[:HAS_SLOT]->(ts)
+OPTIONAL MATCH (a:AssessmentSubmission {submission_id: $submission_id})
+
+// Lock the slot before reading is_available
+FOREACH (_ IN CASE WHEN ts IS NULL THEN [] ELSE [1] END | SET ts._lock = true)
+
+WITH ts, c, a,
+     CASE
+         WHEN a IS NULL THEN 'submission_not_found'
+         WHEN ts IS NULL THEN 'slot_not_found'
+         WHEN c IS NULL THEN 'counselor_not_found'
+         WHEN ts.is_available <> true THEN 'slot_unavailable'
+         ELSE 'booked'
+     END as outcome
+
+FOREACH (_ IN CASE WHEN outcome = 'booked' THEN [1] ELSE [] END |
+    CREATE (apt:Appointment {
+        appointment_id: $appointment_id,
+        created_at: datetime(),
+        scheduled_date: ts.date,
+        scheduled_time: ts.start_time,
+        status: 'Pending',
+        counselor_notes: ''
+    })
+    MERGE (cl:Client {email: $client_email})
+    ON CREATE SET cl.created_at = datetime()
+    SET cl.full_name = $client_full_name,
+        cl.student_id = $client_student_id,
+        cl.course = $client_course,
+        cl.year_level = $client_year_level,
+        cl.gender = $client_gender,
+        cl.age = $client_age,
+        cl.contact_number = $client_contact_number
+    CREATE (cl)-[:HAS_APPOINTMENT]->(apt)
+    CREATE (apt)-[:BASED_ON_ASSESSMENT]->(a)
+    CREATE (apt)-[:ASSIGNED_TO]->(c)
+    CREATE (apt)-[:OCCUPIES_SLOT]->(ts)
+    SET ts.is_available = false
+    """ + RECORD_APPOINTMENT + """
+)
+
+FOREACH (_ IN CASE WHEN ts IS NULL THEN [] ELSE [1] END | REMOVE ts._lock)
+
+WITH ts, c, outcome, CASE WHEN outcome = 'booked' THEN ts.date END as day
+""" + RECORD_DAY_BITMAPS + """
+RETURN outcome,
+       toString(ts.date) as scheduled_date,
+       toString(ts.start_time) as scheduled_time,
+       c.full_name as counselor_name
+""",
+
+    # Unique-index seek on the email, then the client's own edges
+    "appointment.status_by_email": """
+MATCH (:Client {email: $email})-[:HAS_APPOINTMENT]->(apt:Appointment)-[:ASSIGNED_TO]->(c:Counselor)
+RETURN apt.appointment_id as appointment_id,
+       apt.status as status,
+       toString(apt.scheduled_date) as scheduled_date,
+       toString(apt.scheduled_time) as scheduled_time,
+       toString(apt.created_at) as created_at,
+       apt.counselor_notes as counselor_notes,
+       apt.rejection_reason as rejection_reason,
+       c.full_name as counselor_name,
+       c.email as counselor_email
+ORDER BY apt.created_at DESC
+""",
+
+    "appointment.detail": """
+MATCH (apt:Appointment {appointment_id: $appointment_id})-[:BASED_ON_ASSESSMENT]->(a:AssessmentSubmission)
+MATCH (apt)-[:ASSIGNED_TO]->(c:Counselor)
+OPTIONAL MATCH (cl:Client)-[:HAS_APPOINTMENT]->(apt)
+RETURN apt.appointment_id as appointment_id,
+       apt.status as status,
+       toString(apt.scheduled_date) as scheduled_date,
+       toString(apt.scheduled_time) as scheduled_time,
+       toString(apt.created_at) as created_at,
+       apt.counselor_notes as counselor_notes,
+       apt.rejection_reason as rejection_reason,
+       cl.full_name as client_full_name,
+       cl.email as client_email,
+       cl.student_id as client_student_id,
+       cl.course as client_course,
+       cl.year_level as client_year_level,
+       cl.gender as client_gender,
+       cl.age as client_age,
+       cl.contact_number as client_contact_number,
+       a.submission_id as assessment_submission_id,
+       toString(a.timestamp) as assessment_timestamp,
+       a.section1_raw_answers as section1_raw_answers,
+       a.section2_raw_answers as section2_raw_answers,
+       a.section3_raw_answers as section3_raw_answers,
+       a.section1_score as section1_score,
+       a.section2_score as section2_score,
+       a.section3_score as section3_score,
+       a.overall_score as overall_score,
+       a.stress_level as stress_level,
+       a.recommendation as recommendation
+""",
+
+    "appointment.update_status": """
+MATCH (apt:Appointment {appointment_id: $appointment_id})
+OPTIONAL MATCH (apt)-[:ASSIGNED_TO]->(c:Counselor)
+OPTIONAL MATCH (cl:Client)-[:HAS_APPOINTMENT]->(apt)
+
+// Lock before reading the old status so concurrent updates count correctly
+SET apt._lock = true
+WITH apt, c, cl, apt.status as old_status
+SET apt.status = $status,
+    apt.counselor_notes = $counselor_notes,
+    apt.rejection_reason = $rejection_reason
+REMOVE apt._lock
+
+FOREACH (_ IN CASE WHEN c IS NULL THEN [] ELSE [1] END |
+    """ + RECORD_STATUS_CHANGE + """
+)
+
+RETURN apt.appointment_id as appointment_id,
+       apt.status as status,
+       cl.email as client_email
+""",
+
+    "appointment.page": COUNSELOR_APPOINTMENTS,
+    "appointment.stream": COUNSELOR_APPOINTMENTS,
+
+    # -- Time slots ---------------------------------------------------------
+
+    # Refused when it overlaps another slot of the counselor's day. The
+    # day's bitmap words are a prefilter: only when a quarter from $first
+    # to $last (exclusive) is covered are that day's slots compared by
+    # exact times, so slots that merely share a quarter (11:05-11:20 and
+    # 11:20-11:40) both fit. The counselor lock serializes creates
+    "slot.create": """
+MATCH (c:Counselor {counselor_id: $counselor_id})
+SET c._lock = true
+WITH c, date($date) as day
+OPTIONAL MATCH (c)-[:HAS_DAY]->(existing:CounselorDay {date: day})
+WITH c, day,
+     coalesce(existing.open, [0, 0]) as open,
+     coalesce(existing.booked, [0, 0]) as booked
+WITH c, day, CASE WHEN """ + QUARTERS_TAKEN.format(first="$first", last="$last") + """
+     THEN EXISTS {
+         MATCH (c)-[:HAS_SLOT]->(s:TimeSlot)
+         WHERE s.date = day
+           AND s.start_time < time($end_time)
+           AND s.end_time > time($start_time)
+     }
+     ELSE false END as overlaps
+FOREACH (_ IN CASE WHEN overlaps THEN [] ELSE [1] END |
+    CREATE (ts:TimeSlot {
+        slot_id: $slot_id,
+        date: day,
+        start_time: time($start_time),
+        end_time: time($end_time),
+        is_available: true
+    })
+    CREATE (c)-[:HAS_SLOT]->(ts)
+)
+WITH c, overlaps, CASE WHEN overlaps THEN null ELSE day END as day
+""" + RECORD_DAY_BITMAPS + """
+REMOVE c._lock
+RETURN $slot_id as slot_id, overlaps
+""",
+
+    # The same rule as slot.create per requested slot (bitmap prefilter,
+    # then exact times), naming one existing slot it collides with. Locking
+    # the counselor keeps concurrent bulk requests from interleaving between
+    # check and writes
+    "slot.create_bulk": """
+MATCH (c:Counselor {counselor_id: $counselor_id})
+SET c._lock = true
+WITH c
+CALL {
+    WITH c
+    UNWIND $slots AS s
+    OPTIONAL MATCH (c)-[:HAS_DAY]->(d:CounselorDay {date: date(s.date)})
+    WITH c, s, coalesce(d.open, [0, 0]) as open, coalesce(d.booked, [0, 0]) as booked
+    WHERE """ + QUARTERS_TAKEN.format(first="s.first", last="s.last") + """
+    MATCH (c)-[:HAS_SLOT]->(existing:TimeSlot)
+    WHERE existing.date = date(s.date)
+      AND existing.start_time < time(s.end_time)
+      AND existing.end_time > time(s.start_time)
+    WITH s, head(collect(existing.slot_id)) as existing_slot_id
+    RETURN collect({
+        date: s.date,
+        start_time: s.start_time,
+        end_time: s.end_time,
+        existing_slot_id: existing_slot_id
+    }) as conflicts
+}
+FOREACH (s IN CASE WHEN size(conflicts) = 0 THEN $slots ELSE [] END |
+    CREATE (ts:TimeSlot {
+        slot_id: s.slot_id,
+        date: date(s.date),
+        start_time: time(s.start_time),
+        end_time: time(s.end_time),
+        is_available: true
+    })
+    CREATE (c)-[:HAS_SLOT]->(ts)
+)
+WITH c, conflicts
+CALL {
+    WITH c, conflicts
+    UNWIND CASE WHEN size(conflicts) = 0 THEN $days ELSE [] END AS day_text
+    WITH c, date(day_text) as day
+    """ + RECORD_DAY_BITMAPS + """
+}
+REMOVE c._lock
+RETURN conflicts
+""",
+
+    # Only slots no appointment occupies
+    "slot.delete": """
+MATCH (ts:TimeSlot {slot_id: $slot_id})
+OPTIONAL MATCH (apt:Appointment)-[:OCCUPIES_SLOT]->(ts)
+OPTIONAL MATCH (c:Counselor)-[:HAS_SLOT]->(ts)
+WITH ts, apt, c, ts.date as day
+WHERE apt IS NULL
+DETACH DELETE ts
+WITH c, day
+""" + RECORD_DAY_BITMAPS + """
+RETURN count(*) as deleted
+""",
+
+    # One CounselorDay per counselor with bitmaps on the date
+    "slot.day_bitmaps": """
+MATCH (c:Counselor)-[:HAS_DAY]->(d:CounselorDay {date: date($date)})
+RETURN c.counselor_id as counselor_id,
+       c.full_name as full_name,
+       c.specialization as specialization,
+       d.open as open,
+       d.booked as booked,
+       [(c)-[:HAS_SLOT]->(s:TimeSlot) WHERE s.date = d.date AND s.is_available
+        | {start_time: toString(s.start_time), end_time: toString(s.end_time)}] as open_slots
+""",
+
+    # Migration 8: bitmaps for every day on which the given counselors
+    # have slots. Recomputed from the slots, so re-runs are harmless
+    "slot.backfill_day_bitmaps": """
+MATCH (c:Counselor)-[:HAS_SLOT]->(ts:TimeSlot)
+WHERE c.counselor_id IN $counselor_ids
+WITH DISTINCT c, ts.date as day
+""" + RECORD_DAY_BITMAPS + """
+RETURN count(*) as days
+""",
+
+    "slot.page": COUNSELOR_SLOTS,
+    "slot.stream": COUNSELOR_SLOTS,
+
+    # -- Counselors ---------------------------------------------------------
+
+    "counselor.by_email": """
+MATCH (c:Counselor {email: $email})
+RETURN c.counselor_id as counselor_id,
+       c.full_name as full_name,
+       c.email as email,
+       c.password_hash as password_hash
+""",
+
+    "counselor.create": """
+CREATE (c:Counselor {
+    counselor_id: $counselor_id,
+    full_name: $full_name,
+    email: $email,
+    employee_id: $employee_id,
+    specialization: $specialization,
+    password_hash: $password_hash,
+    created_at: datetime()
+})
+RETURN c.counselor_id as counselor_id
+""",
+
+    "counselor.directory": """
+MATCH (c:Counselor)
+RETURN c.counselor_id as counselor_id,
+       c.email as email,
+       c.full_name as full_name,
+       c.specialization as specialization
+""",
+
+    "counselor.list": """
+MATCH (c:Counselor)
+RETURN c.counselor_id as counselor_id,
+       c.full_name as full_name,
+       c.email as email,
+       c.employee_id as employee_id,
+       c.specialization as specialization,
+       toString(c.created_at) as created_at
+ORDER BY c.full_name
+""",
+
+    "counselor.delete": """
+MATCH (c:Counselor {counselor_id: $counselor_id})
+OPTIONAL MATCH (stats:StatsCounter {key: 'counselor:' + c.counselor_id})
+OPTIONAL MATCH (c)-[:HAS_DAY]->(d:CounselorDay)
+WITH c, stats, collect(d) as days
+FOREACH (d IN days | DETACH DELETE d)
+DETACH DELETE c, stats
+RETURN count(c) as deleted
+""",
+
+    # -- Dashboard counters -------------------------------------------------
+
+    # One node lookup each
+    "stats.assessment_counts": """
+OPTIONAL MATCH (g:StatsCounter {key: 'global'})
+RETURN coalesce(g.total_assessments, 0) as total_assessments,
+       coalesce(g.low_stress, 0) as low_stress,
+       coalesce(g.moderate_stress, 0) as moderate_stress,
+       coalesce(g.high_stress, 0) as high_stress
+""",
+
+    "stats.counselor_counts": """
+OPTIONAL MATCH (s:StatsCounter {key: $counselor_key})
+RETURN coalesce(s.total_appointments, 0) as total_appointments,
+       coalesce(s.pending_appointments, 0) as pending_appointments,
+       coalesce(s.confirmed_appointments, 0) as confirmed_appointments,
+       coalesce(s.rejected_appointments, 0) as rejected_appointments,
+       coalesce(s.completed_appointments, 0) as completed_appointments
+""",
+
+    "stats.rebuild_global": """
+OPTIONAL MATCH (a:AssessmentSubmission)
+WITH count(a) as total,
+     count(CASE WHEN a.stress_level = 'Low' THEN 1 END) as low,
+     count(CASE WHEN a.stress_level = 'Moderate' THEN 1 END) as moderate,
+     count(CASE WHEN a.stress_level = 'High' THEN 1 END) as high
+MERGE (g:StatsCounter {key: 'global'})
+SET g.total_assessments = total,
+    g.low_stress = low,
+    g.moderate_stress = moderate,
+    g.high_stress = high
+RETURN g.total_assessments as total_assessments
+""",
+
+    "stats.rebuild_counselors": """
+MATCH (c:Counselor)
+OPTIONAL MATCH (apt:Appointment)-[:ASSIGNED_TO]->(c)
+WITH c, count(apt) as total,
+     count(CASE WHEN apt.status = 'Pending' THEN 1 END) as pending,
+     count(CASE WHEN apt.status = 'Confirmed' THEN 1 END) as confirmed,
+     count(CASE WHEN apt.status = 'Rejected' THEN 1 END) as rejected,
+     count(CASE WHEN apt.status = 'Completed' THEN 1 END) as completed
+MERGE (s:StatsCounter {key: 'counselor:' + c.counselor_id})
+SET s.total_appointments = total,
+    s.pending_appointments = pending,
+    s.confirmed_appointments = confirmed,
+    s.rejected_appointments = rejected,
+    s.completed_appointments = completed
+RETURN count(s) as counselors
+""",
+
+    "stats.rebuild_orphans": """
+MATCH (s:StatsCounter)
+WHERE s.key STARTS WITH 'counselor:'
+  AND NOT EXISTS {
+      MATCH (:Counselor {counselor_id: substring(s.key, size('counselor:'))})
+  }
+DELETE s
+RETURN count(*) as removed
+""",
+
+    # -- Analytics rollups --------------------------------------------------
+
+    "analytics.summary": """
+OPTIONAL MATCH (r:AssessmentRollup)
+WHERE $days IS NULL OR r.day > date() - duration({days: $days})
+RETURN coalesce(sum(r.count), 0) as total_assessments,
+       coalesce(sum(r.score_sum), 0.0) as score_sum,
+       coalesce(sum(r.score_sq_sum), 0.0) as score_sq_sum,
+       coalesce(sum(r.low_stress), 0) as low_stress,
+       coalesce(sum(r.moderate_stress), 0) as moderate_stress,
+       coalesce(sum(r.high_stress), 0) as high_stress
+""",
+
+    "analytics.timeseries": """
+MATCH (r:AssessmentRollup)
+WHERE $days IS NULL OR r.day > date() - duration({days: $days})
+RETURN toString(r.day) as day,
+       r.count as total_assessments,
+       r.score_sum / r.count as average_score,
+       r.low_stress as low_stress,
+       r.moderate_stress as moderate_stress,
+       r.high_stress as high_stress
+ORDER BY r.day
+""",
+
+    # Overwrites buckets, so it is idempotent
+    "analytics.backfill": """
+MATCH (a:AssessmentSubmission)
+WITH date(a.timestamp) as day,
+     count(a) as total,
+     sum(a.overall_score) as score_sum,
+     sum(a.overall_score * a.overall_score) as score_sq_sum,
+     count(CASE WHEN a.stress_level = 'Low' THEN 1 END) as low,
+     count(CASE WHEN a.stress_level = 'Moderate' THEN 1 END) as moderate,
+     count(CASE WHEN a.stress_level = 'High' THEN 1 END) as high
+MERGE (r:AssessmentRollup {day: day})
+SET r.count = total,
+    r.score_sum = score_sum,
+    r.score_sq_sum = score_sq_sum,
+    r.low_stress = low,
+    r.moderate_stress = moderate,
+    r.high_stress = high
+RETURN count(r) as buckets
+""",
+
+    # -- Rescoring (scripts/rescore.py) -------------------------------------
+
+    # Keyset pages of submissions in submission_id order. Legacy submissions
+    # carry no scoring_version; they were scored with version 1
+    "rescore.fetch": """
+MATCH (a:AssessmentSubmission)
+WHERE a.submission_id > $after
+RETURN a.submission_id as submission_id,
+       coalesce(a.scoring_version, 1) as scoring_version,
+       a.stress_level as stress_level,
+       a.section1_raw_answers as section1,
+       a.section2_raw_answers as section2,
+       a.section3_raw_answers as section3
+ORDER BY a.submission_id
+LIMIT $limit
+""",
+
+    "rescore.write": """
+UNWIND $rows AS row
+MATCH (a:AssessmentSubmission {submission_id: row.submission_id})
+SET a.section1_raw_answers = row.section1_raw_answers,
+    a.section2_raw_answers = row.section2_raw_answers,
+    a.section3_raw_answers = row.section3_raw_answers,
+    a.section1_score = row.section1_score,
+    a.section2_score = row.section2_score,
+    a.section3_score = row.section3_score,
+    a.overall_score = row.overall_score,
+    a.stress_level = row.stress_level,
+    a.recommendation = row.recommendation,
+    a.scoring_version = row.scoring_version
+RETURN count(a) as updated
+""",
+
+    # -- Clients ------------------------------------------------------------
+
+    # Migration 7: move the client_* copies of up to $batch_size appointments
+    # onto one Client per (lower-cased) email. The latest details win: a
+    # batch is applied oldest first and skips an appointment when its client
+    # already has a newer one linked, so no pass sorts the whole backlog.
+    # Linked appointments lose the copies, so repeating it until it links
+    # nothing backfills everything, and re-runs are no-ops
+    "client.backfill_batch": """
+MATCH (apt:Appointment)
+WHERE apt.client_email IS NOT NULL
+WITH apt
+LIMIT $batch_size
+MERGE (cl:Client {email: toLower(apt.client_email)})
+ON CREATE SET cl.created_at = apt.created_at
+WITH cl, apt
+OPTIONAL MATCH (cl)-[:HAS_APPOINTMENT]->(newer:Appointment)
+WHERE newer.created_at > apt.created_at
+WITH cl, apt, count(newer) = 0 as latest
+ORDER BY apt.created_at
+FOREACH (_ IN CASE WHEN latest THEN [1] ELSE [] END |
+    SET cl.full_name = apt.client_full_name,
+        cl.student_id = apt.client_student_id,
+        cl.course = apt.client_course,
+        cl.year_level = apt.client_year_level,
+        cl.gender = apt.client_gender,
+        cl.age = apt.client_age,
+        cl.contact_number = apt.client_contact_number
+)
+MERGE (cl)-[:HAS_APPOINTMENT]->(apt)
+REMOVE apt.client_full_name, apt.client_email, apt.client_student_id, apt.client_course,
+       apt.client_year_level, apt.client_gender, apt.client_age, apt.client_contact_number
+RETURN count(apt) as linked
+""",
+
+    # -- Schema migrations --------------------------------------------------
+
+    "schema.version": """
+OPTIONAL MATCH (m:SchemaMigration)
+RETURN coalesce(max(m.version), 0) as version
+""",
+
+    "schema.record_migration": """
+MERGE (m:SchemaMigration {version: $version})
+ON CREATE SET m.description = $description,
+              m.applied_at = datetime()
+RETURN m.version as version
+""",
+}
+
+def render(name: str, **clauses) -> str:
+    """Statement text for `name`, with template slots filled from `clauses`"""
+    try:
+        text = QUERIES[name]
+    except KeyError:
+        raise KeyError(f"Unknown query name: {name}") from None
+    return text.format(**clauses) if clauses else text
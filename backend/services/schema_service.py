@@ -0,0 +1,189 @@
+from services.neo4j_service import neo4j_service
+from services.stats_service import StatsService
+from services.analytics_service import AnalyticsService
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Appointments linked per transaction by the client backfill
+CLIENT_BACKFILL_BATCH_SIZE = 1000
+
+async def backfill_clients() -> int:
+    """
+    Link every appointment that still carries client_* copies to its Client,
+    in bounded transactions. Returns the number of appointments linked.
+    """
+    total = 0
+    while True:
+        result = await neo4j_service.write("client.backfill_batch", {"batch_size": CLIENT_BACKFILL_BATCH_SIZE})
+        linked = result["linked"] if result else 0
+        if not linked:
+            return total
+        total += linked
+        logger.info(f"Linked {total} appointments to clients")
+
+# Counselors whose day bitmaps are computed per transaction by the backfill
+DAY_BITMAP_BACKFILL_BATCH_SIZE = 20
+
+async def backfill_day_bitmaps() -> int:
+    """
+    Compute the quarter-hour bitmaps of every counselor-day that has slots,
+    a few counselors per transaction. Returns the number of days computed.
+    """
+    counselors = await neo4j_service.query("counselor.directory")
+    counselor_ids = [c["counselor_id"] for c in counselors]
+    total = 0
+    for i in range(0, len(counselor_ids), DAY_BITMAP_BACKFILL_BATCH_SIZE):
+        result = await neo4j_service.write("slot.backfill_day_bitmaps", {
+            "counselor_ids": counselor_ids[i:i + DAY_BITMAP_BACKFILL_BATCH_SIZE]
+        })
+        total += result["days"] if result else 0
+    logger.info(f"Computed bitmaps for {total} counselor days")
+    return total
+
+# Ordered, append-only list of schema migrations. Every statement must be
+# idempotent (IF [NOT] EXISTS) so a half-applied migration can simply be re-run.
+# An optional "backfill" coroutine function runs after the statements to
+# populate derived data; it must be idempotent too.
+# Never edit a released migration - add a new version instead.
+MIGRATIONS = [
+    {
+        "version": 1,
+        "description": "Uniqueness constraints for lookup keys",
+        "statements": [
+            "CREATE CONSTRAINT counselor_email_unique IF NOT EXISTS "
+            "FOR (c:Counselor) REQUIRE c.email IS UNIQUE",
+            "CREATE CONSTRAINT counselor_id_unique IF NOT EXISTS "
+            "FOR (c:Counselor) REQUIRE c.counselor_id IS UNIQUE",
+            "CREATE CONSTRAINT timeslot_id_unique IF NOT EXISTS "
+            "FOR (ts:TimeSlot) REQUIRE ts.slot_id IS UNIQUE",
+            "CREATE CONSTRAINT submission_id_unique IF NOT EXISTS "
+            "FOR (a:AssessmentSubmission) REQUIRE a.submission_id IS UNIQUE",
+            "CREATE CONSTRAINT appointment_id_unique IF NOT EXISTS "
+            "FOR (apt:Appointment) REQUIRE apt.appointment_id IS UNIQUE",
+        ]
+    },
+    {
+        "version": 2,
+        "description": "Range and composite indexes for filters and scans",
+        "statements": [
+            "CREATE INDEX appointment_client_email IF NOT EXISTS "
+            "FOR (apt:Appointment) ON (apt.client_email)",
+            "CREATE INDEX submission_timestamp IF NOT EXISTS "
+            "FOR (a:AssessmentSubmission) ON (a.timestamp)",
+            "CREATE INDEX timeslot_date IF NOT EXISTS "
+            "FOR (ts:TimeSlot) ON (ts.date)",
+            "CREATE INDEX timeslot_available_date IF NOT EXISTS "
+            "FOR (ts:TimeSlot) ON (ts.is_available, ts.date)",
+        ]
+    },
+    {
+        "version": 3,
+        "description": "Materialized dashboard counters",
+        "statements": [
+            "CREATE CONSTRAINT stats_counter_key_unique IF NOT EXISTS "
+            "FOR (s:StatsCounter) REQUIRE s.key IS UNIQUE",
+        ],
+        "backfill": StatsService.rebuild
+    },
+    {
+        "version": 4,
+        "description": "Daily assessment rollups for analytics",
+        "statements": [
+            "CREATE CONSTRAINT assessment_rollup_day_unique IF NOT EXISTS "
+            "FOR (r:AssessmentRollup) REQUIRE r.day IS UNIQUE",
+        ],
+        "backfill": AnalyticsService.backfill
+    },
+    {
+        "version": 5,
+        "description": "Composite index for stress-level filtered submission pages",
+        "statements": [
+            "CREATE INDEX submission_stress_timestamp IF NOT EXISTS "
+            "FOR (a:AssessmentSubmission) ON (a.stress_level, a.timestamp)",
+        ]
+    },
+    {
+        "version": 6,
+        "description": "Idempotency keys for batched submissions",
+        "statements": [
+            "CREATE CONSTRAINT submission_client_id_unique IF NOT EXISTS "
+            "FOR (a:AssessmentSubmission) REQUIRE a.client_submission_id IS UNIQUE",
+        ]
+    },
+    {
+        "version": 7,
+        "description": "Client nodes keyed by email for appointment status lookups",
+        "statements": [
+            "CREATE CONSTRAINT client_email_unique IF NOT EXISTS "
+            "FOR (cl:Client) REQUIRE cl.email IS UNIQUE",
+        ],
+        "backfill": backfill_clients
+    },
+    {
+        "version": 8,
+        "description": "Quarter-hour availability bitmaps per counselor day",
+        "statements": [
+            "CREATE CONSTRAINT counselor_day_key_unique IF NOT EXISTS "
+            "FOR (d:CounselorDay) REQUIRE d.key IS UNIQUE",
+            "CREATE INDEX counselor_day_date IF NOT EXISTS "
+            "FOR (d:CounselorDay) ON (d.date)",
+        ],
+        "backfill": backfill_day_bitmaps
+    },
+    {
+        "version": 9,
+        "description": "Drop the appointment client email index",
+        "statements": [
+            # Appointments no longer carry the client's email once migration 7
+            # has backfilled; its batches find them through this index
+            "DROP INDEX appointment_client_email IF EXISTS",
+        ]
+    },
+]
+
+LATEST_VERSION = MIGRATIONS[-1]["version"]
+
+class SchemaService:
+
+    @staticmethod
+    async def get_applied_version() -> int:
+        """
+        Return the highest migration version recorded in the graph (0 if none)
+        """
+        result = await neo4j_service.query("schema.version")
+        return result[0]["version"] if result else 0
+
+    @staticmethod
+    async def apply_migrations() -> int:
+        """
+        Apply every migration newer than the recorded version, in order,
+        and record each one as a SchemaMigration node. Safe to call from
+        several workers at once: statements are idempotent and the version
+        node is merged.
+        """
+        current = await SchemaService.get_applied_version()
+
+        for migration in MIGRATIONS:
+            if migration["version"] <= current:
+                continue
+
+            logger.info(f"Applying schema migration {migration['version']}: {migration['description']}")
+
+            # Schema commands cannot share a transaction with data writes,
+            # so each statement runs in its own transaction
+            for statement in migration["statements"]:
+                await neo4j_service.execute_write(statement, name="schema.migration_statement")
+            
+            if "backfill" in migration:
+                await migration["backfill"]()
+
+            await neo4j_service.write("schema.record_migration", {
+                "version": migration["version"],
+                "description": migration["description"]
+            })
+            current = migration["version"]
+
+        return current
+
+schema_service = SchemaService()
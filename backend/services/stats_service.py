@@ -0,0 +1,44 @@
+from services.neo4j_service import neo4j_service
+from repositories import appointment_repository, assessment_repository
+import asyncio
+
+# Materialized dashboard counters
+#
+# (:StatsCounter {key: 'global'})              assessment totals by stress level
+# (:StatsCounter {key: 'counselor:<id>'})      appointment totals by status
+#
+# The statements that change the underlying data embed the RECORD_*
+# fragments from services/queries.py, so counters move in the same
+# transaction as the data.
+
+class StatsService:
+
+    @staticmethod
+    async def get_dashboard_stats(counselor_id: str) -> dict:
+        """
+        Read dashboard counters for a counselor (two concurrent counter lookups)
+        """
+        appointments, assessments = await asyncio.gather(
+            appointment_repository.status_counts(counselor_id),
+            assessment_repository.stress_counts()
+        )
+        return {**appointments, **assessments}
+
+    @staticmethod
+    async def rebuild() -> dict:
+        """
+        Recompute every Neo4j counter from the underlying nodes. Fixes any
+        drift; run it during quiet hours since it scans all submissions and
+        appointments. (The in-memory backend keeps its counters exact.)
+        """
+        assessments = await neo4j_service.write("stats.rebuild_global")
+        counselors = await neo4j_service.write("stats.rebuild_counselors")
+        orphans = await neo4j_service.write("stats.rebuild_orphans")
+
+        return {
+            "total_assessments": assessments["total_assessments"],
+            "counselors": counselors["counselors"] if counselors else 0,
+            "orphans_removed": orphans["removed"] if orphans else 0
+        }
+
+stats_service = StatsService()
@@ -0,0 +1,270 @@
+from utils.metrics import metrics
+from typing import Awaitable, Callable, Dict, List, Optional
+import asyncio
+import itertools
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Longest pause of the flusher after repeated errors
+MAX_FLUSH_BACKOFF_SECONDS = 30.0
+
+class SubmissionBuffer:
+    """
+    Write-behind buffer for scored assessment submissions.
+
+    add() appends the submission to a local write-ahead log and returns once
+    the log is fsynced; concurrent adds inside the same commit window share
+    one fsync (group commit). A background task drains the buffer to Neo4j
+    in batches of up to `batch_size`, at least every `flush_interval`
+    seconds, through `writer` (one UNWIND statement per batch).
+
+    After a successful flush the log is rewritten to hold only what is
+    still pending, so after a crash start() replays exactly the submissions
+    that may not have reached the database. The writer merges on
+    client_submission_id, so replaying an already-stored submission is a
+    no-op.
+
+    The log belongs to a single process: give every worker its own path.
+    """
+    def __init__(
+        self,
+        path: str,
+        writer: Callable[[List[dict]], Awaitable[list]],
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        commit_window: float = 0.002
+    ):
+        self.path = path
+        self.writer = writer
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.commit_window = commit_window
+
+        self.pending: Dict[str, dict] = {}
+        self.flushed = 0
+        self.flush_failures = 0
+        self.flush_count = 0
+        self.flush_ms_total = 0.0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.flush_histogram = metrics.histogram(
+            "submission_buffer_flush_duration_seconds",
+            "Time to write one batch of buffered submissions to the database",
+            ()
+        )
+
+        self._file = None
+        self._unsynced: List[tuple] = []
+        self._commit_task: Optional[asyncio.Task] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._io_lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._flusher is not None
+
+    @property
+    def healthy(self) -> bool:
+        """False once the flusher task has died"""
+        return self._flusher is not None and not self._flusher.done()
+
+    async def start(self) -> int:
+        """
+        Replay the log left by the previous run, then start the flusher.
+        Returns the number of replayed submissions; 0 if already started.
+        """
+        if self._flusher is not None:
+            return 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        for submission in self._read_log():
+            self.pending[submission["submission_id"]] = submission
+        replayed = len(self.pending)
+        if replayed:
+            logger.info(f"♻️ Replaying {replayed} buffered submissions from {self.path}")
+
+        self._file = open(self.path, "ab")
+        self._flusher = asyncio.create_task(self._run())
+        if replayed:
+            self._wakeup.set()
+        return replayed
+
+    async def stop(self):
+        """Stop the flusher and drain whatever is still buffered"""
+        if self._flusher is None:
+            return
+        self._flusher.cancel()
+        try:
+            await self._flusher
+        except asyncio.CancelledError:
+            pass
+        self._flusher = None
+        if self._commit_task is not None:
+            await self._commit_task
+        await self.flush()
+        self._file.close()
+        self._file = None
+
+    async def add(self, submission: dict):
+        """
+        Buffer one submission; returns once it is durable in the local log
+        """
+        submission_id = submission["submission_id"]
+        # Visible to readers and the flusher right away; writing it to
+        # Neo4j before the fsync completes is harmless
+        self.pending[submission_id] = submission
+        try:
+            await self._log(json.dumps(submission, separators=(",", ":")))
+        except Exception:
+            self.pending.pop(submission_id, None)
+            raise
+        if len(self.pending) >= self.batch_size:
+            self._wakeup.set()
+
+    def get(self, submission_id: str) -> Optional[dict]:
+        """Return a submission that has not been flushed yet"""
+        return self.pending.get(submission_id)
+
+    async def ensure_persisted(self, submission_id: str):
+        """
+        Write a still-buffered submission to Neo4j now, so that a query
+        matching it (e.g. booking) finds it
+        """
+        submission = self.pending.get(submission_id)
+        if submission is None:
+            return
+        await self.writer([submission])
+        self.pending.pop(submission_id, None)
+        self.flushed += 1
+
+    async def flush(self):
+        """Drain the buffer to Neo4j in batches, then compact the log"""
+        async with self._flush_lock:
+            while self.pending:
+                batch = list(itertools.islice(self.pending.values(), self.batch_size))
+                started = time.perf_counter()
+                try:
+                    await self.writer(batch)
+                except Exception as e:
+                    self.flush_failures += 1
+                    logger.error(f"Submission flush of {len(batch)} failed, will retry: {e}")
+                    return
+
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                self.flush_count += 1
+                self.flush_ms_total += elapsed_ms
+                self.last_flush_ms = elapsed_ms
+                self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+                self.flush_histogram.observe((), elapsed_ms / 1000)
+
+                for submission in batch:
+                    self.pending.pop(submission["submission_id"], None)
+                self.flushed += len(batch)
+
+            if self._file is not None:
+                await self._compact()
+
+    def metrics(self) -> dict:
+        return {
+            "queue_depth": len(self.pending),
+            "flushed": self.flushed,
+            "flushes": self.flush_count,
+            "flush_failures": self.flush_failures,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "mean_flush_ms": round(self.flush_ms_total / self.flush_count, 2) if self.flush_count else 0.0,
+            "max_flush_ms": round(self.max_flush_ms, 2)
+        }
+
+    async def _run(self):
+        failures = 0
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+                failures = 0
+            except Exception as e:
+                # e.g. an OSError while compacting the log; the flusher must
+                # outlive it or nothing buffered is ever written again
+                failures += 1
+                self.flush_failures += 1
+                backoff = min(self.flush_interval * 2 ** failures, MAX_FLUSH_BACKOFF_SECONDS)
+                logger.error(f"Submission flusher error, retrying in {backoff:.1f}s: {e}")
+                await asyncio.sleep(backoff)
+
+    async def _log(self, line: str):
+        future = asyncio.get_running_loop().create_future()
+        self._unsynced.append((line, future))
+        # The first writer in a window schedules the group commit
+        if self._commit_task is None:
+            self._commit_task = asyncio.create_task(self._group_commit())
+        await future
+
+    async def _group_commit(self):
+        await asyncio.sleep(self.commit_window)
+        group, self._unsynced = self._unsynced, []
+        self._commit_task = None
+
+        data = "".join(line + "\n" for line, _ in group).encode()
+        try:
+            async with self._io_lock:
+                await asyncio.to_thread(self._append_and_sync, data)
+        except Exception as e:
+            for _, future in group:
+                future.set_exception(e)
+        else:
+            for _, future in group:
+                future.set_result(None)
+
+    def _append_and_sync(self, data: bytes):
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    async def _compact(self):
+        """Rewrite the log so it only holds submissions still pending"""
+        async with self._io_lock:
+            lines = [json.dumps(s, separators=(",", ":")) + "\n" for s in self.pending.values()]
+            await asyncio.to_thread(self._rewrite, "".join(lines).encode())
+
+    def _rewrite(self, data: bytes):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, self.path)
+
+        directory = os.open(os.path.dirname(self.path) or ".", os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+        self._file.close()
+        self._file = open(self.path, "ab")
+
+    def _read_log(self) -> List[dict]:
+        if not os.path.exists(self.path):
+            return []
+        submissions = []
+        with open(self.path, "rb") as log:
+            for line in log:
+                try:
+                    submissions.append(json.loads(line))
+                except ValueError:
+                    # Torn final line from a crash mid-append; it was never acknowledged
+                    logger.warning(f"Skipping unreadable line in {self.path}")
+        return submissions
@@ -0,0 +1,30 @@
+"""
+Shared test setup. pytest-asyncio is not a dependency: `async def` tests
+run on one event loop kept for the whole session, so clients such as the
+Neo4j driver outlive a single test.
+"""
+
+import asyncio
+import inspect
+
+import pytest
+
+def pytest_addoption(parser):
+    parser.addoption("--neo4j", action="store_true",
+                     help="also run the neo4j backend against the database at NEO4J_URI (use a disposable one)")
+
+@pytest.fixture(scope="session")
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    # Async tests reach the loop through their fixtures, or directly
+    loop = pyfuncitem.funcargs["event_loop"]
+    arguments = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    loop.run_until_complete(pyfuncitem.obj(**arguments))
+    return True
@@ -0,0 +1,461 @@
+"""
+Repository conformance tests
+
+One set of behavioural tests, run against every repository backend, so
+the in-memory implementation can stand in for Neo4j in benchmarks and
+load tests. Every test creates its own counselors, slots and submissions
+under fresh ids and compares counters as deltas, so it also runs against
+a database that already holds data.
+
+The neo4j backend only runs with --neo4j. Everything the tests created is
+deleted afterwards and the dashboard counters and daily rollups are
+rebuilt; use a disposable database all the same.
+
+Usage:
+    python -m pytest tests/test_repositories.py
+    python -m pytest tests/test_repositories.py --neo4j
+"""
+
+import asyncio
+import json
+import random
+import uuid
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from repositories import BACKENDS, create_repositories
+from utils.day_bitmap import span_mask
+
+def hhmm(value: str) -> str:
+    """Neo4j and the memory backend may render times differently past the minutes"""
+    return value[:5]
+
+class Fixture:
+    """Repositories under test plus the ids of everything the tests created"""
+
+    def __init__(self, backend: str):
+        self.backend = backend
+        self.assessments, self.counselors, self.slots, self.appointments = create_repositories(backend)
+        self.created = {"counselor": [], "slot": [], "submission": [], "appointment": [], "client": [], "day": []}
+        # A day far in the past that no real submission uses
+        self.quiet_day = date(1901, 1, 1) + timedelta(days=random.randrange(36500))
+
+    async def counselor(self, name: str = "Conformance Counselor") -> str:
+        counselor_id = str(uuid.uuid4())
+        await self.counselors.create({
+            "counselor_id": counselor_id,
+            "full_name": name,
+            "email": f"{counselor_id}@conformance.test",
+            "employee_id": "CONF",
+            "specialization": "Conformance",
+            "password_hash": "not-a-hash"
+        })
+        self.created["counselor"].append(counselor_id)
+        return counselor_id
+
+    def slot(self, day: date, start: str, end: str) -> dict:
+        slot_id = str(uuid.uuid4())
+        self.created["slot"].append(slot_id)
+        return {"slot_id": slot_id, "date": day.isoformat(), "start_time": start, "end_time": end}
+
+    def submission(self, timestamp: datetime, stress_level: str = "Low", score: float = 1.5,
+                   client_submission_id: str = None) -> dict:
+        submission_id = str(uuid.uuid4())
+        self.created["submission"].append(submission_id)
+        self.created["day"].append(timestamp.date().isoformat())
+        return {
+            "submission_id": submission_id,
+            "client_submission_id": client_submission_id,
+            "timestamp": timestamp.isoformat(),
+            "section1_raw_answers": json.dumps([2] * 10),
+            "section2_raw_answers": json.dumps([2] * 10),
+            "section3_raw_answers": json.dumps([2] * 10),
+            "section1_score": score,
+            "section2_score": score,
+            "section3_score": score,
+            "overall_score": score,
+            "stress_level": stress_level,
+            "recommendation": "Conformance",
+            "scoring_version": 1,
+            "questionnaire_version": 1
+        }
+
+    def appointment(self, submission_id: str, counselor_id: str, slot_id: str, email: str) -> dict:
+        appointment_id = str(uuid.uuid4())
+        self.created["appointment"].append(appointment_id)
+        self.created["client"].append(email)
+        return {
+            "appointment_id": appointment_id,
+            "submission_id": submission_id,
+            "counselor_id": counselor_id,
+            "slot_id": slot_id,
+            "client_full_name": "Conformance Client",
+            "client_email": email,
+            "client_student_id": "2024-0000",
+            "client_course": "BS Conformance",
+            "client_year_level": "1st Year",
+            "client_gender": "Prefer not to say",
+            "client_age": 20,
+            "client_contact_number": "09000000000"
+        }
+
+@pytest.fixture(scope="module", params=BACKENDS)
+def f(request, event_loop):
+    if request.param == "neo4j" and not request.config.getoption("--neo4j"):
+        pytest.skip("needs --neo4j and a disposable database at NEO4J_URI")
+    if request.param == "neo4j":
+        from services.neo4j_service import neo4j_service
+        # Fail once here rather than in every test when the database is unreachable
+        event_loop.run_until_complete(neo4j_service.verify_connection())
+    fixture = Fixture(request.param)
+    yield fixture
+    if request.param == "neo4j":
+        event_loop.run_until_complete(cleanup_neo4j(fixture))
+
+# ---------------------------------------------------------------------------
+# Neo4j cleanup
+# ---------------------------------------------------------------------------
+
+CLEANUP_QUERIES = [
+    ("MATCH (n:Appointment) WHERE n.appointment_id IN $appointment DETACH DELETE n", "appointment"),
+    ("MATCH (n:TimeSlot) WHERE n.slot_id IN $slot DETACH DELETE n", "slot"),
+    ("MATCH (n:AssessmentSubmission) WHERE n.submission_id IN $submission DETACH DELETE n", "submission"),
+    ("MATCH (n:Client) WHERE n.email IN $client DETACH DELETE n", "client"),
+    ("MATCH (n:CounselorDay) WHERE n.counselor_id IN $counselor DETACH DELETE n", "counselor"),
+    ("MATCH (n:Counselor) WHERE n.counselor_id IN $counselor DETACH DELETE n", "counselor"),
+    ("MATCH (n:StatsCounter) WHERE n.key IN [id IN $counselor | 'counselor:' + id] DELETE n", "counselor"),
+    ("MATCH (n:AssessmentRollup) WHERE toString(n.day) IN $day DELETE n", "day"),
+]
+
+async def cleanup_neo4j(f: Fixture):
+    from services.neo4j_service import neo4j_service
+    from services.stats_service import stats_service
+    from services.analytics_service import analytics_service
+
+    for query, kind in CLEANUP_QUERIES:
+        await neo4j_service.execute_write(query, {kind: sorted(set(f.created[kind]))}, name="conformance.cleanup")
+    # Counters and the buckets of touched days are recomputed from what is left
+    await stats_service.rebuild()
+    await analytics_service.backfill()
+    await neo4j_service.close()
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+async def test_counselors(f: Fixture):
+    first = await f.counselor("Zed Conformance")
+    second = await f.counselor("Abe Conformance")
+
+    found = await f.counselors.by_email(f"{first}@conformance.test")
+    assert found is not None and found["counselor_id"] == first, "by_email finds the counselor"
+    assert set(found) == {"counselor_id", "full_name", "email", "password_hash"}, f"by_email fields: {sorted(found)}"
+    assert await f.counselors.by_email("nobody@conformance.test") is None, "by_email of an unknown email is None"
+
+    directory = {row["counselor_id"]: row for row in await f.counselors.directory()}
+    assert directory[first]["specialization"] == "Conformance", "directory lists specialization"
+
+    listed = [row["counselor_id"] for row in await f.counselors.list_all()]
+    assert listed.index(second) < listed.index(first), "list_all is ordered by full_name"
+
+    # A duplicate email is rejected
+    with pytest.raises(Exception):
+        await f.counselors.create({
+            "counselor_id": str(uuid.uuid4()), "full_name": "Duplicate", "email": f"{first}@conformance.test",
+            "employee_id": "CONF", "specialization": "Conformance", "password_hash": "x"
+        })
+
+    assert await f.counselors.delete(second), "delete reports the deleted counselor"
+    assert not await f.counselors.delete(second), "deleting again reports nothing deleted"
+    assert await f.counselors.by_email(f"{second}@conformance.test") is None, "a deleted counselor is gone"
+
+async def test_submissions(f: Fixture):
+    day = f.quiet_day
+    before_counts = await f.assessments.stress_counts()
+    before_week = await f.assessments.rollup_summary(7)
+
+    levels = ["Low", "Moderate", "High", "Low", "High", "Low", "Moderate"]
+    submissions = [
+        f.submission(datetime.combine(day, datetime.min.time()) + timedelta(minutes=10 * i), level, 1.0 + i / 10)
+        for i, level in enumerate(levels)
+    ]
+    for submission in submissions:
+        await f.assessments.add(submission)
+    today = f.submission(datetime.utcnow(), "High", 3.5)
+    await f.assessments.add(today)
+
+    after_counts = await f.assessments.stress_counts()
+    assert after_counts["total_assessments"] - before_counts["total_assessments"] == 8, "total_assessments counts every add"
+    assert after_counts["high_stress"] - before_counts["high_stress"] == 3, "high_stress counts High submissions"
+    assert after_counts["low_stress"] - before_counts["low_stress"] == 3, "low_stress counts Low submissions"
+
+    after_week = await f.assessments.rollup_summary(7)
+    assert after_week["total_assessments"] - before_week["total_assessments"] == 1, "the 7-day rollup only has today's submission"
+    assert abs(after_week["score_sum"] - before_week["score_sum"] - 3.5) < 1e-9, "score_sum adds the overall score"
+    assert abs(after_week["score_sq_sum"] - before_week["score_sq_sum"] - 12.25) < 1e-9, "score_sq_sum adds its square"
+
+    quiet = [row for row in await f.assessments.rollup_days(None) if row["day"] == day.isoformat()]
+    assert len(quiet) == 1 and quiet[0]["total_assessments"] == 7, "rollup_days has the quiet day's bucket"
+    assert abs(quiet[0]["average_score"] - sum(s["overall_score"] for s in submissions) / 7) < 1e-9, "rollup average"
+
+    # Keyset pages, newest first, three at a time
+    expected = [s["submission_id"] for s in reversed(submissions)]
+    seen, after = [], None
+    while True:
+        rows = await f.assessments.page(3 + 1, start_date=day, end_date=day, after=after)
+        seen += [row["submission_id"] for row in rows[:3]]
+        if len(rows) <= 3:
+            break
+        after = [rows[2]["timestamp"], rows[2]["submission_id"]]
+    assert seen == expected, "pages walk every submission of the day newest first exactly once"
+
+    rows = await f.assessments.page(10, stress_level="Low", start_date=day, end_date=day)
+    assert [row["submission_id"] for row in rows] == [s["submission_id"] for s in reversed(submissions) if s["stress_level"] == "Low"], \
+        "stress_level filter"
+    assert set(rows[0]) == {"submission_id", "timestamp", "overall_score", "stress_level", "recommendation"}, \
+        f"page fields: {sorted(rows[0])}"
+    assert await f.assessments.page(10, start_date=day + timedelta(days=1), end_date=day + timedelta(days=1)) == [], \
+        "end of the date range is exclusive of the next day"
+
+async def test_submission_batches(f: Fixture):
+    timestamp = datetime.combine(f.quiet_day, datetime.min.time()) + timedelta(hours=12)
+    client_ids = [str(uuid.uuid4()) for _ in range(3)]
+    batch = [f.submission(timestamp, "Moderate", 2.0, client_id) for client_id in client_ids]
+    before = await f.assessments.stress_counts()
+
+    first = await f.assessments.add_batch(batch)
+    assert [row["client_submission_id"] for row in first] == client_ids, "results follow the batch order"
+    assert all(row["created"] for row in first), "new client ids are created"
+
+    replay = [f.submission(timestamp, "Moderate", 2.0, client_id) for client_id in client_ids]
+    second = await f.assessments.add_batch(replay)
+    assert not any(row["created"] for row in second), "replayed client ids create nothing"
+    assert [row["submission_id"] for row in second] == [row["submission_id"] for row in first], \
+        "replays return the stored submission ids"
+
+    after = await f.assessments.stress_counts()
+    assert after["moderate_stress"] - before["moderate_stress"] == 3, "replays are not counted again"
+
+async def test_slots(f: Fixture):
+    counselor_id = await f.counselor()
+    day = date.today() + timedelta(days=400 + random.randrange(1000))
+
+    first = f.slot(day, "09:00:00", "10:00:00")
+    assert await f.slots.create(counselor_id, first) == {"slot_id": first["slot_id"], "overlaps": False}, \
+        "create returns the slot id"
+    assert await f.slots.create(str(uuid.uuid4()), f.slot(day, "11:00:00", "12:00:00")) is None, \
+        "create for an unknown counselor returns None"
+
+    overlapping = [f.slot(day, "10:00:00", "11:00:00"), f.slot(day, "09:30:00", "10:30:00")]
+    conflicts = await f.slots.create_bulk(counselor_id, overlapping)
+    assert (len(conflicts) == 1 and conflicts[0]["existing_slot_id"] == first["slot_id"]
+            and conflicts[0]["start_time"] == "09:30:00"), f"create_bulk reports the overlap: {conflicts}"
+    rows = await f.slots.page(counselor_id, None)
+    assert [row["slot_id"] for row in rows] == [first["slot_id"]], "a conflicting bulk request writes nothing"
+
+    later = [f.slot(day, "13:00:00", "14:00:00"), f.slot(day, "10:00:00", "11:00:00"), f.slot(day + timedelta(days=1), "08:00:00", "09:00:00")]
+    assert await f.slots.create_bulk(counselor_id, later) == [], "create_bulk without overlaps returns no conflicts"
+    assert await f.slots.create_bulk(str(uuid.uuid4()), [f.slot(day, "15:00:00", "16:00:00")]) is None, \
+        "create_bulk for an unknown counselor returns None"
+
+    order = [first["slot_id"], later[1]["slot_id"], later[0]["slot_id"], later[2]["slot_id"]]
+    rows = await f.slots.page(counselor_id, None)
+    assert [row["slot_id"] for row in rows] == order, "slots come in schedule order"
+    assert hhmm(rows[1]["start_time"]) == "10:00" and rows[1]["date"] == day.isoformat(), "slot fields"
+    assert rows[0]["appointment_id"] is None and rows[0]["is_available"] is True, "open slots have no appointment"
+
+    page = await f.slots.page(counselor_id, 2)
+    rest = await f.slots.page(counselor_id, None, after=[page[1]["date"], page[1]["start_time"], page[1]["slot_id"]])
+    assert [row["slot_id"] for row in page + rest] == order, "the cursor continues after the last row"
+    streamed = [row["slot_id"] async for row in f.slots.stream(counselor_id, start_date=day, end_date=day)]
+    assert streamed == order[:3], "stream honours the date range"
+
+    available = {row["counselor_id"]: row for row in await f.slots.available(day)}
+    assert [s["slot_id"] for s in available[counselor_id]["available_slots"]] == order[:3], \
+        "available() lists the day's open slots in order"
+    assert available[counselor_id]["full_name"] == "Conformance Counselor", "available() carries counselor details"
+
+    assert await f.slots.delete(later[0]["slot_id"]), "an open slot can be deleted"
+    assert not await f.slots.delete(later[0]["slot_id"]), "deleting it again deletes nothing"
+    rows = await f.slots.page(counselor_id, None)
+    assert later[0]["slot_id"] not in [row["slot_id"] for row in rows], "a deleted slot is gone"
+
+async def test_booking(f: Fixture):
+    counselor_id = await f.counselor("Booking Counselor")
+    other_id = await f.counselor()
+    day = date.today() + timedelta(days=400 + random.randrange(1000))
+    slot = f.slot(day, "09:00:00", "10:00:00")
+    foreign = f.slot(day, "09:00:00", "10:00:00")
+    await f.slots.create(counselor_id, slot)
+    await f.slots.create(other_id, foreign)
+    submission = f.submission(datetime.utcnow())
+    await f.assessments.add(submission)
+    email = f"{uuid.uuid4()}@client.test"
+    before = await f.appointments.status_counts(counselor_id)
+
+    outcomes = {
+        "submission_not_found": f.appointment(str(uuid.uuid4()), counselor_id, slot["slot_id"], email),
+        "slot_not_found": f.appointment(submission["submission_id"], counselor_id, str(uuid.uuid4()), email),
+        "counselor_not_found": f.appointment(submission["submission_id"], counselor_id, foreign["slot_id"], email),
+    }
+    for outcome, request in outcomes.items():
+        result = await f.appointments.book(request)
+        assert result["outcome"] == outcome, f"expected {outcome}, got {result['outcome']}"
+
+    # Everyone books the same slot at once: exactly one wins
+    requests = [f.appointment(submission["submission_id"], counselor_id, slot["slot_id"], email) for _ in range(20)]
+    results = await asyncio.gather(*(f.appointments.book(request) for request in requests))
+    winners = [request for request, result in zip(requests, results) if result["outcome"] == "booked"]
+    assert len(winners) == 1, f"exactly one concurrent booking wins, got {len(winners)}"
+    assert all(r["outcome"] in ("booked", "slot_unavailable") for r in results), "the others see slot_unavailable"
+    booked = results[requests.index(winners[0])]
+    assert (booked["scheduled_date"] == day.isoformat() and hhmm(booked["scheduled_time"]) == "09:00"
+            and booked["counselor_name"] == "Booking Counselor"), f"booking result fields: {booked}"
+    appointment_id = winners[0]["appointment_id"]
+
+    available = {row["counselor_id"] for row in await f.slots.available(day)}
+    assert counselor_id not in available, "a booked slot is no longer available"
+    assert not await f.slots.delete(slot["slot_id"]), "an occupied slot cannot be deleted"
+    rows = await f.slots.page(counselor_id, None)
+    assert (rows[0]["appointment_id"] == appointment_id and rows[0]["appointment_status"] == "Pending"
+            and rows[0]["is_available"] is False), "the slot row shows its appointment"
+    assert [r["slot_id"] for r in await f.slots.page(counselor_id, None, available=True)] == [], "available=True skips it"
+
+    mine = await f.appointments.by_client_email(email)
+    assert [row["appointment_id"] for row in mine] == [appointment_id], "by_client_email finds the booking"
+    assert mine[0]["counselor_email"] == f"{counselor_id}@conformance.test", "status rows carry the counselor"
+
+    detail = await f.appointments.detail(appointment_id)
+    assert (detail is not None and detail["assessment_submission_id"] == submission["submission_id"]
+            and detail["client_age"] == 20 and detail["status"] == "Pending"), "detail joins the assessment"
+    assert await f.appointments.detail(str(uuid.uuid4())) is None, "detail of an unknown id is None"
+
+    counts = await f.appointments.status_counts(counselor_id)
+    assert (counts["total_appointments"] - before["total_appointments"] == 1
+            and counts["pending_appointments"] - before["pending_appointments"] == 1), "a booking counts as pending"
+
+    updated = await f.appointments.update_status(appointment_id, "Confirmed", "See you", "")
+    assert updated == {"appointment_id": appointment_id, "status": "Confirmed", "client_email": email}, f"update result: {updated}"
+    counts = await f.appointments.status_counts(counselor_id)
+    assert (counts["pending_appointments"] == before["pending_appointments"]
+            and counts["confirmed_appointments"] - before["confirmed_appointments"] == 1), "status counters move"
+    assert await f.appointments.update_status(str(uuid.uuid4()), "Confirmed", "", "") is None, "unknown ids update nothing"
+
+async def test_appointment_pages(f: Fixture):
+    counselor_id = await f.counselor()
+    day = date.today() + timedelta(days=400 + random.randrange(1000))
+    slots = [f.slot(day + timedelta(days=i // 3), f"{9 + i % 3:02d}:00:00", f"{10 + i % 3:02d}:00:00") for i in range(7)]
+    assert await f.slots.create_bulk(counselor_id, slots) == [], "slots for paging are created"
+    submission = f.submission(datetime.utcnow())
+    await f.assessments.add(submission)
+    email = f"{uuid.uuid4()}@client.test"
+
+    booked = []
+    for slot in slots:
+        request = f.appointment(submission["submission_id"], counselor_id, slot["slot_id"], email)
+        assert (await f.appointments.book(request))["outcome"] == "booked", "each slot books"
+        booked.append(request["appointment_id"])
+    await f.appointments.update_status(booked[1], "Rejected", "", "Conflict")
+    await f.appointments.update_status(booked[4], "Rejected", "", "Conflict")
+
+    expected = list(reversed(booked))
+    seen, after = [], None
+    while True:
+        rows = await f.appointments.page(counselor_id, 3 + 1, after=after)
+        seen += [row["appointment_id"] for row in rows[:3]]
+        if len(rows) <= 3:
+            break
+        after = [rows[2]["scheduled_date"], rows[2]["scheduled_time"], rows[2]["appointment_id"]]
+    assert seen == expected, "pages walk the schedule latest first exactly once"
+
+    rejected = [row["appointment_id"] for row in await f.appointments.page(counselor_id, None, status="Rejected")]
+    assert rejected == [booked[4], booked[1]], "status filter"
+    first_day = [row["appointment_id"] for row in await f.appointments.page(counselor_id, None, start_date=day, end_date=day)]
+    assert first_day == list(reversed(booked[:3])), "date range filter"
+    streamed = [row["appointment_id"] async for row in f.appointments.stream(counselor_id)]
+    assert streamed == expected, "stream returns what an unlimited page returns"
+
+    assert await f.counselors.delete(counselor_id), "the counselor is deleted"
+    assert await f.appointments.by_client_email(email) == [], "appointments of a deleted counselor drop out of status lookups"
+    assert await f.appointments.detail(booked[0]) is None, "and out of detail"
+    counts = await f.appointments.status_counts(counselor_id)
+    assert counts["total_appointments"] == 0, "and their counters are gone"
+
+async def test_clients(f: Fixture):
+    counselor_id = await f.counselor()
+    day = date.today() + timedelta(days=400 + random.randrange(1000))
+    slots = [f.slot(day, "09:00:00", "10:00:00"), f.slot(day, "10:00:00", "11:00:00")]
+    assert await f.slots.create_bulk(counselor_id, slots) == [], "slots for two bookings are created"
+    submission = f.submission(datetime.utcnow())
+    await f.assessments.add(submission)
+    email = f"{uuid.uuid4()}@client.test"
+    assert await f.appointments.by_client_email(email) == [], "an unknown email has no appointments"
+
+    first = f.appointment(submission["submission_id"], counselor_id, slots[0]["slot_id"], email)
+    assert (await f.appointments.book(first))["outcome"] == "booked", "the first booking"
+    second = dict(f.appointment(submission["submission_id"], counselor_id, slots[1]["slot_id"], email),
+                  client_full_name="Renamed Client", client_age=21)
+    assert (await f.appointments.book(second))["outcome"] == "booked", "the second booking"
+
+    mine = [row["appointment_id"] for row in await f.appointments.by_client_email(email)]
+    assert mine == [second["appointment_id"], first["appointment_id"]], "both bookings, newest first"
+    detail = await f.appointments.detail(first["appointment_id"])
+    assert (detail["client_full_name"] == "Renamed Client" and detail["client_age"] == 21
+            and detail["client_email"] == email), "details are stored once, as of the latest booking"
+    names = {row["client_name"] for row in await f.slots.page(counselor_id, None)}
+    assert names == {"Renamed Client"}, "slot rows read the client's name"
+    rows = await f.appointments.page(counselor_id, None)
+    assert {(row["client_full_name"], row["client_email"]) for row in rows} == {("Renamed Client", email)}, \
+        "appointment rows read the client"
+
+async def test_day_bitmaps(f: Fixture):
+    counselor_id = await f.counselor()
+    day = date.today() + timedelta(days=400 + random.randrange(1000))
+    morning = f.slot(day, "09:00:00", "10:00:00")
+    assert (await f.slots.create(counselor_id, morning))["overlaps"] is False, "a slot on an empty day is created"
+    clash = f.slot(day, "09:45:00", "10:30:00")
+    assert await f.slots.create(counselor_id, clash) == {"slot_id": clash["slot_id"], "overlaps": True}, \
+        "create refuses an overlapping slot"
+    assert [row["slot_id"] for row in await f.slots.page(counselor_id, None)] == [morning["slot_id"]], \
+        "the refused slot is not written"
+    afternoon = [f.slot(day, "13:00:00", "14:00:00"), f.slot(day, "14:00:00", "14:30:00")]
+    assert await f.slots.create_bulk(counselor_id, afternoon) == [], "bulk slots are created"
+
+    def bitmaps(rows):
+        mine = [row for row in rows if row["counselor_id"] == counselor_id]
+        return (mine[0]["open"], mine[0]["booked"]) if mine else None
+
+    # Quarter 36 starts at 09:00, 52 at 13:00
+    nine, one, two = span_mask(36, 40), span_mask(52, 56), span_mask(56, 58)
+    assert bitmaps(await f.slots.day_bitmaps(day)) == (nine | one | two, 0), "open bits cover every slot"
+    assert bitmaps(await f.slots.day_bitmaps(day + timedelta(days=1))) is None, "other days have no bitmaps"
+
+    submission = f.submission(datetime.utcnow())
+    await f.assessments.add(submission)
+    request = f.appointment(submission["submission_id"], counselor_id, afternoon[0]["slot_id"], f"{uuid.uuid4()}@client.test")
+    assert (await f.appointments.book(request))["outcome"] == "booked", "the afternoon slot books"
+    assert bitmaps(await f.slots.day_bitmaps(day)) == (nine | two, one), "booking moves its quarters to booked"
+    assert (await f.slots.create(counselor_id, f.slot(day, "13:30:00", "13:45:00")))["overlaps"], \
+        "booked quarters count as overlaps too"
+
+    assert await f.slots.delete(morning["slot_id"]), "the morning slot is deleted"
+    assert bitmaps(await f.slots.day_bitmaps(day)) == (two, one), "deleting clears its quarters"
+    row = [r for r in await f.slots.day_bitmaps(day) if r["counselor_id"] == counselor_id][0]
+    assert row["full_name"] == "Conformance Counselor", "bitmap rows carry the counselor"
+    assert [(s["start_time"], s["end_time"]) for s in row["open_slots"]] == [("14:00:00Z", "14:30:00Z")], \
+        "bitmap rows list the exact open slots"
+
+    # Slots sharing a quarter hour without overlapping both fit
+    other_day = day + timedelta(days=1)
+    early = f.slot(other_day, "11:05:00", "11:20:00")
+    assert (await f.slots.create(counselor_id, early))["overlaps"] is False, "a mid-quarter slot is created"
+    touching = f.slot(other_day, "11:20:00", "11:40:00")
+    assert (await f.slots.create(counselor_id, touching))["overlaps"] is False, "create accepts a slot that only touches"
+    assert await f.slots.create_bulk(counselor_id, [f.slot(other_day, "11:40:00", "11:50:00")]) == [], \
+        "bulk accepts a slot that only touches"
+    conflicts = await f.slots.create_bulk(counselor_id, [f.slot(other_day, "11:30:00", "11:35:00")])
+    assert [c["existing_slot_id"] for c in conflicts] == [touching["slot_id"]], "bulk names the slot it overlaps"
+
+    assert await f.counselors.delete(counselor_id), "the counselor is deleted"
+    assert bitmaps(await f.slots.day_bitmaps(day)) is None, "and their bitmaps with them"
@@ -0,0 +1,64 @@
+from utils.scoring import SECTIONS, QUESTION_IDS, RECOMMENDATIONS
+from typing import Dict, List
+import numpy as np
+
+# Column layout of an answer matrix: section1 q1..q10, section2 q1..q10, section3 q1..q10
+COLUMNS = [(section, question) for section in SECTIONS for question in QUESTION_IDS]
+COLUMN_INDEX = {column: i for i, column in enumerate(COLUMNS)}
+
+def reversed_columns(rules: dict) -> List[int]:
+    return [
+        COLUMN_INDEX[(section, question)]
+        for section, questions in rules["reversed"].items()
+        for question in questions
+    ]
+
+def answers_to_matrix(rows: List[Dict[str, Dict[str, int]]]) -> np.ndarray:
+    """
+    Pack answer dicts ({"section1": {"q1": 3, ...}, ...}) into an N×30 matrix
+    """
+    return np.array(
+        [[row[section][question] for section, question in COLUMNS] for row in rows],
+        dtype=np.int8
+    ).reshape(len(rows), len(COLUMNS))
+
+def flip_reversed(matrix: np.ndarray, rules: dict) -> np.ndarray:
+    """
+    Return a copy with the rules' reversed items flipped (its own inverse)
+    """
+    lowest, highest = rules["scale"]
+    flipped = matrix.copy()
+    columns = reversed_columns(rules)
+    flipped[:, columns] = lowest + highest - flipped[:, columns]
+    return flipped
+
+def score_matrix(answers: np.ndarray, rules: dict) -> dict:
+    """
+    Score N raw answer sets in one vectorized pass.
+
+    `answers` is an N×30 matrix of answers as entered (reversed items not yet
+    flipped), columns ordered as COLUMNS. Returns per-row arrays matching
+    calculate_assessment_score: section1_score, section2_score,
+    section3_score, overall_score (rounded to 2 places) and stress_level.
+    """
+    if answers.ndim != 2 or answers.shape[1] != len(COLUMNS):
+        raise ValueError(f"Expected an N×{len(COLUMNS)} answer matrix, got {answers.shape}")
+
+    values = flip_reversed(answers, rules).astype(np.float64)
+    sections = values.reshape(len(values), len(SECTIONS), len(QUESTION_IDS)).sum(axis=2) / 10.0
+    overall = sections.sum(axis=1) / 3.0
+
+    # Index of the first threshold the score does not exceed (thresholds are inclusive)
+    level_index = np.searchsorted(np.asarray(rules["thresholds"]), overall, side="left")
+    levels = np.asarray(rules["levels"], dtype=object)
+
+    return {
+        "section1_score": np.round(sections[:, 0], 2),
+        "section2_score": np.round(sections[:, 1], 2),
+        "section3_score": np.round(sections[:, 2], 2),
+        "overall_score": np.round(overall, 2),
+        "stress_level": levels[level_index]
+    }
+
+def recommendations_for(stress_levels: np.ndarray) -> List[str]:
+    return [RECOMMENDATIONS[level] for level in stress_levels]
@@ -0,0 +1,67 @@
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker. After `failure_threshold` failures
+    in a row the circuit opens and calls are refused for `reset_timeout`
+    seconds; then a single probe call is let through (half-open) and its
+    outcome closes or re-opens the circuit.
+    """
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_started = 0.0
+        self.opens = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        if self.state == OPEN and now - self.opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+            self.probe_started = 0.0
+        if self.state == HALF_OPEN:
+            # One probe at a time; a probe that never reported back (e.g. a
+            # cancelled request) stops blocking others after reset_timeout
+            if self.probe_started and now - self.probe_started < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self.probe_started = now
+            return True
+        if self.state == OPEN:
+            self.rejected += 1
+            return False
+        return True
+
+    def retry_after(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)"""
+        if self.state == CLOSED:
+            return 0.0
+        started = self.opened_at if self.state == OPEN else self.probe_started
+        return max(0.0, started + self.reset_timeout - time.monotonic())
+
+    def record_success(self):
+        self.state = CLOSED
+        self.consecutive_failures = 0
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.opens += 1
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def metrics(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opens": self.opens,
+            "rejected": self.rejected,
+        }
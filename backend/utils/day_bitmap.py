@@ -0,0 +1,47 @@
+from datetime import time
+from typing import List, Tuple
+
+# One bit per quarter hour of a counselor's day, bit 0 = 00:00-00:15.
+# A slot covers every quarter it touches (start rounded down, end up).
+# Neo4j stores a day as two 48-bit words because its integers are 64-bit
+# and Cypher's 2^n is a float, exact only up to 2^53.
+QUARTER_MINUTES = 15
+QUARTERS_PER_DAY = 96
+WORD_BITS = 48
+WORD_MASK = (1 << WORD_BITS) - 1
+DAY_MASK = (1 << QUARTERS_PER_DAY) - 1
+
+def quarter_span(start: time, end: time) -> Tuple[int, int]:
+    """First quarter a slot touches and the first one after it"""
+    first = (start.hour * 60 + start.minute) // QUARTER_MINUTES
+    last = (end.hour * 60 + end.minute + QUARTER_MINUTES - 1) // QUARTER_MINUTES
+    return first, last
+
+def span_mask(first: int, last: int) -> int:
+    return ((1 << (last - first)) - 1) << first if last > first else 0
+
+def time_mask(start: time, end: time) -> int:
+    """Bits of every quarter between start and end"""
+    return span_mask(*quarter_span(start, end))
+
+def to_words(bits: int) -> List[int]:
+    return [bits & WORD_MASK, bits >> WORD_BITS]
+
+def from_words(words: List[int]) -> int:
+    return words[0] | words[1] << WORD_BITS
+
+def windows(bits: int, min_quarters: int = 1) -> List[Tuple[int, int]]:
+    """Runs of set bits as (first, last) quarter spans, at least min_quarters long"""
+    runs = []
+    offset = 0
+    while bits:
+        # Skip the clear bits, then count the set ones
+        skip = (bits & -bits).bit_length() - 1
+        bits >>= skip
+        offset += skip
+        length = (~bits & (bits + 1)).bit_length() - 1
+        if length >= min_quarters:
+            runs.append((offset, offset + length))
+        bits >>= length
+        offset += length
+    return runs
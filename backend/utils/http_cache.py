@@ -0,0 +1,47 @@
+from fastapi import Request, Response
+
+def accepts_gzip(request: Request) -> bool:
+    """True if Accept-Encoding lists gzip without q=0"""
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+def etag_matches(request: Request, *etags: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 requires for it)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return any(etag in candidates for etag in etags)
+
+def cached_bytes_response(
+    request: Request,
+    body: bytes,
+    gzip_body: bytes,
+    etag: str,
+    gzip_etag: str,
+    cache_control: str,
+    media_type: str = "application/json"
+) -> Response:
+    """
+    Serve a pre-encoded body (and its pre-compressed form) with validators.
+    Answers 304 when the client already holds either representation.
+    """
+    use_gzip = accepts_gzip(request)
+    headers = {
+        "ETag": gzip_etag if use_gzip else etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding"
+    }
+
+    if etag_matches(request, etag, gzip_etag):
+        return Response(status_code=304, headers=headers)
+
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=gzip_body, media_type=media_type, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
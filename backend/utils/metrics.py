@@ -0,0 +1,192 @@
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Seconds; covers fast cache hits up to slow Aura round trips
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# A collector returns (name, type, help, [(labels, value), ...]) families at scrape time
+Sample = Tuple[Dict[str, str], float]
+Family = Tuple[str, str, str, List[Sample]]
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Histogram:
+    """
+    Labeled latency histogram. observe() is a dict lookup, a bisect and two
+    additions - no locks, since everything runs on the event loop thread.
+    Buckets are stored per-bucket and made cumulative only when rendered.
+    """
+    def __init__(self, name: str, help: str, labelnames: Sequence[str], buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series: Dict[tuple, list] = {}
+
+    def observe(self, labels: tuple, value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = 'le="%s"' % bound
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            cumulative += counts[-1]
+            le = 'le="+Inf"'
+            lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {total}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+class MetricsRegistry:
+    """Histograms observed inline plus collectors read when /metrics is scraped"""
+    def __init__(self):
+        self.histograms: List[Histogram] = []
+        self.collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str], buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        histogram = Histogram(name, help, labelnames, buckets)
+        self.histograms.append(histogram)
+        return histogram
+
+    def register(self, collector: Callable[[], Iterable[Family]]):
+        self.collectors.append(collector)
+
+    def register_cache(self, name: str, cache):
+        """Expose hits, misses and hit ratio of a cache with a stats() method"""
+        def collect():
+            stats = cache.stats()
+            labels = {"cache": name}
+            return [
+                ("cache_hits_total", "counter", "Cache lookups served from memory", [(labels, stats["hits"])]),
+                ("cache_misses_total", "counter", "Cache lookups that fell through", [(labels, stats["misses"])]),
+                ("cache_hit_ratio", "gauge", "Hits over lookups since start", [(labels, stats["hit_ratio"])]),
+                ("cache_entries", "gauge", "Entries currently held", [(labels, stats["entries"])]),
+            ]
+        self.register(collect)
+
+    def render(self) -> str:
+        lines = []
+        for histogram in self.histograms:
+            lines.extend(histogram.render())
+
+        # Several collectors may contribute samples to one family (e.g. caches)
+        families: Dict[str, Tuple[str, str, List[Sample]]] = {}
+        for collector in self.collectors:
+            try:
+                for name, kind, help, samples in collector():
+                    families.setdefault(name, (kind, help, []))[2].extend(samples)
+            except Exception as e:
+                logger.warning(f"Metrics collector failed: {e}")
+        for name, (kind, help, samples) in families.items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{name}{_labels(list(labels), list(labels.values()))} {float(value)}")
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+
+request_latency = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template, method and status",
+    ("route", "method", "status")
+)
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware timing every HTTP request. The route label is the
+    matched path template (e.g. /appointment/status/{email}), so path
+    parameters don't create new series; unmatched paths share one label.
+    Streaming responses are timed until their last body chunk.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            request_latency.observe(
+                (route.path if route is not None else "unmatched", scope["method"], str(status)),
+                time.perf_counter() - started
+            )
+
+class EventLoopLagMonitor:
+    """
+    Sleeps `interval` seconds in a loop and records how late it wakes up:
+    anything blocking the event loop (CPU work, sync I/O) shows up as lag.
+    """
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.histogram = metrics.histogram(
+            "event_loop_lag_seconds",
+            "How late the event loop ran a timer scheduled every interval",
+            ()
+        )
+        self._task = None
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - expected)
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self.histogram.observe((), lag)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def collect(self):
+        return [
+            ("event_loop_lag_last_seconds", "gauge", "Lag of the most recent timer", [({}, self.last_lag)]),
+            ("event_loop_lag_max_seconds", "gauge", "Largest lag seen since start", [({}, self.max_lag)]),
+        ]
+
+event_loop_lag = EventLoopLagMonitor()
+metrics.register(event_loop_lag.collect)
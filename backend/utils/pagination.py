@@ -0,0 +1,40 @@
+from fastapi import HTTPException, status
+from typing import List, Optional
+import base64
+import json
+
+def encode_cursor(values: List) -> str:
+    """
+    Encode the sort key of the last row on a page as an opaque cursor
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List]:
+    """
+    Decode a cursor produced by encode_cursor, checking it holds `size` values
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+    return values
+
+def paginate(rows: List[dict], limit: int, key_fields: List[str]) -> dict:
+    """
+    Build a page from `limit + 1` fetched rows: the extra row only tells us
+    whether there is a next page, and the last returned row becomes the cursor
+    """
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit and items:
+        next_cursor = encode_cursor([items[-1][field] for field in key_fields])
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from typing import Optional
+import logging
+import os
+import random
+
+class QueryProfileLog:
+    """
+    Debug aid: a `sample_rate` fraction of named query executions run under
+    PROFILE and their plans - operators, rows and db hits - are appended to
+    a size-rotated local file. Index misses show up as NodeByLabelScan or
+    AllNodesScan operators with large db-hit counts. Off when sample_rate is 0.
+    """
+    def __init__(self, path: str, sample_rate: float, max_bytes: int, backups: int):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.captured = 0
+        self._logger: Optional[logging.Logger] = None
+
+    def should_sample(self) -> bool:
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def _file_logger(self) -> logging.Logger:
+        # Opened on first capture, so a disabled profiler never touches the disk
+        if self._logger is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            handler = RotatingFileHandler(self.path, maxBytes=self.max_bytes, backupCount=self.backups)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._logger = logging.getLogger("query_profile")
+            self._logger.propagate = False
+            self._logger.setLevel(logging.INFO)
+            self._logger.addHandler(handler)
+        return self._logger
+
+    def record(self, name: str, elapsed_ms: float, profile: Optional[dict]):
+        if not profile:
+            return
+        lines = []
+        total_db_hits = self._render(profile, 0, lines)
+        header = (f"{datetime.now(timezone.utc).isoformat()} {name} "
+                  f"{elapsed_ms:.1f} ms, {total_db_hits} db hits")
+        self._file_logger().info("\n".join([header, *lines, ""]))
+        self.captured += 1
+
+    def _render(self, plan: dict, depth: int, lines: list) -> int:
+        args = plan.get("args") or {}
+        db_hits = plan.get("dbHits", args.get("DbHits", 0)) or 0
+        rows = plan.get("rows", args.get("Rows", 0)) or 0
+        operator = str(plan.get("operatorType", "?")).split("@")[0]
+        details = args.get("Details", "")
+        lines.append(f"{'  ' * depth}+{operator} rows={rows} dbHits={db_hits}"
+                     + (f"  {details}" if details else ""))
+        for child in plan.get("children") or []:
+            db_hits += self._render(child, depth + 1, lines)
+        return db_hits
@@ -0,0 +1,140 @@
+from utils.scoring import SECTIONS, QUESTION_IDS
+from typing import Dict, Set
+import gzip
+import hashlib
+import json
+
+# Questionnaire definitions by version. Question text and answer options live
+# here only: the served payload, answer validation and scoring (section and
+# question ids, reversed-item notes) are all compiled from the same entry.
+# Never edit a released version - add a new one instead.
+QUESTIONNAIRES = {
+    1: {
+        "section1": {
+            "title": "Mental Health Quality",
+            "description": "Rate your current state (Excellent to Poor)",
+            "questions": [
+                {"id": "q1", "text": "Rate your mental wellbeing", "valence": "positive"},
+                {"id": "q2", "text": "Your mood for the past 2 weeks", "valence": "positive"},
+                {"id": "q3", "text": "Your outlook in life", "valence": "positive"},
+                {"id": "q4", "text": "Intrapersonal relationship", "valence": "positive"},
+                {"id": "q5", "text": "Feelings towards your surroundings", "valence": "positive"},
+                {"id": "q6", "text": "Sleep cycle", "valence": "positive"},
+                {"id": "q7", "text": "Sleep quality", "valence": "positive"},
+                {"id": "q8", "text": "Relationship with family", "valence": "positive"},
+                {"id": "q9", "text": "Relationship with friends", "valence": "positive"},
+                {"id": "q10", "text": "Physical Health", "valence": "positive"}
+            ],
+            "options": [
+                {"value": 1, "label": "Excellent"},
+                {"value": 2, "label": "Good"},
+                {"value": 3, "label": "Fair"},
+                {"value": 4, "label": "Bad"},
+                {"value": 5, "label": "Poor"}
+            ]
+        },
+        "section2": {
+            "title": "University Life",
+            "description": "Answer YES or NO",
+            "questions": [
+                {"id": "q1", "text": "Are you finding it easy to adjust to your new environment?", "valence": "positive"},
+                {"id": "q2", "text": "Are you happy with your current course?", "valence": "positive"},
+                {"id": "q3", "text": "Do you feel productive with your course?", "valence": "positive"},
+                {"id": "q4", "text": "Are you satisfied with your current academic performance?", "valence": "positive"},
+                {"id": "q5", "text": "Are your professors/instructors approachable and understanding?", "valence": "positive"},
+                {"id": "q6", "text": "Is your allowance sufficient for your needs?", "valence": "positive"},
+                {"id": "q7", "text": "Do you feel safe and at ease on campus?", "valence": "positive"},
+                {"id": "q8", "text": "Are you comfortable making new friends at university?", "valence": "positive"},
+                {"id": "q9", "text": "Have you felt sense of personal growth or development since starting university?", "valence": "positive"},
+                {"id": "q10", "text": "Do you feel like you have a good work-life balance?", "valence": "positive"}
+            ],
+            "options": [
+                {"value": 1, "label": "YES"},
+                {"value": 5, "label": "NO"}
+            ]
+        },
+        "section3": {
+            "title": "Self Assessment",
+            "description": "How often do you experience these? (Not at all/Never to Very Much/Always)",
+            "questions": [
+                {"id": "q1", "text": "Are you having a difficulty coping with your stressors?", "valence": "negative"},
+                {"id": "q2", "text": "Do people's perception about you affects you?", "valence": "negative"},
+                {"id": "q3", "text": "Does your medical health or mental wellbeing limits your daily productivity?", "valence": "negative"},
+                {"id": "q4", "text": "Do you have trouble sleeping?", "valence": "negative"},
+                {"id": "q5", "text": "Do you smoke cigarettes/e-cigars?", "valence": "negative"},
+                {"id": "q6", "text": "Do you drink liquors?", "valence": "negative"},
+                {"id": "q7", "text": "Do you get in conflict with your partner or family members?", "valence": "negative"},
+                {"id": "q8", "text": "Do you feel calmness and happiness?", "valence": "positive"},
+                {"id": "q9", "text": "Do you feel sad and depress?", "valence": "negative"},
+                {"id": "q10", "text": "Do you feel angry and aggressive?", "valence": "negative"}
+            ],
+            "options": [
+                {"value": 1, "label": "Not at all/Never"},
+                {"value": 2, "label": "Rarely"},
+                {"value": 3, "label": "Sometimes"},
+                {"value": 4, "label": "Often"},
+                {"value": 5, "label": "Very Much/Always"}
+            ]
+        }
+    }
+}
+
+LATEST_QUESTIONNAIRE_VERSION = max(QUESTIONNAIRES)
+
+class CompiledQuestionnaire:
+    """
+    A questionnaire prepared once at startup: the JSON payload is encoded
+    and gzipped ahead of time and identified by a strong ETag, and the
+    allowed answers per question are indexed for validation.
+    """
+    def __init__(self, version: int, definition: dict, rules: dict):
+        lowest, highest = rules["scale"]
+
+        if tuple(definition) != SECTIONS:
+            raise ValueError(f"Questionnaire {version} must define sections {SECTIONS}")
+
+        payload = {}
+        self.allowed: Dict[str, Dict[str, Set[int]]] = {}
+        for section, spec in definition.items():
+            question_ids = tuple(q["id"] for q in spec["questions"])
+            if question_ids != QUESTION_IDS:
+                raise ValueError(f"Questionnaire {version} {section} must ask {QUESTION_IDS}")
+
+            values = {option["value"] for option in spec["options"]}
+            if not all(lowest <= value <= highest for value in values):
+                raise ValueError(f"Questionnaire {version} {section} options fall outside the scoring scale")
+            self.allowed[section] = {question_id: values for question_id in question_ids}
+
+            # Reversed items are marked from the scoring rules, not typed in by hand
+            reversed_ids = set(rules["reversed"].get(section, []))
+            questions = [
+                {**q, "note": "REVERSED SCORING"} if q["id"] in reversed_ids else q
+                for q in spec["questions"]
+            ]
+            payload[section] = {**spec, "questions": questions}
+
+        self.version = version
+        self.payload = payload
+        self.body = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+        self.gzip_body = gzip.compress(self.body, compresslevel=9, mtime=0)
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etag = f'"q{version}-{digest}"'
+        self.gzip_etag = f'"q{version}-{digest}-gz"'
+
+    def validation_errors(self, answers: Dict[str, Dict[str, int]]) -> list:
+        """
+        Return a list of problems with an answer set (empty if it is valid):
+        every question answered, no unknown questions, only offered values
+        """
+        errors = []
+        for section, allowed in self.allowed.items():
+            given = answers.get(section) or {}
+            for question_id, values in allowed.items():
+                if question_id not in given:
+                    errors.append(f"{section}.{question_id}: missing answer")
+                elif given[question_id] not in values:
+                    errors.append(f"{section}.{question_id}: {given[question_id]} is not one of {sorted(values)}")
+            for question_id in given:
+                if question_id not in allowed:
+                    errors.append(f"{section}.{question_id}: unknown question")
+        return errors
@@ -0,0 +1,50 @@
+from collections import deque
+from typing import Deque, Dict, Hashable, Optional
+import time
+
+class SlidingWindowLimiter:
+    """
+    In-process sliding-window counter: at most `limit` hits per key within
+    `window_seconds`. Each worker keeps its own counts, which is enough to
+    stop a brute-force loop from burning bcrypt time on that worker.
+    """
+    def __init__(self, limit: int, window_seconds: float, max_keys: int = 100_000):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._hits: Dict[Hashable, Deque[float]] = {}
+
+    def _recent(self, key: Hashable, now: float) -> Optional[Deque[float]]:
+        hits = self._hits.get(key)
+        if hits is None:
+            return None
+        while hits and hits[0] <= now - self.window_seconds:
+            hits.popleft()
+        if not hits:
+            del self._hits[key]
+            return None
+        return hits
+
+    def retry_after(self, key: Hashable) -> float:
+        """Seconds until `key` may try again (0 if it is not limited)"""
+        now = time.monotonic()
+        hits = self._recent(key, now)
+        if hits is None or len(hits) < self.limit:
+            return 0.0
+        return hits[-self.limit] + self.window_seconds - now
+
+    def hit(self, key: Hashable):
+        now = time.monotonic()
+        hits = self._recent(key, now)
+        if hits is None:
+            if len(self._hits) >= self.max_keys:
+                self._prune(now)
+            hits = self._hits[key] = deque()
+        hits.append(now)
+
+    def reset(self, key: Hashable):
+        self._hits.pop(key, None)
+
+    def _prune(self, now: float):
+        for key in list(self._hits):
+            self._recent(key, now)
@@ -1,57 +1,125 @@
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+import json
+
+SECTIONS = ("section1", "section2", "section3")
+QUESTION_IDS = tuple(f"q{i}" for i in range(1, 11))
+
+RECOMMENDATIONS = {
+    "Low": (
+        "Your assessment indicates a low stress level. You're managing well! "
+        "Continue maintaining healthy habits and reach out if you need support."
+    ),
+    "Moderate": (
+        "Your assessment indicates a moderate stress level. Consider speaking with a counselor "
+        "to discuss strategies for managing stress and improving your well-being."
+    ),
+    "High": (
+        "Your assessment indicates a high stress level. We strongly recommend booking an appointment "
+        "with a counselor to discuss your concerns and develop a support plan."
+    ),
+}
+
+# Versioned scoring methodologies. Each submission records the version it
+# was scored with, so history can be rescored when the guidance office
+# revises the rules (scripts/rescore.py).
+#   scale:      (lowest, highest) answer value; a reversed item scores lowest + highest - answer
+#   reversed:   per section, questions whose scale runs the other way
+#   thresholds: upper bounds (inclusive) of the overall score for each level,
+#               in order; anything above the last one is the final level
+#   levels:     stress level names, one more than thresholds
+# Never edit a released version - add a new one instead.
+SCORING_RULES = {
+    1: {
+        "description": "Original methodology: section means, section 3 Q8 reversed",
+        "scale": (1, 5),
+        "reversed": {"section3": ["q8"]},
+        "thresholds": [2.33, 3.66],
+        "levels": ["Low", "Moderate", "High"],
+    },
+}
+
+def load_scoring_rules(path: str):
+    """
+    Register extra scoring versions from a JSON file mapping version -> rules
+    (same shape as SCORING_RULES). Released versions cannot be redefined.
+    """
+    with open(path) as f:
+        extra = json.load(f)
+    for version, rules in extra.items():
+        version = int(version)
+        if version in SCORING_RULES and SCORING_RULES[version] != rules:
+            raise ValueError(f"Scoring version {version} is already defined differently")
+        if len(rules["levels"]) != len(rules["thresholds"]) + 1:
+            raise ValueError(f"Scoring version {version}: need one more level than thresholds")
+        if any(level not in RECOMMENDATIONS for level in rules["levels"]):
+            raise ValueError(f"Scoring version {version}: unknown stress level")
+        SCORING_RULES[version] = {**rules, "scale": tuple(rules["scale"])}
+
+def get_scoring_rules(version: int) -> dict:
+    if version not in SCORING_RULES:
+        raise ValueError(f"Unknown scoring version {version}")
+    return SCORING_RULES[version]
+
+def reverse_items(section_answers: Dict[str, int], section: str, rules: dict) -> Dict[str, int]:
+    """
+    Return a copy of one section's answers with its reversed items flipped.
+    Flipping twice gives the original answers back.
+    """
+    lowest, highest = rules["scale"]
+    processed = section_answers.copy()
+    for question in rules["reversed"].get(section, []):
+        if question in processed:
+            processed[question] = lowest + highest - processed[question]
+    return processed
+
+def stress_level_for(overall_score: float, rules: dict) -> str:
+    for threshold, level in zip(rules["thresholds"], rules["levels"]):
+        if overall_score <= threshold:
+            return level
+    return rules["levels"][-1]
 
 def calculate_assessment_score(
     section1_answers: Dict[str, int],
     section2_answers: Dict[str, int],
-    section3_answers: Dict[str, int]
+    section3_answers: Dict[str, int],
+    rules: Optional[dict] = None
 ) -> Tuple[float, float, float, float, str, str]:
     """
     Calculate assessment scores based on the provided scoring methodology.
-    
+
     Section 1 (Mental Health Quality): Positive questions, Excellent(1) → Poor(5)
     Section 2 (University Life): Positive questions, YES(1) → NO(5)
     Section 3 (Self/Negative Symptoms): Negative questions, Not at all(1) → Very Much(5)
                                         EXCEPT Q8 (reversed): Not at all(5) → Very Much(1)
-    
+
+    Answers must already have reversed items flipped (see reverse_items).
+    Stress thresholds come from `rules` (default: scoring version 1).
+
     Returns:
         (section1_score, section2_score, section3_score, overall_score, stress_level, recommendation)
     """
-    
+    if rules is None:
+        rules = SCORING_RULES[1]
+
     # Section 1: Sum all answers, divide by 10
     section1_sum = sum(section1_answers.values())
     section1_score = section1_sum / 10.0
-    
+
     # Section 2: Sum all answers, divide by 10
     section2_sum = sum(section2_answers.values())
     section2_score = section2_sum / 10.0
-    
+
     # Section 3: Sum all answers (Q8 already reversed in input), divide by 10
     section3_sum = sum(section3_answers.values())
     section3_score = section3_sum / 10.0
-    
+
     # Overall Score: Average of three sections
     overall_score = (section1_score + section2_score + section3_score) / 3.0
-    
+
     # Determine Stress Level
-    if overall_score <= 2.33:
-        stress_level = "Low"
-        recommendation = (
-            "Your assessment indicates a low stress level. You're managing well! "
-            "Continue maintaining healthy habits and reach out if you need support."
-        )
-    elif overall_score <= 3.66:
-        stress_level = "Moderate"
-        recommendation = (
-            "Your assessment indicates a moderate stress level. Consider speaking with a counselor "
-            "to discuss strategies for managing stress and improving your well-being."
-        )
-    else:
-        stress_level = "High"
-        recommendation = (
-            "Your assessment indicates a high stress level. We strongly recommend booking an appointment "
-            "with a counselor to discuss your concerns and develop a support plan."
-        )
-    
+    stress_level = stress_level_for(overall_score, rules)
+    recommendation = RECOMMENDATIONS[stress_level]
+
     return (
         round(section1_score, 2),
         round(section2_score, 2),
@@ -1,15 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
+import asyncio
+import hashlib
 import jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from config import get_settings
+from utils.cache import ExpiringLRUCache
+from utils.metrics import metrics
+from services.counselor_directory import counselor_directory
 
 settings = get_settings()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
+# Claims of already-verified tokens, keyed by token digest, kept until exp
+verified_tokens = ExpiringLRUCache(settings.TOKEN_CACHE_SIZE)
+metrics.register_cache("verified_tokens", verified_tokens)
+
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
     return pwd_context.hash(password)
@@ -18,6 +28,40 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     return pwd_context.verify(plain_password, hashed_password)
 
+class PasswordHasher:
+    """
+    Runs bcrypt (~250 ms per call) on a small dedicated thread pool so it
+    never blocks the event loop. At most `max_pending` calls may be running
+    or queued; beyond that callers get 503 instead of piling up.
+    """
+    def __init__(self, workers: int, max_pending: int):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+
+    async def _run(self, fn, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many sign-in requests in progress, please retry shortly",
+                headers={"Retry-After": "1"}
+            )
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Generate JWT token for Counselor/Admin authentication
@@ -69,18 +113,37 @@ async def get_current_counselor(credentials: HTTPAuthorizationCredentials = Depe
     """
     Dependency to extract and validate counselor from JWT token
     Use this in protected endpoints
+
+    A token is fully verified once; after that its claims come from the
+    verified-token cache until it expires. Every request still checks the
+    counselor directory, so tokens of deleted counselors stop working.
     """
     token = credentials.credentials
-    payload = decode_token(token)
+    digest = hashlib.sha256(token.encode()).digest()
     
-    counselor_id = payload.get("sub")
-    if counselor_id is None:
+    current = verified_tokens.get(digest)
+    if current is None:
+        payload = decode_token(token)
+        
+        counselor_id = payload.get("sub")
+        if counselor_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token payload"
+            )
+        
+        current = {
+            "counselor_id": counselor_id,
+            "email": payload.get("email")
+        }
+        if "exp" in payload:
+            verified_tokens.put(digest, current, payload["exp"])
+    
+    if await counselor_directory.get(current["counselor_id"]) is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload"
+            detail="Counselor account no longer exists",
+            headers={"WWW-Authenticate": "Bearer"},
         )
     
-    return {
-        "counselor_id": counselor_id,
-        "email": payload.get("email")
-    }
+    return dict(current)
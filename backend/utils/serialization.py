@@ -0,0 +1,20 @@
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from typing import Any, Type
+
+def project(row: dict, model: Type[BaseModel]) -> dict:
+    """
+    Keep only the fields of `model` from a driver row (missing ones become
+    None). No validation: the query is what guarantees the shape.
+    """
+    return {name: row.get(name) for name in model.model_fields}
+
+def json_response(content: Any, status_code: int = 200) -> ORJSONResponse:
+    """
+    Encode plain data (dicts, lists, strings, numbers) straight to bytes with
+    orjson. Returning a Response skips FastAPI's response_model validation
+    and jsonable_encoder pass, so `content` must already be in the shape the
+    route documents - build it from driver records whose dates and times
+    the query has turned into strings.
+    """
+    return ORJSONResponse(content, status_code=status_code)
@@ -0,0 +1,16 @@
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict
+import orjson
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+async def _encode_lines(rows: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    async for row in rows:
+        yield orjson.dumps(row, default=str) + b"\n"
+
+def ndjson_response(rows: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """
+    Stream rows as newline-delimited JSON, one object per line, written as
+    they are produced so memory does not grow with the result size
+    """
+    return StreamingResponse(_encode_lines(rows), media_type=NDJSON_MEDIA_TYPE)
@@ -30,7 +30,7 @@ class _AnalyticsScreenState extends ConsumerState<AnalyticsScreen> {
       final apiService = ref.read(apiServiceProvider);
       
       final analytics = await apiService.getAnalytics(period: _selectedPeriod);
-      final assessments = await apiService.getAdminAssessments(skip: 0, limit: 100);
+      final assessments = await apiService.getAdminAssessments(limit: 100);
 
       setState(() {
         _analytics = analytics;
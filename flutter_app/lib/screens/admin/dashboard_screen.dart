@@ -16,28 +16,57 @@ class DashboardScreen extends ConsumerStatefulWidget {
 
 class _DashboardScreenState extends ConsumerState<DashboardScreen> {
   List<dynamic> _appointments = [];
+  String? _nextCursor;
   List<dynamic> _assessments = [];
   bool _isLoading = true;
+  bool _isLoadingMore = false;
   String _selectedFilter = 'Pending';
+  DateTimeRange? _dateRange;
+  final ScrollController _scrollController = ScrollController();
 
   @override
   void initState() {
     super.initState();
+    _scrollController.addListener(_onScroll);
     _loadData();
   }
 
+  @override
+  void dispose() {
+    _scrollController.dispose();
+    super.dispose();
+  }
+
+  void _onScroll() {
+    if (_scrollController.position.pixels >= _scrollController.position.maxScrollExtent - 200) {
+      _loadMoreAppointments();
+    }
+  }
+
+  Future<Map<String, dynamic>> _fetchAppointments({String? cursor}) {
+    final range = _dateRange;
+    return ref.read(apiServiceProvider).getAdminAppointmentsPage(
+      status: _selectedFilter,
+      startDate: range == null ? null : DateFormat('yyyy-MM-dd').format(range.start),
+      endDate: range == null ? null : DateFormat('yyyy-MM-dd').format(range.end),
+      cursor: cursor,
+    );
+  }
+
   Future<void> _loadData() async {
-    setState(() => _isLoading = true);
+    setState(() {
+      _isLoading = true;
+      _nextCursor = null;
+    });
     try {
       final apiService = ref.read(apiServiceProvider);
       
-      final appointments = await apiService.getAdminAppointments(
-        status: _selectedFilter,
-      );
+      final appointments = await _fetchAppointments();
       final assessments = await apiService.getAdminAssessments(limit: 10);
 
       setState(() {
-        _appointments = appointments;
+        _appointments = appointments['items'];
+        _nextCursor = appointments['next_cursor'];
         _assessments = assessments;
         _isLoading = false;
       });
@@ -49,6 +78,41 @@ class _DashboardScreenState extends ConsumerState<DashboardScreen> {
     }
   }
 
+  /// Appends the next page of appointments, if any; a reload in the meantime discards it.
+  Future<void> _loadMoreAppointments() async {
+    final cursor = _nextCursor;
+    if (cursor == null || _isLoading || _isLoadingMore) return;
+    setState(() => _isLoadingMore = true);
+    try {
+      final page = await _fetchAppointments(cursor: cursor);
+      if (!mounted || cursor != _nextCursor) return;
+      setState(() {
+        _appointments = [..._appointments, ...page['items']];
+        _nextCursor = page['next_cursor'];
+      });
+    } catch (e) {
+      if (mounted) {
+        ErrorDialog.showNetworkError(context, onRetry: _loadMoreAppointments);
+      }
+    } finally {
+      if (mounted) setState(() => _isLoadingMore = false);
+    }
+  }
+
+  Future<void> _pickDateRange() async {
+    final now = DateTime.now();
+    final picked = await showDateRangePicker(
+      context: context,
+      firstDate: DateTime(now.year - 2),
+      lastDate: DateTime(now.year + 1, 12, 31),
+      initialDateRange: _dateRange,
+    );
+    if (picked != null) {
+      setState(() => _dateRange = picked);
+      _loadData();
+    }
+  }
+
   @override
   Widget build(BuildContext context) {
     final authState = ref.watch(authProvider);
@@ -100,6 +164,7 @@ class _DashboardScreenState extends ConsumerState<DashboardScreen> {
           : RefreshIndicator(
               onRefresh: _loadData,
               child: SingleChildScrollView(
+                controller: _scrollController,
                 padding: const EdgeInsets.all(16),
                 child: Column(
                   crossAxisAlignment: CrossAxisAlignment.start,
@@ -158,21 +223,40 @@ class _DashboardScreenState extends ConsumerState<DashboardScreen> {
                             fontWeight: FontWeight.bold,
                           ),
                         ),
-                        DropdownButton<String>(
-                          value: _selectedFilter,
-                          items: ['Pending', 'Confirmed', 'Rejected', 'Completed']
-                              .map((status) => DropdownMenuItem(
-                                    value: status,
-                                    child: Text(status),
-                                  ))
-                              .toList(),
-                          onChanged: (value) {
-                            setState(() => _selectedFilter = value!);
-                            _loadData();
-                          },
+                        Row(
+                          children: [
+                            IconButton(
+                              icon: const Icon(Icons.date_range),
+                              tooltip: 'Filter by date',
+                              onPressed: _pickDateRange,
+                            ),
+                            DropdownButton<String>(
+                              value: _selectedFilter,
+                              items: ['Pending', 'Confirmed', 'Rejected', 'Completed']
+                                  .map((status) => DropdownMenuItem(
+                                        value: status,
+                                        child: Text(status),
+                                      ))
+                                  .toList(),
+                              onChanged: (value) {
+                                setState(() => _selectedFilter = value!);
+                                _loadData();
+                              },
+                            ),
+                          ],
                         ),
                       ],
                     ),
+                    if (_dateRange != null)
+                      InputChip(
+                        label: Text(
+                          '${DateFormat.yMMMd().format(_dateRange!.start)} - ${DateFormat.yMMMd().format(_dateRange!.end)}',
+                        ),
+                        onDeleted: () {
+                          setState(() => _dateRange = null);
+                          _loadData();
+                        },
+                      ),
                     const SizedBox(height: 12),
                     
                     if (_appointments.isEmpty)
@@ -186,6 +270,15 @@ class _DashboardScreenState extends ConsumerState<DashboardScreen> {
                       )
                     else
                       ..._appointments.map((apt) => _buildAppointmentCard(apt)),
+                    if (_nextCursor != null)
+                      Center(
+                        child: _isLoadingMore
+                            ? const CircularProgressIndicator()
+                            : TextButton(
+                                onPressed: _loadMoreAppointments,
+                                child: const Text('Load more appointments'),
+                              ),
+                      ),
                     
                     const SizedBox(height: 24),
                     
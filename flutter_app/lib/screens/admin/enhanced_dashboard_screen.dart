@@ -30,11 +30,11 @@ class _EnhancedDashboardScreenState extends ConsumerState<EnhancedDashboardScree
       final apiService = ref.read(apiServiceProvider);
       
       final stats = await apiService.getDashboardStats();
-      final appointments = await apiService.getAdminAppointments(status: null);
+      final appointments = await apiService.getAdminAppointments(limit: 5);
 
       setState(() {
         _stats = stats;
-        _recentAppointments = appointments.take(5).toList();
+        _recentAppointments = appointments;
         _isLoading = false;
       });
     } catch (e) {
@@ -14,7 +14,10 @@ class ScheduleScreen extends ConsumerStatefulWidget {
 
 class _ScheduleScreenState extends ConsumerState<ScheduleScreen> {
   List<dynamic> _slots = [];
+  String? _nextCursor;
   bool _isLoading = true;
+  bool _isLoadingMore = false;
+  final ScrollController _scrollController = ScrollController();
   DateTime _selectedDate = DateTime.now();
   DateTime _startDate = DateTime.now();
   DateTime _endDate = DateTime.now().add(const Duration(days: 7));
@@ -22,20 +25,41 @@ class _ScheduleScreenState extends ConsumerState<ScheduleScreen> {
   @override
   void initState() {
     super.initState();
+    _scrollController.addListener(_onScroll);
     _loadSlots();
   }
 
+  @override
+  void dispose() {
+    _scrollController.dispose();
+    super.dispose();
+  }
+
+  void _onScroll() {
+    if (_scrollController.position.pixels >= _scrollController.position.maxScrollExtent - 200) {
+      _loadMoreSlots();
+    }
+  }
+
+  Future<Map<String, dynamic>> _fetchSlots({String? cursor}) {
+    return ref.read(apiServiceProvider).getTimeSlotsPage(
+      startDate: DateFormat('yyyy-MM-dd').format(_startDate),
+      endDate: DateFormat('yyyy-MM-dd').format(_endDate),
+      cursor: cursor,
+    );
+  }
+
   Future<void> _loadSlots() async {
-    setState(() => _isLoading = true);
+    setState(() {
+      _isLoading = true;
+      _nextCursor = null;
+    });
     try {
-      final apiService = ref.read(apiServiceProvider);
-      final slots = await apiService.getTimeSlots(
-        startDate: DateFormat('yyyy-MM-dd').format(_startDate),
-        endDate: DateFormat('yyyy-MM-dd').format(_endDate),
-      );
+      final page = await _fetchSlots();
       
       setState(() {
-        _slots = slots;
+        _slots = page['items'];
+        _nextCursor = page['next_cursor'];
         _isLoading = false;
       });
     } catch (e) {
@@ -46,6 +70,27 @@ class _ScheduleScreenState extends ConsumerState<ScheduleScreen> {
     }
   }
 
+  /// Appends the next page, if any; a reload in the meantime discards it.
+  Future<void> _loadMoreSlots() async {
+    final cursor = _nextCursor;
+    if (cursor == null || _isLoading || _isLoadingMore) return;
+    setState(() => _isLoadingMore = true);
+    try {
+      final page = await _fetchSlots(cursor: cursor);
+      if (!mounted || cursor != _nextCursor) return;
+      setState(() {
+        _slots = [..._slots, ...page['items']];
+        _nextCursor = page['next_cursor'];
+      });
+    } catch (e) {
+      if (mounted) {
+        ErrorDialog.showNetworkError(context, onRetry: _loadMoreSlots);
+      }
+    } finally {
+      if (mounted) setState(() => _isLoadingMore = false);
+    }
+  }
+
   @override
   Widget build(BuildContext context) {
     return Scaffold(
@@ -53,6 +98,7 @@ class _ScheduleScreenState extends ConsumerState<ScheduleScreen> {
       body: _isLoading
           ? const Center(child: CircularProgressIndicator())
           : SingleChildScrollView(
+              controller: _scrollController,
               padding: const EdgeInsets.all(24),
               child: Column(
                 crossAxisAlignment: CrossAxisAlignment.start,
@@ -62,6 +108,7 @@ class _ScheduleScreenState extends ConsumerState<ScheduleScreen> {
                   _buildWeekView(),
                   const SizedBox(height: 24),
                   _buildSlotsList(),
+                  if (_nextCursor != null) _buildLoadMore(),
                 ],
               ),
             ),
@@ -111,6 +158,15 @@ class _ScheduleScreenState extends ConsumerState<ScheduleScreen> {
     );
   }
 
+  /// Slots arrive in schedule order, so only days from the last loaded
+  /// slot's date on can still have slots on later pages.
+  bool _mayHaveMore(DateTime day) {
+    if (_nextCursor == null) return false;
+    if (_slots.isEmpty) return true;
+    final last = DateTime.parse(_slots.last['date']);
+    return !DateUtils.dateOnly(day).isBefore(DateUtils.dateOnly(last));
+  }
+
   Widget _buildWeekView() {
     final days = <DateTime>[];
     for (int i = 0; i < 7; i++) {
@@ -138,7 +194,7 @@ class _ScheduleScreenState extends ConsumerState<ScheduleScreen> {
                 const SizedBox(height: 8),
                 Text(DateFormat('d').format(day), style: TextStyle(fontSize: 20, fontWeight: isSelected ? FontWeight.bold : FontWeight.normal)),
                 const SizedBox(height: 4),
-                Text('$slotsForDay slots', style: const TextStyle(fontSize: 12, color: AppTheme.textSecondary)),
+                Text('$slotsForDay${_mayHaveMore(day) ? '+' : ''} slots', style: const TextStyle(fontSize: 12, color: AppTheme.textSecondary)),
               ],
             ),
           ),
@@ -179,6 +235,20 @@ class _ScheduleScreenState extends ConsumerState<ScheduleScreen> {
     );
   }
 
+  Widget _buildLoadMore() {
+    return Padding(
+      padding: const EdgeInsets.only(top: 16.0),
+      child: Center(
+        child: _isLoadingMore
+            ? const CircularProgressIndicator()
+            : TextButton(
+                onPressed: _loadMoreSlots,
+                child: const Text('Load more'),
+              ),
+      ),
+    );
+  }
+
   Widget _buildSlotCard(Map<String, dynamic> slot) {
     final hasAppointment = slot['appointment_id'] != null;
     final isAvailable = slot['is_available'] == true;
@@ -28,6 +28,19 @@ class ApiService {
     return headers;
   }
 
+  /// One page ({items, next_cursor}) of a paginated admin listing.
+  Future<Map<String, dynamic>> _getPage(Uri uri, Map<String, String> query) async {
+    final response = await http
+        .get(uri.replace(queryParameters: query), headers: _getHeaders(requiresAuth: true))
+        .timeout(ApiConfig.timeout);
+
+    if (response.statusCode != 200) {
+      throw Exception('Failed to load ${uri.path}: ${response.statusCode}');
+    }
+
+    return json.decode(response.body);
+  }
+
   // Assessment Endpoints
   Future<AssessmentQuestionnaire> getQuestions() async {
     try {
@@ -162,11 +175,17 @@ class ApiService {
     }
   }
 
-  Future<List<dynamic>> getAdminAssessments({int skip = 0, int limit = 50}) async {
+  Future<List<dynamic>> getAdminAssessments({String? cursor, int limit = 50}) async {
+    final page = await getAdminAssessmentsPage(cursor: cursor, limit: limit);
+    return page['items'];
+  }
+
+  /// One page of assessments; pass `next_cursor` back as [cursor] for the next page.
+  Future<Map<String, dynamic>> getAdminAssessmentsPage({String? cursor, int limit = 50}) async {
     try {
       final uri = Uri.parse('$baseUrl${ApiConfig.adminAssessments}')
           .replace(queryParameters: {
-        'skip': skip.toString(),
+        if (cursor != null) 'cursor': cursor,
         'limit': limit.toString(),
       });
 
@@ -230,22 +249,38 @@ class ApiService {
     }
   }
 
-  Future<List<dynamic>> getAdminAppointments({String? status}) async {
-    try {
-      var uri = Uri.parse('$baseUrl${ApiConfig.adminAppointments}');
-      if (status != null) {
-        uri = uri.replace(queryParameters: {'status': status});
-      }
-
-      final response = await http
-          .get(uri, headers: _getHeaders(requiresAuth: true))
-          .timeout(ApiConfig.timeout);
+  Future<List<dynamic>> getAdminAppointments({
+    String? status,
+    String? startDate,
+    String? endDate,
+    int limit = 50,
+  }) async {
+    final page = await getAdminAppointmentsPage(
+      status: status,
+      startDate: startDate,
+      endDate: endDate,
+      limit: limit,
+    );
+    return page['items'];
+  }
 
-      if (response.statusCode == 200) {
-        return json.decode(response.body);
-      } else {
-        throw Exception('Failed to load appointments: ${response.statusCode}');
-      }
+  /// One page of appointments, latest schedule first; pass `next_cursor` back as [cursor] for the next page.
+  Future<Map<String, dynamic>> getAdminAppointmentsPage({
+    String? status,
+    String? startDate,
+    String? endDate,
+    String? cursor,
+    int limit = 50,
+  }) async {
+    try {
+      final uri = Uri.parse('$baseUrl${ApiConfig.adminAppointments}');
+      return await _getPage(uri, {
+        if (status != null) 'status': status,
+        if (startDate != null) 'start_date': startDate,
+        if (endDate != null) 'end_date': endDate,
+        if (cursor != null) 'cursor': cursor,
+        'limit': limit.toString(),
+      });
     } catch (e) {
       throw Exception('Network error: $e');
     }
@@ -331,25 +366,23 @@ class ApiService {
     }
   }
 
-  Future<List<dynamic>> getTimeSlots({String? startDate, String? endDate}) async {
+  /// One page of time slots in schedule order; pass `next_cursor` back as [cursor] for the next page.
+  Future<Map<String, dynamic>> getTimeSlotsPage({
+    String? startDate,
+    String? endDate,
+    bool? available,
+    String? cursor,
+    int limit = 100,
+  }) async {
     try {
-      var uri = Uri.parse('$baseUrl/admin/slots');
-      if (startDate != null && endDate != null) {
-        uri = uri.replace(queryParameters: {
-          'start_date': startDate,
-          'end_date': endDate,
-        });
-      }
-
-      final response = await http
-          .get(uri, headers: _getHeaders(requiresAuth: true))
-          .timeout(ApiConfig.timeout);
-
-      if (response.statusCode == 200) {
-        return json.decode(response.body);
-      } else {
-        throw Exception('Failed to load time slots: ${response.statusCode}');
-      }
+      final uri = Uri.parse('$baseUrl/admin/slots');
+      return await _getPage(uri, {
+        if (startDate != null) 'start_date': startDate,
+        if (endDate != null) 'end_date': endDate,
+        if (available != null) 'available': available.toString(),
+        if (cursor != null) 'cursor': cursor,
+        'limit': limit.toString(),
+      });
     } catch (e) {
       throw Exception('Network error: $e');
     }